@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.api.api_v1.endpoints import posts, users, interactions, target_contacts, scheduler
+from app.api.api_v1.endpoints import posts, users, interactions, target_contacts, scheduler, metrics, stats
 
 api_router = APIRouter()
 
@@ -37,4 +37,18 @@ api_router.include_router(
     scheduler.router,
     prefix="/scheduler",
     tags=["scheduler"]
-) 
\ No newline at end of file
+)
+
+# Metrics
+api_router.include_router(
+    metrics.router,
+    prefix="/metrics",
+    tags=["metrics"]
+)
+
+# Dashboard-Statistiken
+api_router.include_router(
+    stats.router,
+    prefix="/stats",
+    tags=["stats"]
+)
@@ -0,0 +1,37 @@
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session
+
+from app.api.projection import columns, fields_param, rows_to_dicts
+from app.db.session import get_db
+from app.models.interaction import Interaction, InteractionStatus, InteractionType
+from app.schemas.interaction import Interaction as InteractionSchema
+
+router = APIRouter()
+
+MAX_PAGE_SIZE = 100
+
+@router.get("/", response_model=List[InteractionSchema], response_class=ORJSONResponse)
+def get_interactions(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    type: Optional[InteractionType] = None,
+    interaction_status: Optional[InteractionStatus] = Query(None, alias="status"),
+    fields: Tuple[str, ...] = Depends(fields_param(InteractionSchema)),
+    db: Session = Depends(get_db)
+):
+    """Ruft die neuesten Interaktionen ab, optional gefiltert nach Typ und Status und auf ``fields`` reduziert."""
+    try:
+        query = db.query(*columns(Interaction, fields))
+        if type:
+            query = query.filter(Interaction.type == type)
+        if interaction_status:
+            query = query.filter(Interaction.status == interaction_status)
+        rows = query.order_by(Interaction.created_at.desc(), Interaction.id.desc()).offset(skip).limit(limit).all()
+        return ORJSONResponse(rows_to_dicts(rows, fields))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
@@ -0,0 +1,11 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.metrics import CONTENT_TYPE, registry
+
+router = APIRouter()
+
+@router.get("", response_class=PlainTextResponse)
+def get_metrics():
+    """Liefert alle Metriken im Prometheus-Textformat."""
+    return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
@@ -1,21 +1,34 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from app.api.deps import get_ai_service, get_linkedin_service
+from app.api.projection import columns, fields_param, rows_to_dicts
+from app.core.clock import as_utc, to_utc, utcnow
 from app.db.session import get_db
 from app.models.post import Post, PostStatus
-from app.schemas.post import PostCreate, PostUpdate, PostResponse
-from app.services.ai_service import AIService
-from app.services.linkedin_service import LinkedInService
+from app.schemas.post import (
+    PostBulkSchedule, PostBulkScheduleResult, PostCreate, PostUpdate, PostResponse, parse_hashtags
+)
+from app.services import publishing
 
 router = APIRouter()
-ai_service = AIService()
-linkedin_service = LinkedInService()
+
+MAX_PAGE_SIZE = 100
+
+# Nur aus diesen Zuständen darf ein Post (erneut) dem Dispatcher übergeben werden;
+# PUBLISHED/PUBLISHING würden sonst ein zweites Mal veröffentlicht
+SCHEDULABLE_STATUSES = (PostStatus.DRAFT, PostStatus.FAILED, PostStatus.SCHEDULED)
 
 @router.post("/", response_model=PostResponse)
 async def create_post(
     post: PostCreate,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    # Services per Dependency: Import und Browserstart erst beim ersten Request
+    ai_service=Depends(get_ai_service),
+    linkedin_service=Depends(get_linkedin_service)
 ):
     """Erstellt einen neuen LinkedIn-Post."""
     try:
@@ -33,8 +46,9 @@ async def create_post(
             content=content["content"],
             hashtags=" ".join(content["hashtags"]),
             status=PostStatus.DRAFT,
+            user_id=post.user_id,
             ai_generated=True,
-            ai_prompt=f"Topic: {post.topic}"
+            ai_prompt=f"{content['prompt_ref']} | Topic: {post.topic}"
         )
         
         # Als Entwurf in LinkedIn speichern
@@ -58,20 +72,50 @@ async def create_post(
             detail=str(e)
         )
 
-@router.get("/", response_model=List[PostResponse])
-async def get_posts(
-    skip: int = 0,
-    limit: int = 100,
-    status: Optional[PostStatus] = None,
-    db: AsyncSession = Depends(get_db)
+@router.post("/bulk", response_model=PostBulkScheduleResult, status_code=status.HTTP_201_CREATED)
+def schedule_posts(
+    payload: PostBulkSchedule,
+    db: Session = Depends(get_db)
 ):
-    """Ruft alle Posts ab, optional gefiltert nach Status."""
+    """Plant viele Posts auf einmal: eine Validierung, eine Transaktion, eine Scheduler-Meldung."""
+    errors = publishing.validate_schedule(payload.posts)
+    if errors:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=errors
+        )
+    if not payload.posts:
+        return PostBulkScheduleResult(created=0, ids=[])
+
     try:
-        query = db.query(Post)
-        if status:
-            query = query.filter(Post.status == status)
-        posts = await query.offset(skip).limit(limit).all()
-        return posts
+        scheduled = publishing.create_scheduled_posts(db, payload.user_id, payload.posts)
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+    return PostBulkScheduleResult(
+        created=len(scheduled),
+        ids=[post_id for post_id, _ in scheduled],
+        first_due=min(due for _, due in scheduled)
+    )
+
+@router.get("/", response_model=List[PostResponse], response_class=ORJSONResponse)
+def get_posts(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    post_status: Optional[PostStatus] = Query(None, alias="status"),
+    fields: Tuple[str, ...] = Depends(fields_param(PostResponse)),
+    db: Session = Depends(get_db)
+):
+    """Ruft die neuesten Posts ab, optional gefiltert nach Status und auf ``fields`` reduziert."""
+    try:
+        query = db.query(*columns(Post, fields))
+        if post_status:
+            query = query.filter(Post.status == post_status)
+        rows = query.order_by(Post.created_at.desc(), Post.id.desc()).offset(skip).limit(limit).all()
+        return ORJSONResponse(rows_to_dicts(rows, fields, {"hashtags": parse_hashtags}))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -99,33 +143,61 @@ async def get_post(
         )
 
 @router.put("/{post_id}", response_model=PostResponse)
-async def update_post(
+def update_post(
     post_id: int,
     post_update: PostUpdate,
-    db: AsyncSession = Depends(get_db)
+    db: Session = Depends(get_db)
 ):
-    """Aktualisiert einen Post."""
+    """Aktualisiert einen Post; ``published``/``scheduled`` übergibt ihn dem Dispatcher."""
     try:
-        db_post = await db.query(Post).filter(Post.id == post_id).first()
+        schedule = post_update.status in (PostStatus.PUBLISHED, PostStatus.SCHEDULED)
+        query = db.query(Post).filter(Post.id == post_id)
+        if schedule:
+            # Zeile sperren, damit der Dispatcher den Post nicht parallel beansprucht
+            query = query.with_for_update()
+        db_post = query.first()
         if not db_post:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Post nicht gefunden"
             )
+        if schedule and db_post.status not in SCHEDULABLE_STATUSES:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Post mit Status {db_post.status.value} kann nicht veröffentlicht oder geplant werden"
+            )
         
         # Post aktualisieren
-        for field, value in post_update.dict(exclude_unset=True).items():
+        values = post_update.dict(exclude_unset=True)
+        if "hashtags" in values:
+            values["hashtags"] = ",".join(values["hashtags"] or [])
+        for field, value in values.items():
             setattr(db_post, field, value)
+        if schedule and db_post.user_id is None:
+            # Der Dispatcher veröffentlicht nur über den Browser-Kontext eines Accounts
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Post ohne Account (user_id) kann nicht veröffentlicht oder geplant werden"
+            )
         
-        # Wenn der Post veröffentlicht werden soll
-        if post_update.status == PostStatus.PUBLISHED:
-            # TODO: Implementiere LinkedIn-Publishing
-            pass
-        
-        await db.commit()
-        await db.refresh(db_post)
+        # Veröffentlichen übernimmt der Dispatcher: sofort bzw. zum geplanten Termin
+        if schedule:
+            db_post.status = PostStatus.SCHEDULED
+            if post_update.status == PostStatus.PUBLISHED or db_post.scheduled_for is None:
+                db_post.scheduled_for = utcnow()
+            elif "scheduled_for" in values:
+                db_post.scheduled_for = to_utc(db_post.scheduled_for)
+            else:
+                db_post.scheduled_for = as_utc(db_post.scheduled_for)
+            db.flush()
+            publishing.register_scheduled_posts(db, [db_post.scheduled_for])
+        else:
+            db.commit()
+        db.refresh(db_post)
         return db_post
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -0,0 +1,94 @@
+from typing import Optional
+import secrets
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import FileResponse
+
+from app.core import profiler
+from app.core.config import settings
+
+router = APIRouter()
+
+PROFILE_ACTIONS = ("like", "comment", "connection", "message", "share")
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """Schützt die Admin-Endpoints; ohne konfiguriertes PROFILER_ADMIN_TOKEN sind sie nicht erreichbar."""
+    if not settings.PROFILER_ADMIN_TOKEN:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Not Found"
+        )
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, settings.PROFILER_ADMIN_TOKEN):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Ungültiges Admin-Token"
+        )
+
+
+def check_interval(interval_ms: float):
+    """Zu kleine Intervalle ließen den Sampler-Thread im Dauerlauf rechnen."""
+    if interval_ms < settings.PROFILER_MIN_INTERVAL_MS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"interval_ms muss mindestens {settings.PROFILER_MIN_INTERVAL_MS} sein"
+        )
+
+
+@router.get("/profiler", dependencies=[Depends(require_admin)])
+def get_profiler_status():
+    """Status des Profilers und vorgemerkter Einzeljobs."""
+    return profiler.status()
+
+
+@router.post("/profiler/start", dependencies=[Depends(require_admin)])
+def start_profiler(duration: float = 30, interval_ms: float = 5):
+    """Startet den Sampling-Profiler für höchstens ``duration`` Sekunden (max. 300)."""
+    if duration <= 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="duration muss positiv sein"
+        )
+    check_interval(interval_ms)
+    try:
+        active = profiler.start(duration=duration, interval=interval_ms / 1000)
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    return active.status()
+
+
+@router.post("/profiler/stop", dependencies=[Depends(require_admin)])
+def stop_profiler():
+    """Stoppt den Profiler und schreibt die Collapsed-Stack-Datei."""
+    active = profiler.stop()
+    if active is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Kein Profiler gestartet"
+        )
+    return active.status()
+
+
+@router.post("/profiler/job/{action}", dependencies=[Depends(require_admin)])
+def profile_next_job(action: str, interval_ms: float = 1):
+    """Profiliert den nächsten Lauf von ``perform_<action>``."""
+    if action not in PROFILE_ACTIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unbekannte Aktion: {action}"
+        )
+    check_interval(interval_ms)
+    profiler.arm_job(action, interval=interval_ms / 1000)
+    return profiler.status()
+
+
+@router.get("/profiler/result", dependencies=[Depends(require_admin)])
+def download_profile(job: bool = False):
+    """Lädt die zuletzt geschriebene Collapsed-Stack-Datei herunter (für flamegraph.pl/speedscope)."""
+    path = profiler.latest_output(job=job)
+    if path is None or not path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Noch kein Profil vorhanden"
+        )
+    return FileResponse(path, media_type="text/plain", filename=path.name)
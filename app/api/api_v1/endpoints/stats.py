@@ -0,0 +1,37 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from sqlalchemy.orm import Session
+
+from app.core.clock import utcnow
+from app.db.session import get_db
+from app.services import stats
+
+router = APIRouter()
+
+@router.get("/summary")
+def get_summary(
+    response: Response,
+    user_id: Optional[int] = None,
+    days: int = Query(stats.DEFAULT_DAYS, ge=1, le=365),
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    """Zähler für das Dashboard; unverändert seit dem letzten Abruf -> 304 ohne Body."""
+    try:
+        # Das Tagesfenster hängt vom Datum ab: nach Mitternacht ohne Schreibzugriff trotzdem neu
+        etag = (
+            f'W/"{stats.revision(db, user_id)}-{user_id if user_id is not None else "all"}'
+            f'-{days}-{utcnow().date().isoformat()}"'
+        )
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        response.headers.update(headers)
+        return stats.summary(db, user_id=user_id, days=days)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
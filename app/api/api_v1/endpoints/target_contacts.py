@@ -0,0 +1,70 @@
+from typing import Optional
+import io
+
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal, get_db
+from app.services import contact_import
+
+router = APIRouter()
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson"
+}
+
+@router.post("/import")
+def import_target_contacts(
+    file: UploadFile = File(...),
+    format: Optional[str] = None,
+    user_id: Optional[int] = None,
+    db: Session = Depends(get_db)
+):
+    """Importiert Zielkontakte aus einer CSV- oder JSONL-Datei."""
+    try:
+        fmt = contact_import.detect_format(file.filename, format)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    try:
+        # Upload wird zeilenweise gelesen, nicht komplett in den Speicher geladen
+        stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+        return contact_import.import_contacts(db, stream, fmt, user_id=user_id)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+@router.get("/export")
+def export_target_contacts(
+    format: str = "csv",
+    user_id: Optional[int] = None
+):
+    """Exportiert Zielkontakte als CSV- oder JSONL-Stream."""
+    try:
+        fmt = contact_import.detect_format(None, format)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    def stream():
+        # Eigene Session, da der Stream erst nach dem Endpoint-Return gelesen wird
+        db = SessionLocal()
+        try:
+            yield from contact_import.iter_export(db, fmt, user_id=user_id)
+        finally:
+            db.close()
+
+    return StreamingResponse(
+        stream(),
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f"attachment; filename=target_contacts.{fmt}"}
+    )
@@ -0,0 +1,47 @@
+"""Dependencies für die Endpoints: Services als Lazy-Singletons.
+
+Die Service-Module (und damit openai/playwright) werden erst beim ersten Request
+importiert, der den Service braucht – nicht beim Import der Router.
+"""
+from typing import TYPE_CHECKING, Optional
+import asyncio
+
+if TYPE_CHECKING:
+    from app.services.ai_service import AIService
+    from app.services.linkedin_service import LinkedInService
+
+_ai_service: Optional["AIService"] = None
+_linkedin_service: Optional["LinkedInService"] = None
+_linkedin_lock: Optional[asyncio.Lock] = None
+
+
+def get_ai_service() -> "AIService":
+    global _ai_service
+    if _ai_service is None:
+        from app.services.ai_service import AIService
+        _ai_service = AIService()
+    return _ai_service
+
+
+async def get_linkedin_service() -> "LinkedInService":
+    """Browser starten und einloggen, sobald der erste Request ihn braucht."""
+    global _linkedin_service, _linkedin_lock
+    if _linkedin_service is not None and _linkedin_service.is_logged_in:
+        return _linkedin_service
+    if _linkedin_lock is None:
+        _linkedin_lock = asyncio.Lock()
+    async with _linkedin_lock:
+        if _linkedin_service is None:
+            from app.services.linkedin_service import LinkedInService
+            _linkedin_service = LinkedInService()
+        if not _linkedin_service.is_logged_in:
+            await _linkedin_service.initialize()
+    return _linkedin_service
+
+
+async def close_services():
+    """Beim Herunterfahren der App aufrufen."""
+    global _linkedin_service
+    if _linkedin_service is not None:
+        await _linkedin_service.close()
+        _linkedin_service = None
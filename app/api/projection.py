@@ -0,0 +1,46 @@
+"""Feldauswahl für List-Endpoints: ``?fields=id,title,status``.
+
+Geladen werden nur die angefragten Spalten; die Zeilen gehen als Dicts direkt an
+``ORJSONResponse``, ohne Umweg über Pydantic-Modelle und den Standard-Encoder.
+"""
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import HTTPException, Query, status
+
+
+def fields_param(schema) -> Callable[..., Tuple[str, ...]]:
+    """Dependency, die ``fields`` gegen die Felder des Antwort-Schemas prüft."""
+    allowed = tuple(schema.__fields__)
+
+    def dependency(
+        fields: Optional[str] = Query(None, description=f"Kommagetrennt, erlaubt: {', '.join(allowed)}")
+    ) -> Tuple[str, ...]:
+        if not fields:
+            return allowed
+        requested = tuple(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+        unknown = [name for name in requested if name not in allowed]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unbekannte Felder: {', '.join(unknown)}"
+            )
+        return requested or allowed
+
+    return dependency
+
+
+def columns(model, fields: Iterable[str]) -> List:
+    return [getattr(model, name) for name in fields]
+
+
+def rows_to_dicts(
+    rows: Iterable,
+    fields: Tuple[str, ...],
+    converters: Optional[Dict[str, Callable[[Any], Any]]] = None
+) -> List[Dict[str, Any]]:
+    """Ergebniszeilen einer Spaltenabfrage als Dicts; ``converters`` pro Feld (z. B. Hashtags)."""
+    active = [(index, name, (converters or {}).get(name)) for index, name in enumerate(fields)]
+    return [
+        {name: convert(row[index]) if convert else row[index] for index, name, convert in active}
+        for row in rows
+    ]
@@ -0,0 +1,74 @@
+"""Kommandozeilenwerkzeug für den Bulk-Import und -Export von Zielkontakten.
+
+Beispiele:
+    python -m app.cli.contacts import kontakte.csv --user-id 1
+    python -m app.cli.contacts export --format jsonl -o kontakte.jsonl
+"""
+import argparse
+import logging
+import sys
+
+from app.db.session import SessionLocal
+from app.services import contact_import
+
+
+def run_import(args) -> int:
+    """Importiert eine CSV/JSONL-Datei in die Datenbank."""
+    fmt = contact_import.detect_format(args.file, args.format)
+    db = SessionLocal()
+    try:
+        with open(args.file, encoding="utf-8-sig", newline="") as stream:
+            result = contact_import.import_contacts(
+                db,
+                stream,
+                fmt,
+                user_id=args.user_id,
+                chunk_size=args.chunk_size
+            )
+    finally:
+        db.close()
+
+    print(f"{result['processed']} gelesen, {result['upserted']} übernommen, {result['skipped']} übersprungen")
+    return 0
+
+
+def run_export(args) -> int:
+    """Exportiert alle Zielkontakte in eine Datei oder nach stdout."""
+    fmt = args.format or (contact_import.detect_format(args.output) if args.output else "csv")
+    db = SessionLocal()
+    output = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    try:
+        for block in contact_import.iter_export(db, fmt, user_id=args.user_id, chunk_size=args.chunk_size):
+            output.write(block)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        db.close()
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Bulk-Import/-Export von Zielkontakten")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = subparsers.add_parser("import", help="Kontakte aus CSV/JSONL importieren")
+    import_parser.add_argument("file")
+    import_parser.add_argument("--format", choices=contact_import.SUPPORTED_FORMATS)
+    import_parser.add_argument("--user-id", type=int)
+    import_parser.add_argument("--chunk-size", type=int, default=contact_import.CHUNK_SIZE)
+    import_parser.set_defaults(func=run_import)
+
+    export_parser = subparsers.add_parser("export", help="Kontakte als CSV/JSONL exportieren")
+    export_parser.add_argument("-o", "--output")
+    export_parser.add_argument("--format", choices=contact_import.SUPPORTED_FORMATS)
+    export_parser.add_argument("--user-id", type=int)
+    export_parser.add_argument("--chunk-size", type=int, default=contact_import.CHUNK_SIZE)
+    export_parser.set_defaults(func=run_export)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
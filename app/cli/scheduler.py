@@ -0,0 +1,84 @@
+"""Startet den Scheduler für alle (oder ausgewählte) Accounts auf einem Event-Loop.
+
+Metriken und Profiler gelten pro Prozess. Mit ``--admin-port`` (bzw.
+``SCHEDULER_ADMIN_PORT``) bedient der Scheduler-Prozess deshalb selbst
+``/api/v1/metrics`` und ``/api/v1/scheduler/profiler*`` auf demselben Event-Loop;
+die Endpoints der API sehen nur den API-Prozess.
+
+Beispiele:
+    python -m app.cli.scheduler
+    python -m app.cli.scheduler --user-id 1 --user-id 2
+    python -m app.cli.scheduler --admin-port 9100
+"""
+import argparse
+import asyncio
+import logging
+import sys
+
+
+def admin_app():
+    """Metrik- und Profiler-Endpoints dieses Prozesses unter denselben Pfaden wie in der API."""
+    from fastapi import FastAPI
+
+    from app.api.api_v1.endpoints import metrics, scheduler
+    from app.core.config import settings
+
+    app = FastAPI(title="Scheduler-Admin", docs_url=None, redoc_url=None, openapi_url=None)
+    app.include_router(metrics.router, prefix=f"{settings.API_V1_STR}/metrics", tags=["metrics"])
+    app.include_router(scheduler.router, prefix=f"{settings.API_V1_STR}/scheduler", tags=["scheduler"])
+    return app
+
+
+def admin_server(port: int):
+    import uvicorn
+
+    from app.core.config import settings
+
+    server = uvicorn.Server(uvicorn.Config(
+        admin_app(), host=settings.SCHEDULER_ADMIN_HOST, port=port, log_level="warning", lifespan="off"
+    ))
+    # Strg+C beendet asyncio.run und damit den Scheduler, nicht nur den Listener
+    server.install_signal_handlers = lambda: None
+    return server
+
+
+async def run(user_ids, admin_port: int = 0) -> int:
+    from app.db.session import run_in_session
+    from app.services.account_settings import SettingsStore
+    from app.services.scheduler_service import SchedulerService
+
+    accounts = await run_in_session(SettingsStore.load, user_ids)
+    if not accounts:
+        logging.error("Keine Accounts mit Einstellungen gefunden")
+        return 1
+
+    server = admin_server(admin_port) if admin_port else None
+    admin = asyncio.create_task(server.serve()) if server is not None else None
+    try:
+        await SchedulerService().start(accounts)
+    finally:
+        if admin is not None:
+            server.should_exit = True
+            await admin
+    return 0
+
+
+def main(argv=None) -> int:
+    from app.core.config import settings
+
+    parser = argparse.ArgumentParser(description="Automatisierungs-Scheduler starten")
+    parser.add_argument("--user-id", type=int, action="append", help="Nur diese Accounts (mehrfach angebbar)")
+    parser.add_argument(
+        "--admin-port", type=int, default=settings.SCHEDULER_ADMIN_PORT,
+        help="Port für Metriken und Profiler dieses Prozesses (0 = aus)"
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    try:
+        return asyncio.run(run(args.user_id, args.admin_port))
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+"""Dashboard-Zähler aus dem Datenbestand neu aufbauen (Erstbefüllung oder nach Bulk-Updates).
+
+    python -m app.cli.stats rebuild
+"""
+import argparse
+import logging
+import sys
+
+from app.db.session import SessionLocal
+from app.services import stats
+
+
+def run_rebuild(args) -> int:
+    db = SessionLocal()
+    try:
+        count = stats.rebuild_counters(db)
+    finally:
+        db.close()
+    print(f"{count} Zähler neu berechnet")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Dashboard-Statistiken verwalten")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    rebuild_parser = subparsers.add_parser("rebuild", help="Alle Zähler aus Posts und Interaktionen neu berechnen")
+    rebuild_parser.set_defaults(func=run_rebuild)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
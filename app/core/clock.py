@@ -0,0 +1,31 @@
+"""Zeitbasis für Zeitstempel in der Datenbank.
+
+Spalten mit ``DateTime(timezone=True)`` werden mit zeitzonenbehafteten UTC-Werten
+geschrieben und verglichen; das Ergebnis hängt so weder von der Zeitzone der DB-Session
+noch von der des Prozesses ab. SQLite speichert die Werte ohne Zone (als UTC) und liefert
+sie naiv zurück, ``as_utc`` gleicht das aus. Die Trigger des Schedulers rechnen weiter in
+lokaler Zeit ohne Zone (``to_local_naive``).
+"""
+from typing import Optional
+from datetime import datetime, timezone
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Wert aus der DB als UTC mit Zone; naive Werte (SQLite) sind dort bereits UTC."""
+    if value is None:
+        return None
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def to_utc(value: datetime) -> datetime:
+    """Zeitpunkt aus Request oder Scheduler als UTC mit Zone; ohne Zone gilt die lokale Zeit des Servers."""
+    return value.astimezone(timezone.utc)
+
+
+def to_local_naive(value: datetime) -> datetime:
+    """Wert aus der DB als lokale Zeit ohne Zone, wie sie der Scheduler verwendet."""
+    return as_utc(value).astimezone().replace(tzinfo=None)
@@ -1,4 +1,5 @@
 from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache
 from pydantic import AnyHttpUrl, BaseSettings, EmailStr, validator
 import secrets
 from pathlib import Path
@@ -31,9 +32,88 @@ class Settings(BaseSettings):
     # OpenAI API
     OPENAI_API_URL: str = "https://api.openai.com/v1"
     OPENAI_API_KEY: Optional[str] = None
+    AI_CANDIDATES: int = 3  # Varianten pro Kommentar/Nachricht (n), lokal ausgewählt
+    AI_RECENT_INTERACTIONS: int = 200  # Letzte Interaktionen für die Duplikatprüfung
+    
+    # Modell-Routing pro Aufgabentyp (kurze Texte auf das schnelle Modell)
+    AI_DEFAULT_MODEL: str = "gpt-4"
+    AI_MODEL_ROUTES: Dict[str, str] = {
+        "post": "gpt-4",
+        "engagement_analysis": "gpt-4",
+        "comment": "gpt-3.5-turbo",
+        "comment_batch": "gpt-3.5-turbo",
+        "connection_message": "gpt-3.5-turbo",
+        "follow_up_message": "gpt-3.5-turbo",
+    }
+    AI_FALLBACK_MODELS: Dict[str, str] = {  # Ausweichmodell bei Timeout (nur auf schnellere Modelle)
+        "gpt-4": "gpt-3.5-turbo",
+    }
+    AI_ROUTE_TIMEOUTS: Dict[str, float] = {  # Sekunden
+        "post": 60,
+        "engagement_analysis": 60,
+    }
+    AI_DEFAULT_TIMEOUT: float = 15
+    AI_MODEL_PRICES: Dict[str, List[float]] = {  # USD pro 1000 Tokens [Prompt, Completion]
+        "gpt-4": [0.03, 0.06],
+        "gpt-3.5-turbo": [0.001, 0.002],
+    }
     
     # Scheduler
     SCHEDULER_INTERVAL: int = 60  # Sekunden
+    SETTINGS_POLL_INTERVAL: int = 5  # Sekunden bis geänderte Account-Einstellungen greifen
+    
+    # Posting-Zeiten: Fenster (Stunden, inklusive) und Mindesthistorie für die Optimierung
+    POST_WINDOW_START_HOUR: int = 9
+    POST_WINDOW_END_HOUR: int = 17
+    SEND_TIME_MIN_HISTORY: int = 10  # Posts mit Metriken, sonst zufällige Slots
+    SEND_TIME_PRIOR_WEIGHT: float = 3.0  # Glättung schwach belegter Slots Richtung Mittelwert
+    POST_DRAFT_LEAD_HOURS: int = 24  # ohne Auto-Publish: Entwurf so lange vor dem Slot (Zeit zur Freigabe)
+    
+    # Dispatcher für geplante Posts
+    DISPATCH_BATCH_SIZE: int = 20  # Posts pro Claim
+    DISPATCH_MAX_SLEEP: int = 300  # Sekunden; Obergrenze ohne NOTIFY (z. B. SQLite, andere Prozesse)
+    DISPATCH_CLAIM_TIMEOUT: int = 3600  # Sekunden, danach gilt ein beanspruchter Post als verwaist
+    DISPATCH_RELEASE_INTERVAL: int = 300  # Sekunden zwischen zwei Prüfungen auf verwaiste Posts
+    
+    # Circuit Breaker pro Account und Aktion
+    BREAKER_FAILURE_THRESHOLD: int = 5  # Fehlschläge in Folge bis zur Pause
+    BREAKER_COOLDOWN: int = 900  # Sekunden Pause vor dem ersten Probeaufruf
+    BREAKER_MAX_COOLDOWN: int = 14400  # Obergrenze; jeder fehlgeschlagene Probeaufruf verdoppelt die Pause
+    
+    # Abgleich der Verbindungsanfragen mit "Kontakte" und "Gesendete Einladungen"
+    CONNECTION_SYNC_INTERVAL: int = 60  # Minuten
+    CONNECTION_REJECT_AFTER_HOURS: int = 48  # erst danach gilt eine fehlende Einladung als abgelehnt
+    CONNECTION_SYNC_MAX_PAGES: int = 50  # Seiten bzw. Scroll-Schritte pro Liste
+    
+    # Ranking der Suchtreffer: Startgewichte je Merkmal, angepasst an die Annahmequoten
+    RANKING_WEIGHTS: Dict[str, float] = {"position": 3.0, "keywords": 2.0, "degree": 1.0, "industry": 1.0, "location": 0.5}
+    RANKING_MIN_SAMPLES: int = 30  # entschiedene Anfragen, sonst Startgewichte
+    RANKING_PRIOR_WEIGHT: float = 20.0  # Glättung schwach belegter Merkmale Richtung Gesamtquote
+    RANKING_PENDING_DAYS: int = 21  # offene Anfragen danach als nicht angenommen werten
+    
+    # Engagement-Metriken: Abrufabstand nach Alter des Beitrags (bis Stunden -> Minuten)
+    ENGAGEMENT_POLL_SCHEDULE: Dict[int, int] = {6: 30, 24: 120, 168: 720, 720: 2880}
+    ENGAGEMENT_MAX_UNCHANGED: int = 3  # Abrufe ohne Änderung, danach wird der Beitrag nicht mehr abgefragt
+    ENGAGEMENT_POLL_BATCH: int = 50  # Beiträge pro Lauf
+    ENGAGEMENT_COLLECT_INTERVAL: int = 15  # Minuten
+    
+    # KI-Analyse nur, wenn sich die Metriken seit der letzten Analyse deutlich bewegt haben
+    ANALYSIS_MIN_DELTA: Dict[str, int] = {"likes": 20, "comments": 5, "shares": 3}  # absolut
+    ANALYSIS_MIN_RELATIVE_CHANGE: float = 0.25  # und relativ zum Stand der letzten Analyse
+    ANALYSIS_BATCH_SIZE: int = 5  # Posts pro Prompt
+    
+    # Tracing: "jsonl", "otel" oder beides (kommagetrennt); leer = aus
+    TRACING_EXPORTERS: Optional[str] = None
+    TRACING_FILE: str = "traces.jsonl"
+    
+    # Sampling-Profiler (Admin-Endpoints unter /scheduler/profiler, im Scheduler-Prozess über SCHEDULER_ADMIN_PORT)
+    PROFILER_OUTPUT_DIR: str = "profiles"
+    PROFILER_ADMIN_TOKEN: Optional[str] = None  # Header X-Admin-Token; ohne Token sind die Endpoints gesperrt
+    PROFILER_MIN_INTERVAL_MS: float = 1.0  # kleinstes Sampling-Intervall
+    
+    # Admin-Listener des Scheduler-Prozesses (/api/v1/metrics, /api/v1/scheduler/profiler*); Port 0 = aus
+    SCHEDULER_ADMIN_HOST: str = "127.0.0.1"
+    SCHEDULER_ADMIN_PORT: int = 0
     
     # Rate Limiting
     RATE_LIMIT_REQUESTS: int = 100
@@ -48,20 +128,24 @@ class Settings(BaseSettings):
     BROWSER_USER_AGENT: Optional[str] = None
     
     # LinkedIn
-    LINKEDIN_EMAIL: str
-    LINKEDIN_PASSWORD: str
+    LINKEDIN_BASE_URL: str = "https://www.linkedin.com"  # Für Offline-Tests auf eine lokale Fake-Seite umstellbar
+    # Nur für den Login nötig; API-Worker und CLI-Tools starten auch ohne
+    LINKEDIN_EMAIL: Optional[str] = None
+    LINKEDIN_PASSWORD: Optional[str] = None
     
     # Database
-    POSTGRES_SERVER: str
-    POSTGRES_USER: str
-    POSTGRES_PASSWORD: str
-    POSTGRES_DB: str
+    POSTGRES_SERVER: Optional[str] = None
+    POSTGRES_USER: Optional[str] = None
+    POSTGRES_PASSWORD: Optional[str] = None
+    POSTGRES_DB: Optional[str] = None
     DATABASE_URL: Optional[str] = None
 
     @validator("DATABASE_URL", pre=True)
     def assemble_db_connection(cls, v: Optional[str], values: dict[str, any]) -> any:
         if isinstance(v, str):
             return v
+        if not values.get("POSTGRES_SERVER"):
+            return None
         return f"postgresql://{values.get('POSTGRES_USER')}:{values.get('POSTGRES_PASSWORD')}@{values.get('POSTGRES_SERVER')}/{values.get('POSTGRES_DB')}"
 
     # Scheduler
@@ -73,4 +157,26 @@ class Settings(BaseSettings):
         case_sensitive = True
         env_file = ".env"
 
-settings = Settings() 
\ No newline at end of file
+@lru_cache()
+def get_settings() -> Settings:
+    """Liest die Settings beim ersten Zugriff (nicht beim Import) und cached sie."""
+    return Settings()
+
+
+class _LazySettings:
+    """Stellvertreter für ``settings``: instanziiert ``Settings`` erst beim ersten Attributzugriff."""
+
+    def __getattr__(self, name: str):
+        return getattr(get_settings(), name)
+
+    def __setattr__(self, name: str, value):
+        setattr(get_settings(), name, value)
+
+    def __delattr__(self, name: str):
+        delattr(get_settings(), name)
+
+    def __repr__(self) -> str:
+        return repr(get_settings())
+
+
+settings = _LazySettings() 
\ No newline at end of file
@@ -0,0 +1,282 @@
+"""Prometheus-kompatible Metriken (Counter und Histogramme) ohne externe Abhängigkeit."""
+from typing import Dict, Iterable, List, Optional, Tuple
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+import asyncio
+import threading
+import time
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: Dict[Tuple[str, ...], object] = {}
+
+    def labels(self, *values, **kwargs):
+        """Liefert die Zeitreihe für eine Label-Kombination."""
+        if kwargs:
+            values = tuple(kwargs[name] for name in self.labelnames)
+        key = tuple(str(v) for v in values)
+        if len(key) != len(self.labelnames):
+            raise ValueError(f"{self.name}: erwartet Labels {self.labelnames}")
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for key, child in sorted(self._children.items()):
+            lines.extend(child.render(self.name, self.labelnames, key))
+        return lines
+
+
+class _CounterValue:
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def render(self, name, labelnames, key) -> List[str]:
+        return [f"{name}{_format_labels(labelnames, key)} {self._value}"]
+
+
+class _HistogramValue:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self._buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self._buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    @contextmanager
+    def time(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    @property
+    def count(self) -> int:
+        return sum(self._counts)
+
+    def render(self, name, labelnames, key) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self._buckets + (float("inf"),), self._counts):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            labels = _format_labels(labelnames, key, f'le="{le}"')
+            lines.append(f"{name}_bucket{labels} {cumulative}")
+        lines.append(f"{name}_sum{_format_labels(labelnames, key)} {self._sum}")
+        lines.append(f"{name}_count{_format_labels(labelnames, key)} {cumulative}")
+        return lines
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterValue()
+
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+
+class Registry:
+    """Sammlung aller Metriken für den /metrics-Endpoint."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metrik {metric.name} ist bereits registriert")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Textformat 0.0.4 für Prometheus-Scraper."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+# Automatisierungsaktionen (perform_*, Verbindungsanfragen, ...)
+ACTIONS = registry.counter(
+    "linkedin_actions_total", "Ausgeführte Automatisierungsaktionen nach Ergebnis", ("action", "result")
+)
+ACTION_DURATION = registry.histogram(
+    "linkedin_action_duration_seconds", "Dauer einer Automatisierungsaktion", ("action",)
+)
+
+# Circuit Breaker pro Account und Aktion
+CIRCUIT_BREAKER_TRANSITIONS = registry.counter(
+    "circuit_breaker_transitions_total", "Zustandswechsel der Circuit Breaker", ("action", "from_state", "to_state")
+)
+CIRCUIT_BREAKER_REJECTED = registry.counter(
+    "circuit_breaker_rejected_total", "Wegen offenem Circuit Breaker ausgelassene Aktionen", ("action",)
+)
+
+# Vorauswahl von Profilen/Beiträgen vor KI-Aufruf und Navigation
+SCREENING = registry.counter(
+    "candidate_screening_total", "Geprüfte Kandidaten nach Art und Ergebnis bzw. Ablehnungsgrund", ("kind", "result")
+)
+
+# KI-Aufrufe
+AI_REQUESTS = registry.counter(
+    "ai_requests_total", "KI-Aufrufe nach Aufgabe, Modell und Ergebnis", ("task", "model", "result")
+)
+AI_LATENCY = registry.histogram(
+    "ai_request_duration_seconds", "Latenz der KI-Aufrufe", ("task", "model")
+)
+AI_TOKENS = registry.counter(
+    "ai_tokens_total", "Verbrauchte Tokens nach Aufgabe, Modell und Art", ("task", "model", "kind")
+)
+AI_CACHE = registry.counter(
+    "ai_cache_total", "Gespeicherte KI-Ergebnisse wiederverwendet (hit) oder neu angefragt (miss)", ("task", "result")
+)
+
+# Browser
+BROWSER_NAVIGATIONS = registry.counter(
+    "browser_navigations_total", "Seitenaufrufe im Browser nach Ergebnis", ("backend", "result")
+)
+BROWSER_NAVIGATION_DURATION = registry.histogram(
+    "browser_navigation_duration_seconds", "Dauer eines Seitenaufrufs", ("backend",)
+)
+BROWSER_SELECTOR_WAIT = registry.histogram(
+    "browser_selector_wait_seconds", "Wartezeit auf Selektoren", ("backend", "selector", "result")
+)
+
+# Datenbank
+DB_SESSION_DURATION = registry.histogram(
+    "db_session_duration_seconds", "Dauer einer DB-Transaktion bis Commit/Rollback", ("outcome",)
+)
+DB_STATEMENTS = registry.counter(
+    "db_statements_total", "Ausgeführte SQL-Statements"
+)
+
+
+def _action_result(value) -> str:
+    if value is None:
+        return "skipped"
+    return "success" if value else "failure"
+
+
+def track_action(action: str):
+    """Decorator für perform_*-Methoden: Dauer und Ergebnis (Rückgabewert) erfassen."""
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                result = "error"
+                try:
+                    value = await func(*args, **kwargs)
+                    result = _action_result(value)
+                    return value
+                finally:
+                    ACTION_DURATION.labels(action).observe(time.perf_counter() - start)
+                    ACTIONS.labels(action, result).inc()
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            result = "error"
+            try:
+                value = func(*args, **kwargs)
+                result = _action_result(value)
+                return value
+            finally:
+                ACTION_DURATION.labels(action).observe(time.perf_counter() - start)
+                ACTIONS.labels(action, result).inc()
+        return wrapper
+    return decorator
+
+
+def instrument_database(engine, session_factory):
+    """Registriert Engine- und Session-Events für Statement-Zähler und Transaktionsdauer."""
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count_statement(conn, cursor, statement, parameters, context, executemany):
+        DB_STATEMENTS.inc()
+
+    @event.listens_for(session_factory, "after_begin")
+    def _begin(session, transaction, connection):
+        session.info.setdefault("metrics_started", time.perf_counter())
+
+    def _finish(session, outcome: str):
+        started: Optional[float] = session.info.pop("metrics_started", None)
+        if started is not None:
+            DB_SESSION_DURATION.labels(outcome).observe(time.perf_counter() - started)
+
+    @event.listens_for(session_factory, "after_commit")
+    def _commit(session):
+        _finish(session, "commit")
+
+    @event.listens_for(session_factory, "after_soft_rollback")
+    def _rollback(session, previous_transaction):
+        _finish(session, "rollback")
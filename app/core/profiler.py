@@ -0,0 +1,212 @@
+"""In-Process-Sampling-Profiler, zur Laufzeit über die API schaltbar.
+
+Ein Hintergrund-Thread liest in festen Abständen die Stacks aller (oder ausgewählter)
+Threads über ``sys._current_frames()`` und zählt sie im Collapsed-Stack-Format
+(``modul:funktion;modul:funktion N``), das flamegraph.pl, speedscope und inferno direkt lesen.
+"""
+from typing import Dict, Optional, Set
+from collections import Counter
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+import asyncio
+import logging
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+MAX_DURATION = 300  # Sekunden; ein vergessener Profiler soll sich selbst beenden
+MIN_INTERVAL = 0.001
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", Path(code.co_filename).stem)
+    return f"{module}:{code.co_name}"
+
+
+def _collapse(frame) -> str:
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+class SamplingProfiler:
+    """Sampelt Thread-Stacks für eine begrenzte Dauer und schreibt eine Collapsed-Stack-Datei."""
+
+    def __init__(self, output_dir: str, interval: float = 0.005, duration: float = 30,
+                 thread_ids: Optional[Set[int]] = None, label: str = "scheduler"):
+        self.output_dir = Path(output_dir)
+        self.interval = max(interval, MIN_INTERVAL)
+        self.duration = min(duration, MAX_DURATION)
+        self.thread_ids = thread_ids
+        self.label = label
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.started_at: Optional[datetime] = None
+        self.output_path: Optional[Path] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        self.started_at = datetime.utcnow()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        own_id = threading.get_ident()
+        deadline = time.monotonic() + self.duration
+        while not self._stop.is_set() and time.monotonic() < deadline:
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id or (self.thread_ids is not None and thread_id not in self.thread_ids):
+                    continue
+                self.stacks[_collapse(frame)] += 1
+            self.samples += 1
+            self._stop.wait(self.interval)
+        self._write()
+
+    def stop(self) -> Optional[Path]:
+        """Beendet das Sampling und liefert den Pfad der geschriebenen Datei."""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        return self.output_path
+
+    def _write(self):
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stamp = self.started_at.strftime("%Y%m%dT%H%M%S%f")
+        path = self.output_dir / f"{self.label}-{stamp}.collapsed"
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        self.output_path = path
+        logger.info(f"Profil geschrieben: {path} ({self.samples} Samples)")
+
+    def status(self) -> dict:
+        return {
+            "running": self.running,
+            "label": self.label,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "duration": self.duration,
+            "interval": self.interval,
+            "samples": self.samples,
+            "output": str(self.output_path) if self.output_path else None
+        }
+
+
+# Prozessweiter Zustand: höchstens ein laufender Profiler, optional ein vorgemerkter Job
+_lock = threading.Lock()
+_active: Optional[SamplingProfiler] = None
+_last_job: Optional[SamplingProfiler] = None
+_armed_jobs: Dict[str, dict] = {}
+
+
+def _output_dir() -> str:
+    from app.core.config import settings
+    return settings.PROFILER_OUTPUT_DIR
+
+
+def start(duration: float = 30, interval: float = 0.005) -> SamplingProfiler:
+    """Startet den prozessweiten Profiler; Fehler, wenn bereits einer läuft."""
+    global _active
+    with _lock:
+        if _active is not None and _active.running:
+            raise RuntimeError("Profiler läuft bereits")
+        _active = SamplingProfiler(_output_dir(), interval=interval, duration=duration)
+        _active.start()
+        return _active
+
+
+def stop() -> Optional[SamplingProfiler]:
+    """Stoppt den prozessweiten Profiler (falls vorhanden) und liefert ihn zurück."""
+    with _lock:
+        profiler = _active
+    if profiler is not None:
+        profiler.stop()
+    return profiler
+
+
+def status() -> dict:
+    with _lock:
+        profiler = _active
+        armed = dict(_armed_jobs)
+    return {
+        "profiler": profiler.status() if profiler else None,
+        "last_job": _last_job.status() if _last_job else None,
+        "armed_jobs": armed
+    }
+
+
+def latest_output(job: bool = False) -> Optional[Path]:
+    with _lock:
+        profiler = _last_job if job else _active
+        return profiler.output_path if profiler else None
+
+
+def arm_job(action: str, interval: float = 0.001):
+    """Merkt den nächsten Lauf von ``perform_<action>`` zum Profilen vor."""
+    with _lock:
+        _armed_jobs[action] = {"interval": interval}
+
+
+def _take_armed(action: str) -> Optional[dict]:
+    if not _armed_jobs:
+        return None
+    with _lock:
+        return _armed_jobs.pop(action, None)
+
+
+def profile_job(action: str):
+    """Decorator für perform_*: profiliert genau einen Lauf, wenn er vorgemerkt wurde.
+
+    Gesampelt wird nur der Thread, der den Job ausführt; bei async-Jobs also der
+    Event-Loop-Thread inklusive parallel laufender Tasks.
+    """
+    def decorator(func):
+        def _start_job_profiler(armed: dict) -> SamplingProfiler:
+            global _last_job
+            profiler = SamplingProfiler(
+                _output_dir(),
+                interval=armed["interval"],
+                duration=MAX_DURATION,
+                thread_ids={threading.get_ident()},
+                label=f"perform_{action}"
+            )
+            profiler.start()
+            with _lock:
+                _last_job = profiler
+            return profiler
+
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                armed = _take_armed(action)
+                if armed is None:
+                    return await func(*args, **kwargs)
+                profiler = _start_job_profiler(armed)
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    profiler.stop()
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            armed = _take_armed(action)
+            if armed is None:
+                return func(*args, **kwargs)
+            profiler = _start_job_profiler(armed)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.stop()
+        return wrapper
+    return decorator
@@ -0,0 +1,255 @@
+"""Leichtgewichtige Tracing-Spans (Scheduler → KI → Browser → DB).
+
+    with trace("perform_comment", user_id=1):
+        with span("linkedin.search_posts"):
+            ...
+
+    @traced("ai.generate_comment")
+    async def generate_comment(...): ...
+
+Spans werden nur aufgezeichnet, wenn ``TRACING_EXPORTERS`` gesetzt ist ("jsonl", "otel"
+oder beides, kommagetrennt); sonst sind ``span``/``traced`` nahezu kostenlos.
+"""
+from typing import Dict, List, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+import asyncio
+import json
+import logging
+import secrets
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Span:
+    """Ein abgeschlossener oder laufender Abschnitt einer Interaktion."""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start: float  # Unix-Zeit
+    attributes: Dict[str, object] = field(default_factory=dict)
+    duration: float = 0.0
+    status: str = "ok"
+    error: Optional[str] = None
+    otel_span: object = None
+
+    def set_attribute(self, key: str, value):
+        self.attributes[key] = value
+        if self.otel_span is not None:
+            self.otel_span.set_attribute(key, value)
+
+    def as_dict(self) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": self.start,
+            "duration_ms": round(self.duration * 1000, 3),
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes
+        }
+
+
+class JsonLinesExporter:
+    """Schreibt jeden abgeschlossenen Span als eine JSON-Zeile in eine Datei."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        line = json.dumps(span.as_dict(), ensure_ascii=False, default=str)
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+class OpenTelemetryBridge:
+    """Spiegelt Spans in einen OpenTelemetry-Tracer (nur wenn ``opentelemetry`` installiert ist)."""
+
+    def __init__(self):
+        from opentelemetry import trace as otel_trace
+        self._otel = otel_trace
+        self.tracer = otel_trace.get_tracer("linkedin-agent")
+
+    def start(self, span: Span, parent: Optional[Span]):
+        context = None
+        if parent is not None and parent.otel_span is not None:
+            context = self._otel.set_span_in_context(parent.otel_span)
+        span.otel_span = self.tracer.start_span(
+            span.name,
+            context=context,
+            start_time=int(span.start * 1e9),
+            attributes={"interaction.trace_id": span.trace_id, **_otel_attributes(span.attributes)}
+        )
+
+    def export(self, span: Span):
+        otel_span = span.otel_span
+        if otel_span is None:
+            return
+        if span.error:
+            otel_span.set_status(self._otel.Status(self._otel.StatusCode.ERROR, span.error))
+        otel_span.end(end_time=int((span.start + span.duration) * 1e9))
+
+
+def _otel_attributes(attributes: Dict[str, object]) -> Dict[str, object]:
+    # OpenTelemetry akzeptiert nur primitive Attributwerte
+    return {
+        key: value if isinstance(value, (str, bool, int, float)) else str(value)
+        for key, value in attributes.items()
+    }
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+_exporters: Optional[List[object]] = None
+_otel: Optional[OpenTelemetryBridge] = None
+_config_lock = threading.Lock()
+
+
+def configure(exporters: Optional[str] = None, path: Optional[str] = None):
+    """Richtet die Exporter ein; ohne Argumente aus den Settings."""
+    global _exporters, _otel
+    if exporters is None or path is None:
+        from app.core.config import settings
+        exporters = settings.TRACING_EXPORTERS if exporters is None else exporters
+        path = settings.TRACING_FILE if path is None else path
+
+    configured: List[object] = []
+    otel = None
+    for name in (e.strip() for e in (exporters or "").split(",")):
+        if name == "jsonl":
+            configured.append(JsonLinesExporter(path))
+        elif name == "otel":
+            try:
+                otel = OpenTelemetryBridge()
+            except ImportError:
+                logger.warning("TRACING_EXPORTERS enthält 'otel', aber opentelemetry ist nicht installiert")
+                continue
+            configured.append(otel)
+        elif name:
+            logger.warning(f"Unbekannter Trace-Exporter: {name}")
+    with _config_lock:
+        _exporters, _otel = configured, otel
+
+
+def _active_exporters() -> List[object]:
+    if _exporters is None:
+        configure()
+    return _exporters
+
+
+def enabled() -> bool:
+    return bool(_active_exporters())
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def current_trace_id() -> Optional[str]:
+    span = _current_span.get()
+    return span.trace_id if span else None
+
+
+def _new_id(nbytes: int) -> str:
+    return secrets.token_hex(nbytes)
+
+
+def _start(name: str, attributes: dict, new_trace: bool, start: Optional[float] = None) -> Span:
+    parent = None if new_trace else _current_span.get()
+    span = Span(
+        name=name,
+        trace_id=parent.trace_id if parent else _new_id(16),
+        span_id=_new_id(8),
+        parent_id=parent.span_id if parent else None,
+        start=time.time() if start is None else start,
+        attributes=attributes
+    )
+    if _otel is not None:
+        _otel.start(span, parent)
+    return span
+
+
+def _finish(span: Span):
+    for exporter in _exporters or ():
+        try:
+            exporter.export(span)
+        except Exception as e:  # Tracing darf die Automatisierung nie abbrechen
+            logger.debug(f"Span-Export fehlgeschlagen: {str(e)}")
+
+
+@contextmanager
+def span(name: str, _new_trace: bool = False, **attributes):
+    """Misst einen Abschnitt als Kind-Span des aktuellen Spans."""
+    if not _active_exporters():
+        yield None
+        return
+    current = _start(name, attributes, _new_trace)
+    token = _current_span.set(current)
+    started = time.perf_counter()
+    try:
+        yield current
+    except BaseException as e:
+        current.status = "error"
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        current.duration = time.perf_counter() - started
+        _current_span.reset(token)
+        _finish(current)
+
+
+def trace(name: str, **attributes):
+    """Startet einen neuen Trace (eigene Trace-ID) für eine einzelne Interaktion."""
+    return span(name, _new_trace=True, **attributes)
+
+
+def record_span(name: str, duration: float, **attributes):
+    """Zeichnet einen bereits gemessenen Abschnitt (z.B. aus DB-Events) nachträglich auf."""
+    if not _active_exporters():
+        return
+    current = _start(name, attributes, False, start=time.time() - duration)
+    current.duration = duration
+    _finish(current)
+
+
+def traced(name: Optional[str] = None):
+    """Decorator: jeder Aufruf der (a)synchronen Funktion wird als Span erfasst."""
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(span_name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def instrument_session(session_factory):
+    """Erfasst jeden Session-Commit als Span ``db.commit``."""
+    from sqlalchemy import event
+
+    @event.listens_for(session_factory, "before_commit")
+    def _before_commit(session):
+        session.info["trace_commit_started"] = time.perf_counter()
+
+    @event.listens_for(session_factory, "after_commit")
+    def _after_commit(session):
+        started = session.info.pop("trace_commit_started", None)
+        if started is not None:
+            record_span("db.commit", time.perf_counter() - started)
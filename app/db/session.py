@@ -1,9 +1,39 @@
+from typing import Callable, TypeVar
+from functools import lru_cache
+import asyncio
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.core.metrics import instrument_database
+from app.core.tracing import instrument_session
+
+T = TypeVar("T")
+
+
+@lru_cache()
+def get_engine() -> Engine:
+    """Engine beim ersten DB-Zugriff (nicht beim Import) anlegen; liest erst dann die Settings."""
+    return create_engine(settings.SQLALCHEMY_DATABASE_URI, pool_pre_ping=True)
+
+
+@lru_cache()
+def get_sessionmaker() -> sessionmaker:
+    """Session-Factory samt Metriken, Tracing und Statistik-Hooks, einmal pro Prozess."""
+    from app.services.stats import instrument_stats
 
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URI, pool_pre_ping=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine = get_engine()
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    instrument_database(engine, factory)
+    instrument_session(factory)
+    instrument_stats(factory)
+    return factory
+
+
+def SessionLocal():
+    """Neue Session; Engine und Factory entstehen beim ersten Aufruf."""
+    return get_sessionmaker()()
 
 # Dependency
 def get_db():
@@ -11,4 +41,22 @@ def get_db():
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+
+async def run_in_session(fn: Callable[..., T], *args, **kwargs) -> T:
+    """Führt ``fn(db, *args, **kwargs)`` mit eigener Session in einem Worker-Thread aus.
+
+    So blockieren DB-Zugriffe aus async Jobs nicht den gemeinsamen Event-Loop.
+    """
+    def _run():
+        db = SessionLocal()
+        try:
+            return fn(db, *args, **kwargs)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    return await asyncio.to_thread(_run)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, Text, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, Text, Boolean, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -9,10 +9,15 @@ class PostStatus(str, enum.Enum):
     DRAFT = "draft"
     PUBLISHED = "published"
     SCHEDULED = "scheduled"
+    PUBLISHING = "publishing"  # vom Dispatcher beansprucht, Veröffentlichung läuft
     FAILED = "failed"
 
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (
+        # Warteschlange des Dispatchers: fällige Posts ohne Tabellenscan
+        Index("ix_posts_status_scheduled_for", "status", "scheduled_for"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String)
@@ -31,6 +36,11 @@ class Post(Base):
     
     # Metadaten
     engagement_metrics = Column(String)  # JSON als String: Likes, Kommentare, etc.
+    metrics_checked_at = Column(DateTime(timezone=True), nullable=True)
+    metrics_next_check_at = Column(DateTime(timezone=True), nullable=True, index=True)  # NULL nach dem ersten Abruf = fertig
+    metrics_unchanged_checks = Column(Integer, default=0)
+    engagement_analysis = Column(Text)  # JSON: Analyse, Prompt-Version, Zeitpunkt, Metriken zum Analysezeitpunkt
+    analysis_input_hash = Column(String(64))  # SHA-256 über Inhalt und Prompt-Version der letzten Analyse
     ai_generated = Column(Boolean, default=False)
     ai_prompt = Column(Text)  # Der verwendete Prompt für die KI-Generierung
 
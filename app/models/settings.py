@@ -40,6 +40,9 @@ class Settings(Base):
     # Nachrichtenvorlagen
     message_templates = Column(JSON)  # Vorlagen für verschiedene Nachrichtentypen
     
+    # KI-Modell-Routing
+    model_routes = Column(JSON)  # Aufgabentyp -> Modell, überschreibt die globale Zuordnung
+    
     # Benachrichtigungseinstellungen
     notification_settings = Column(JSON)  # Benachrichtigungseinstellungen
     
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, String, UniqueConstraint
+
+from app.db.base_class import Base
+
+class StatCounter(Base):
+    """Vorberechnete Zähler für das Dashboard, bei jedem Flush inkrementell fortgeschrieben."""
+    __tablename__ = "stat_counters"
+    __table_args__ = (UniqueConstraint("user_id", "metric", "key", name="uq_stat_counters_user_metric_key"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, nullable=False, default=0)  # 0 = ohne Benutzer bzw. global
+    metric = Column(String, nullable=False)  # interactions, posts, activity_*, revision
+    key = Column(String, nullable=False)  # z. B. "like:completed", "published", "2024-01-31"
+    value = Column(Integer, nullable=False, default=0)
@@ -1,8 +1,9 @@
-from sqlalchemy import Column, String, Integer, ForeignKey, Enum, Text, Boolean
+from sqlalchemy import Column, String, Integer, ForeignKey, Enum, Text, Boolean, DateTime, Index, UniqueConstraint
+from sqlalchemy.sql import func, text
 from sqlalchemy.orm import relationship
 import enum
 
-from app.db.base import Base
+from app.db.base_class import Base
 
 class ContactStatus(str, enum.Enum):
     PENDING = "pending"
@@ -12,8 +13,19 @@ class ContactStatus(str, enum.Enum):
     FAILED = "failed"
 
 class TargetContact(Base):
+    __tablename__ = "target_contacts"
+    __table_args__ = (
+        # Jeder Account führt seine eigenen Zielkontakte, auch für dasselbe Profil
+        UniqueConstraint("user_id", "profile_url", name="uq_target_contacts_user_id_profile_url"),
+        # Importe ohne Account: eine Zeile je Profil (NULL wäre im Constraint oben nie gleich)
+        Index(
+            "uq_target_contacts_profile_url_unowned", "profile_url", unique=True,
+            postgresql_where=text("user_id IS NULL"), sqlite_where=text("user_id IS NULL")
+        ),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
-    profile_url = Column(String, unique=True, nullable=False)
+    profile_url = Column(String, nullable=False)
     name = Column(String)
     title = Column(String)
     company = Column(String)
@@ -26,10 +38,12 @@ class TargetContact(Base):
     connection_degree = Column(String)  # 1st, 2nd, 3rd
     
     # Beziehungen
-    user_id = Column(Integer, ForeignKey("user.id"))
+    user_id = Column(Integer, ForeignKey("users.id"))
     user = relationship("User", back_populates="target_contacts")
     
     # Metadaten
     last_contact_attempt = Column(String)  # ISO Format
     error_message = Column(Text)
-    notes = Column(Text)  # Für manuelle Notizen 
\ No newline at end of file
+    notes = Column(Text)  # Für manuelle Notizen
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now()) 
\ No newline at end of file
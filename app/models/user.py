@@ -18,6 +18,7 @@ class User(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # Beziehungen
-    posts = relationship("Post", back_populates="author")
+    posts = relationship("Post", back_populates="user")
     interactions = relationship("Interaction", back_populates="user")
-    target_contacts = relationship("TargetContact", back_populates="user") 
\ No newline at end of file
+    target_contacts = relationship("TargetContact", back_populates="user")
+    settings = relationship("Settings", back_populates="user", uselist=False) 
\ No newline at end of file
@@ -1,9 +1,21 @@
 from typing import Optional, List
-from pydantic import BaseModel
+from pydantic import BaseModel, validator
 from datetime import datetime
+import json
+import re
 
 from app.models.post import PostStatus
 
+
+def parse_hashtags(value) -> Optional[List[str]]:
+    """Hashtags aus der DB (JSON-Liste, komma- oder leerzeichengetrennt) als Liste."""
+    if value is None or isinstance(value, list):
+        return value
+    value = value.strip()
+    if value.startswith("["):
+        return json.loads(value)
+    return [tag for tag in re.split(r"[,\s]+", value) if tag]
+
 # Shared properties
 class PostBase(BaseModel):
     title: Optional[str] = None
@@ -16,10 +28,27 @@ class PostBase(BaseModel):
 class PostCreate(PostBase):
     title: str
     content: str
+    user_id: Optional[int] = None  # Account, über den der Post veröffentlicht wird
 
 # Properties to receive via API on update
 class PostUpdate(PostBase):
-    pass
+    user_id: Optional[int] = None
+
+# Bulk-Planung: ein Eintrag pro Post im Redaktionskalender
+class PostScheduleItem(BaseModel):
+    title: str
+    content: str
+    hashtags: Optional[List[str]] = None
+    scheduled_for: datetime
+
+class PostBulkSchedule(BaseModel):
+    user_id: int
+    posts: List[PostScheduleItem]
+
+class PostBulkScheduleResult(BaseModel):
+    created: int
+    ids: List[int]
+    first_due: Optional[datetime] = None
 
 # Properties shared by models stored in DB
 class PostInDBBase(PostBase):
@@ -36,6 +65,16 @@ class PostInDBBase(PostBase):
 class Post(PostInDBBase):
     pass
 
+# Vollständige API-Antwort inklusive KI- und LinkedIn-Metadaten
+class PostResponse(PostInDBBase):
+    user_id: Optional[int] = None
+    linkedin_post_id: Optional[str] = None
+    engagement_metrics: Optional[str] = None
+    ai_generated: Optional[bool] = None
+    ai_prompt: Optional[str] = None
+
+    _hashtags = validator("hashtags", pre=True, allow_reuse=True)(parse_hashtags)
+
 # Additional properties stored in DB
 class PostInDB(PostInDBBase):
     pass 
\ No newline at end of file
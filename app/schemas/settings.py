@@ -21,6 +21,7 @@ class SettingsBase(BaseModel):
     post_lengths: Optional[List[str]] = None
     post_hashtags: Optional[List[str]] = None
     message_templates: Optional[Dict[str, str]] = None
+    model_routes: Optional[Dict[str, str]] = None
     notification_settings: Optional[Dict[str, bool]] = None
     proxy_settings: Optional[Dict[str, str]] = None
     browser_settings: Optional[Dict[str, str]] = None
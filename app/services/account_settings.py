@@ -0,0 +1,179 @@
+"""Unveränderliche, vorab aufbereitete Account-Einstellungen für den Scheduler.
+
+Jobs lesen nicht mehr das ORM-Objekt (veraltet nach Änderungen, Lazy Loads auf
+geschlossenen Sessions), sondern einen ``AccountSettings``-Snapshot: Listen als Tupel,
+Dicts als schreibgeschützte Mappings, Suchanfrage und Filter fertig berechnet.
+``SettingsStore`` erkennt Änderungen, indem er ``updated_at`` jedes Accounts mit dem
+seines Snapshots vergleicht (kein globales Wasserzeichen: ``now()`` ist auf Postgres der
+Transaktionsbeginn, spät committete Änderungen lägen sonst davor), und tauscht den Snapshot
+eines Accounts als Ganzes aus (eine Zuweisung, kein halb aktualisierter Zustand).
+"""
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from types import MappingProxyType
+import logging
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+_EMPTY: Mapping = MappingProxyType({})
+
+
+def _strings(value) -> Tuple[str, ...]:
+    return tuple(str(item) for item in value or ())
+
+
+@dataclass(frozen=True, slots=True)
+class AccountSettings:
+    user_id: int
+    version: int
+    updated_at: Optional[datetime]
+
+    post_frequency: int
+    daily_connection_limit: Optional[int]
+    interaction_interval: Optional[int]
+    auto_publish_posts: bool
+    auto_approve_comments: bool
+
+    target_industries: Tuple[str, ...]
+    target_locations: Tuple[str, ...]
+    target_company_sizes: Tuple[str, ...]
+    target_positions: Tuple[str, ...]
+    target_seniority: Tuple[str, ...]
+    target_keywords: Tuple[str, ...]
+    excluded_keywords: Tuple[str, ...]
+    interaction_types: Tuple[str, ...]
+
+    post_topics: Tuple[str, ...]
+    post_tones: Tuple[str, ...]
+    post_lengths: Tuple[str, ...]
+    post_hashtags: Tuple[str, ...]
+
+    message_templates: Mapping[str, Tuple[str, ...]] = field(default_factory=lambda: _EMPTY)
+    model_routes: Mapping[str, str] = field(default_factory=lambda: _EMPTY)
+    browser_settings: Mapping = field(default_factory=lambda: _EMPTY)
+
+    # Vorab berechnet: Suchbegriff und URL-Filter der Profilsuche
+    search_query: str = ""
+    search_filters: Mapping[str, str] = field(default_factory=lambda: _EMPTY)
+
+    @classmethod
+    def from_model(cls, model: Settings, version: int = 0) -> "AccountSettings":
+        """Liest alle Spalten einmal aus, solange die Session noch offen ist."""
+        target_industries = _strings(model.target_industries)
+        target_locations = _strings(model.target_locations)
+        target_keywords = _strings(model.target_keywords)
+        return cls(
+            user_id=model.user_id,
+            version=version,
+            updated_at=model.updated_at or model.created_at,
+            post_frequency=model.post_frequency or 0,
+            daily_connection_limit=model.daily_connection_limit,
+            interaction_interval=model.interaction_interval,
+            auto_publish_posts=bool(model.auto_publish_posts),
+            auto_approve_comments=bool(model.auto_approve_comments),
+            target_industries=target_industries,
+            target_locations=target_locations,
+            target_company_sizes=_strings(model.target_company_sizes),
+            target_positions=_strings(model.target_positions),
+            target_seniority=_strings(model.target_seniority),
+            target_keywords=target_keywords,
+            excluded_keywords=_strings(model.excluded_keywords),
+            interaction_types=_strings(model.interaction_types),
+            post_topics=_strings(model.post_topics),
+            post_tones=_strings(model.post_tones),
+            post_lengths=_strings(model.post_lengths),
+            post_hashtags=_strings(model.post_hashtags),
+            message_templates=MappingProxyType({
+                kind: _strings(templates) for kind, templates in (model.message_templates or {}).items()
+            }),
+            model_routes=MappingProxyType(dict(model.model_routes or {})),
+            browser_settings=MappingProxyType(dict(model.browser_settings or {})),
+            search_query=" ".join(target_keywords),
+            search_filters=MappingProxyType({
+                key: ",".join(values)
+                for key, values in (("industry", target_industries), ("location", target_locations))
+                if values
+            })
+        )
+
+
+def snapshot(account_settings) -> AccountSettings:
+    """Snapshot aus einem ORM-Objekt; vorhandene Snapshots werden unverändert durchgereicht."""
+    if isinstance(account_settings, AccountSettings):
+        return account_settings
+    return AccountSettings.from_model(account_settings)
+
+
+class SettingsStore:
+    """Aktuelle Snapshots aller Accounts.
+
+    ``load``/``fetch_changed`` laufen mit einer Session im DB-Thread und bauen nur Snapshots;
+    ``apply`` tauscht sie im Event-Loop aus, vergibt die Version und benachrichtigt Listener.
+    """
+
+    def __init__(self):
+        self.snapshots: Dict[int, AccountSettings] = {}
+        self.version = 0
+        self._listeners: List[Callable[[AccountSettings, Optional[AccountSettings]], None]] = []
+
+    def add_listener(self, listener: Callable[[AccountSettings, Optional[AccountSettings]], None]) -> None:
+        """``listener(neu, alt)`` wird nach jedem Austausch aufgerufen."""
+        self._listeners.append(listener)
+
+    def get(self, user_id: int) -> Optional[AccountSettings]:
+        return self.snapshots.get(user_id)
+
+    @staticmethod
+    def load(db: Session, user_ids: Optional[Sequence[int]] = None) -> List[AccountSettings]:
+        """Snapshots aller (oder ausgewählter) Accounts für die Erstbefüllung."""
+        query = db.query(Settings)
+        if user_ids:
+            query = query.filter(Settings.user_id.in_(user_ids))
+        return [AccountSettings.from_model(model) for model in query.all()]
+
+    def fetch_changed(self, db: Session) -> List[AccountSettings]:
+        """Snapshots der Accounts, deren ``updated_at`` nicht mehr zu ihrem Snapshot passt.
+
+        Erst nur die Zeitstempel aller Accounts, vollständige Zeilen nur für geänderte.
+        """
+        if not self.snapshots:
+            return []
+        stamps = db.execute(
+            select(Settings.user_id, Settings.updated_at, Settings.created_at)
+            .where(Settings.user_id.in_(list(self.snapshots)))
+        )
+        changed = [
+            user_id for user_id, updated_at, created_at in stamps
+            if user_id in self.snapshots and (updated_at or created_at) != self.snapshots[user_id].updated_at
+        ]
+        if not changed:
+            return []
+        return [
+            AccountSettings.from_model(model)
+            for model in db.scalars(select(Settings).where(Settings.user_id.in_(changed)))
+        ]
+
+    def apply(self, snapshots: Sequence[AccountSettings]) -> List[AccountSettings]:
+        """Tauscht die Snapshots atomar aus (eine Zuweisung pro Account) und benachrichtigt."""
+        applied = []
+        for current in snapshots:
+            self.version += 1
+            current = replace(current, version=self.version)
+            previous = self.snapshots.get(current.user_id)
+            self.snapshots[current.user_id] = current
+            applied.append(current)
+            for listener in list(self._listeners):
+                try:
+                    listener(current, previous)
+                except Exception as e:
+                    logger.error(f"Fehler im Settings-Listener (User {current.user_id}): {str(e)}")
+        return applied
+
+    def remove(self, user_id: int) -> None:
+        self.snapshots.pop(user_id, None)
@@ -1,18 +1,25 @@
-from typing import List, Optional
-import openai
+from typing import Dict, List, Optional
 from datetime import datetime
 import json
 import logging
 
-from app.core.config import settings
+from app.core.tracing import traced
 from app.models.post import Post
+from app.services.candidate_selection import CandidateSelector, parse_analysis_batch, parse_comment_batch
+from app.services.model_router import ModelRouter
+from app.services.prompts import registry as prompt_registry
 
 logger = logging.getLogger(__name__)
 
 class AIService:
-    def __init__(self):
-        openai.api_key = settings.OPENAI_API_KEY
+    def __init__(self, model_routes: Optional[Dict[str, str]] = None):
+        self.router = ModelRouter(model_routes)
 
+    def set_model_routes(self, model_routes: Optional[Dict[str, str]]):
+        """Tauscht das Routing aus (geänderte Account-Einstellungen); laufende Aufrufe behalten das alte."""
+        self.router = ModelRouter(model_routes)
+
+    @traced("ai.generate_post_content")
     async def generate_post_content(
         self,
         topic: str,
@@ -29,31 +36,18 @@ class AIService:
                 "long": 300
             }.get(length, 200)
 
-            # Prompt erstellen
-            prompt = f"""
-            Erstelle einen LinkedIn-Post zum Thema: {topic}
-            
-            Anforderungen:
-            - Ton: {tone}
-            - Länge: {length_tokens} Wörter
-            - Format: Professionell, aber persönlich
-            - Struktur: Einleitung, Hauptteil, Call-to-Action
-            - Hashtags: {', '.join(hashtags) if hashtags else 'Relevante Hashtags'}
-            
-            Der Post soll:
-            - Wertvolle Insights bieten
-            - Engagement fördern
-            - Authentisch wirken
-            - LinkedIn-Best-Practices folgen
-            """
+            prompt = prompt_registry.render(
+                "post",
+                topic=topic,
+                tone=tone,
+                length=f"{length_tokens} Wörter",
+                hashtags=", ".join(hashtags) if hashtags else "Relevante Hashtags"
+            )
 
             # GPT API aufrufen
-            response = await openai.ChatCompletion.acreate(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "Du bist ein erfahrener LinkedIn-Content-Creator."},
-                    {"role": "user", "content": prompt}
-                ],
+            response = await self.router.acomplete(
+                "post",
+                prompt.messages,
                 max_tokens=length_tokens,
                 temperature=0.7
             )
@@ -69,6 +63,8 @@ class AIService:
                 "content": content,
                 "hashtags": hashtags,
                 "ai_generated": True,
+                "prompt_ref": prompt.ref,
+                "prompt_tokens": prompt.tokens,
                 "generation_time": datetime.utcnow().isoformat()
             }
 
@@ -76,71 +72,195 @@ class AIService:
             logger.error(f"Fehler bei der Content-Generierung: {str(e)}")
             raise
 
-    async def generate_comment(self, post_content: str) -> str:
-        """Generiert einen passenden Kommentar für einen LinkedIn-Post."""
+    @traced("ai.generate_comment")
+    async def generate_comment(
+        self,
+        post_content: str,
+        tone: str = "professionell und freundlich",
+        n: int = 1,
+        selector: Optional[CandidateSelector] = None
+    ) -> str:
+        """Generiert einen passenden Kommentar für einen LinkedIn-Post (bei n > 1 lokal ausgewählt)."""
         try:
-            prompt = f"""
-            Erstelle einen kurzen, engagierenden Kommentar für diesen LinkedIn-Post:
-            
-            {post_content}
-            
-            Der Kommentar soll:
-            - Den Hauptpunkt des Posts aufgreifen
-            - Einen Mehrwert bieten
-            - Zur Diskussion anregen
-            - Professionell und freundlich sein
-            - Maximal 2-3 Sätze lang sein
-            """
-
-            response = await openai.ChatCompletion.acreate(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "Du bist ein erfahrener LinkedIn-Networker."},
-                    {"role": "user", "content": prompt}
-                ],
+            prompt = prompt_registry.render("comment", post_content=post_content, tone=tone)
+
+            response = await self.router.acomplete(
+                "comment",
+                prompt.messages,
                 max_tokens=100,
-                temperature=0.7
+                temperature=0.7,
+                n=n
             )
 
-            return response.choices[0].message.content
+            return self._select(response, selector)
 
         except Exception as e:
             logger.error(f"Fehler bei der Kommentar-Generierung: {str(e)}")
             raise
 
+    @traced("ai.generate_comments_batch")
+    async def generate_comments_batch(
+        self,
+        posts: List[Dict],
+        tone: str = "professionell und freundlich",
+        variants: int = 1,
+        selector: Optional[CandidateSelector] = None
+    ) -> Dict[str, str]:
+        """Generiert Kommentare für mehrere Posts in einem Request (strukturierte JSON-Antwort)."""
+        if not posts:
+            return {}
+        try:
+            prompt = prompt_registry.render(
+                "comment_batch",
+                tone=tone,
+                variants=variants,
+                posts="\n".join(
+                    json.dumps({"id": str(post["id"]), "content": post["content"]}, ensure_ascii=False)
+                    for post in posts
+                )
+            )
+
+            response = await self.router.acomplete(
+                "comment_batch",
+                prompt.messages,
+                max_tokens=120 * variants * len(posts),
+                temperature=0.7
+            )
+
+            selector = selector or CandidateSelector()
+            comments = {}
+            for post_id, candidates in parse_comment_batch(response.choices[0].message.content).items():
+                comment = selector.select(candidates)
+                if comment:
+                    selector.remember(comment)
+                    comments[post_id] = comment
+            return comments
+
+        except Exception as e:
+            logger.error(f"Fehler bei der Batch-Kommentar-Generierung: {str(e)}")
+            raise
+
+    @traced("ai.generate_connection_message")
+    async def generate_connection_message(
+        self,
+        profile_info: Dict[str, str],
+        template: str,
+        n: int = 1,
+        selector: Optional[CandidateSelector] = None
+    ) -> str:
+        """Generiert eine personalisierte Verbindungsnachricht (bei n > 1 lokal ausgewählt)."""
+        try:
+            prompt = prompt_registry.render(
+                "connection_message",
+                name=profile_info.get("name"),
+                title=profile_info.get("title"),
+                template=template
+            )
+
+            response = await self.router.acomplete(
+                "connection_message",
+                prompt.messages,
+                max_tokens=150,
+                temperature=0.7,
+                n=n
+            )
+
+            return self._select(response, selector)
+
+        except Exception as e:
+            logger.error(f"Fehler bei der Nachrichten-Generierung: {str(e)}")
+            raise
+
+    @traced("ai.generate_follow_up_message")
+    async def generate_follow_up_message(self, profile_info: Dict[str, str], template: str) -> str:
+        """Generiert eine Follow-up-Nachricht nach der Vernetzung."""
+        try:
+            prompt = prompt_registry.render(
+                "follow_up_message",
+                name=profile_info.get("name"),
+                title=profile_info.get("title"),
+                template=template
+            )
+
+            response = await self.router.acomplete(
+                "follow_up_message",
+                prompt.messages,
+                max_tokens=150,
+                temperature=0.7
+            )
+
+            return response.choices[0].message.content.strip()
+
+        except Exception as e:
+            logger.error(f"Fehler bei der Follow-up-Generierung: {str(e)}")
+            raise
+
+    @traced("ai.analyze_post_engagement")
     async def analyze_post_engagement(self, post: Post) -> dict:
         """Analysiert die Engagement-Metriken eines Posts und gibt Verbesserungsvorschläge."""
         try:
             metrics = json.loads(post.engagement_metrics) if post.engagement_metrics else {}
             
-            prompt = f"""
-            Analysiere diese LinkedIn-Post-Metriken und gib Verbesserungsvorschläge:
-            
-            Post-Inhalt: {post.content}
-            Metriken: {json.dumps(metrics, indent=2)}
-            
-            Bitte analysiere:
-            1. Engagement-Rate
-            2. Kommentar-Qualität
-            3. Reichweite
-            4. Verbesserungspotenzial
-            """
-
-            response = await openai.ChatCompletion.acreate(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "Du bist ein LinkedIn-Content-Analyst."},
-                    {"role": "user", "content": prompt}
-                ],
+            prompt = prompt_registry.render(
+                "engagement_analysis",
+                content=post.content,
+                metrics=json.dumps(metrics, ensure_ascii=False)
+            )
+
+            response = await self.router.acomplete(
+                "engagement_analysis",
+                prompt.messages,
                 max_tokens=300,
                 temperature=0.7
             )
 
             return {
                 "analysis": response.choices[0].message.content,
+                "prompt_ref": prompt.ref,
                 "analysis_time": datetime.utcnow().isoformat()
             }
 
         except Exception as e:
             logger.error(f"Fehler bei der Post-Analyse: {str(e)}")
-            raise 
\ No newline at end of file
+            raise 
+
+    @traced("ai.analyze_posts_engagement")
+    async def analyze_posts_engagement(self, posts: List[Dict]) -> Dict[str, dict]:
+        """Analysiert mehrere Posts (``id``, ``content``, ``metrics``) in einem Request."""
+        if not posts:
+            return {}
+        try:
+            prompt = prompt_registry.render(
+                "engagement_analysis_batch",
+                posts="\n".join(
+                    json.dumps(
+                        {"id": str(post["id"]), "content": post["content"], "metrics": post["metrics"]},
+                        ensure_ascii=False
+                    )
+                    for post in posts
+                )
+            )
+
+            response = await self.router.acomplete(
+                "engagement_analysis",
+                prompt.messages,
+                max_tokens=300 * len(posts),
+                temperature=0.7
+            )
+
+            analysis_time = datetime.utcnow().isoformat()
+            return {
+                post_id: {"analysis": analysis, "prompt_ref": prompt.ref, "analysis_time": analysis_time}
+                for post_id, analysis in parse_analysis_batch(response.choices[0].message.content).items()
+            }
+
+        except Exception as e:
+            logger.error(f"Fehler bei der Batch-Post-Analyse: {str(e)}")
+            raise
+
+    def _select(self, response, selector: Optional[CandidateSelector]) -> str:
+        """Wählt aus den zurückgegebenen Choices lokal die beste Variante aus."""
+        candidates = [choice.message.content for choice in response.choices]
+        if len(candidates) == 1 and selector is None:
+            return candidates[0]
+        return (selector or CandidateSelector()).select(candidates) or ""
@@ -0,0 +1,87 @@
+"""Gemeinsame Schnittstelle für die Browser-Automatisierung.
+
+Der Scheduler arbeitet nur gegen ``BrowserBackend``; die Playwright-Implementierung
+steckt in ``app.services.linkedin_service``. Alle Methoden sind async, damit die Jobs
+aller Accounts auf einem Event-Loop laufen.
+
+Lesende Methoden liefern None, wenn die Seite nicht lesbar war (Timeout, geänderter
+Selektor, Checkpoint), und eine leere Liste nur, wenn es tatsächlich nichts gibt.
+
+Profile und Beiträge werden als Dicts mit einheitlichen Schlüsseln geliefert:
+
+- Profil: ``id``, ``name``, ``title``, ``company``, ``location``, ``degree``, ``url``
+- Beitrag: ``id``, ``url``, ``name``, ``content``
+- Beitragszahlen: ``likes``, ``comments``, ``shares``
+"""
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+from app.models.post import Post
+
+
+class BackendUnavailable(RuntimeError):
+    """Eine Seite war nicht lesbar; für den Circuit Breaker ein Fehlschlag, kein "nichts zu tun"."""
+
+
+class BrowserBackend(ABC):
+    is_logged_in: bool = False
+
+    @abstractmethod
+    async def initialize(self, browser=None):
+        """Startet (oder teilt) den Browser und meldet sich an."""
+
+    @abstractmethod
+    async def close(self):
+        """Gibt Seite/Kontext (und ggf. den eigenen Browser) frei."""
+
+    @abstractmethod
+    async def create_post(self, post: Post, publish: bool = True) -> bool:
+        """Veröffentlicht einen Beitrag oder speichert ihn als Entwurf."""
+
+    @abstractmethod
+    async def like_post(self, post_url: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def comment_on_post(self, post_url: str, comment: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def share_post(self, post_url: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def send_connection_request(self, profile_url: str, message: Optional[str] = None) -> bool:
+        ...
+
+    @abstractmethod
+    async def send_message(self, profile_url: str, message: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def follow_profile(self, profile_url: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def search_profiles(self, keywords: List[str], filters: Optional[Dict] = None) -> Optional[List[Dict]]:
+        """Suchtreffer; None, wenn die Suche fehlgeschlagen ist."""
+
+    @abstractmethod
+    async def get_sent_invitations(self) -> Optional[List[str]]:
+        """Alle Profil-URLs der offenen gesendeten Einladungen; None, wenn die Liste nicht vollständig lesbar ist."""
+
+    @abstractmethod
+    async def get_connections(self) -> Optional[List[str]]:
+        """Profil-URLs der Kontakte (neueste zuerst); None, wenn die Liste nicht lesbar ist."""
+
+    @abstractmethod
+    async def get_feed_posts(self, limit: int = 10) -> Optional[List[Dict]]:
+        """Beitrags-Links aus dem Feed (``id`` und ``url``); None, wenn der Feed nicht lesbar ist."""
+
+    @abstractmethod
+    async def get_post(self, post_url: str) -> Optional[Dict]:
+        """Öffnet einen Beitrag und liest Autor und Text."""
+
+    @abstractmethod
+    async def get_post_stats(self, post_url: str) -> Optional[Dict]:
+        """Liest die Engagement-Zahlen eines Beitrags; None, wenn die Seite nicht lesbar ist."""
@@ -0,0 +1,137 @@
+from typing import Iterable, List, Optional, Set
+import json
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+_HASHTAG = re.compile(r"(?<!\w)#\w+", re.UNICODE)
+
+# Ab dieser Wort-Überlappung gilt ein Kandidat als Wiederholung
+DUPLICATE_SIMILARITY = 0.8
+
+
+def normalize_text(text: str) -> str:
+    """Reduziert einen Text auf Kleinbuchstaben-Wörter für Duplikatvergleiche."""
+    return " ".join(_WORD.findall(text.lower()))
+
+
+def _shingles(normalized: str, size: int = 3) -> Set[str]:
+    words = normalized.split()
+    if len(words) < size:
+        return {normalized} if normalized else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def _jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class CandidateSelector:
+    """Wählt lokal den besten von mehreren KI-Kandidaten aus (ohne weitere API-Calls)."""
+
+    def __init__(
+        self,
+        recent_texts: Iterable[str] = (),
+        min_chars: int = 40,
+        max_chars: int = 400,
+        max_hashtags: int = 0,
+        prefer_question: bool = False
+    ):
+        self.min_chars = min_chars
+        self.max_chars = max_chars
+        self.max_hashtags = max_hashtags
+        self.prefer_question = prefer_question
+
+        # Zuletzt gesendete Texte einmalig vorverarbeiten
+        self._recent_normalized: Set[str] = set()
+        self._recent_shingles: List[Set[str]] = []
+        for text in recent_texts:
+            if not text:
+                continue
+            normalized = normalize_text(text)
+            self._recent_normalized.add(normalized)
+            self._recent_shingles.append(_shingles(normalized))
+
+    def remember(self, text: str):
+        """Nimmt einen gesendeten Text in die Duplikatprüfung auf."""
+        normalized = normalize_text(text)
+        self._recent_normalized.add(normalized)
+        self._recent_shingles.append(_shingles(normalized))
+
+    def score(self, text: Optional[str]) -> Optional[float]:
+        """Bewertet einen Kandidaten; None bedeutet verworfen."""
+        if not text or not text.strip():
+            return None
+        text = text.strip()
+        normalized = normalize_text(text)
+        if not normalized or normalized in self._recent_normalized:
+            return None
+
+        shingles = _shingles(normalized)
+        similarity = max((_jaccard(shingles, other) for other in self._recent_shingles), default=0.0)
+        if similarity >= DUPLICATE_SIMILARITY:
+            return None
+
+        score = 1.0 - similarity
+
+        # Länge außerhalb des Zielbereichs bestrafen
+        length = len(text)
+        if length < self.min_chars:
+            score -= (self.min_chars - length) / self.min_chars
+        elif length > self.max_chars:
+            score -= (length - self.max_chars) / self.max_chars
+
+        # Überzählige Hashtags bestrafen
+        hashtags = len(_HASHTAG.findall(text))
+        if hashtags > self.max_hashtags:
+            score -= 0.25 * (hashtags - self.max_hashtags)
+
+        if self.prefer_question and "?" in text:
+            score += 0.1
+
+        return score
+
+    def select(self, candidates: Iterable[str]) -> Optional[str]:
+        """Liefert den bestbewerteten Kandidaten oder None, wenn alle verworfen wurden."""
+        best = None
+        best_score = None
+        for candidate in candidates:
+            score = self.score(candidate)
+            if score is not None and (best_score is None or score > best_score):
+                best = candidate.strip()
+                best_score = score
+        if best is None:
+            logger.info("Alle KI-Kandidaten wurden verworfen (leer oder Duplikat)")
+        return best
+
+
+def _json_object(content: str) -> dict:
+    # Eventuelle Markdown-Codeblöcke um das JSON ignorieren
+    start, end = content.find("{"), content.rfind("}")
+    if start == -1 or end == -1:
+        raise ValueError("Antwort enthält kein JSON-Objekt")
+    return json.loads(content[start:end + 1])
+
+
+def parse_comment_batch(content: str) -> dict:
+    """Liest die JSON-Antwort eines Batch-Kommentar-Prompts als {Post-ID: [Varianten]}."""
+    data = _json_object(content)
+    result = {}
+    for item in data.get("comments", []):
+        variants = item.get("variants") or ([item["comment"]] if item.get("comment") else [])
+        result[str(item.get("id"))] = [v for v in variants if isinstance(v, str)]
+    return result
+
+
+def parse_analysis_batch(content: str) -> dict:
+    """Liest die JSON-Antwort eines Batch-Analyse-Prompts als {Post-ID: Analyse}."""
+    data = _json_object(content)
+    return {
+        str(item.get("id")): item["analysis"]
+        for item in data.get("analyses", [])
+        if isinstance(item.get("analysis"), str)
+    }
@@ -0,0 +1,158 @@
+"""Circuit Breaker pro Account und Aktion für die LinkedIn-Automatisierung.
+
+Ändert LinkedIn einen Selektor oder zeigt einen Checkpoint, schlägt jede Aktion erst nach
+vollen Selektor-Timeouts fehl. Nach ``BREAKER_FAILURE_THRESHOLD`` Fehlschlägen in Folge
+wird die Aktion des Accounts pausiert (OPEN). Nach der Pause lässt der Breaker genau einen
+Probeaufruf durch (HALF_OPEN): Erfolg schließt ihn wieder, ein Fehlschlag verdoppelt die
+Pause bis ``BREAKER_MAX_COOLDOWN``. Jeder Zustandswechsel wird geloggt, gezählt und als
+Span aufgezeichnet.
+"""
+from typing import Callable, Deque, Dict, Optional, Tuple
+from collections import deque
+from functools import wraps
+import enum
+import logging
+import time
+
+from app.core.config import settings
+from app.core.metrics import CIRCUIT_BREAKER_REJECTED, CIRCUIT_BREAKER_TRANSITIONS
+from app.core.tracing import record_span
+from app.services.browser import BackendUnavailable
+
+logger = logging.getLogger(__name__)
+
+
+class BreakerState(str, enum.Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        user_id: int,
+        action: str,
+        threshold: Optional[int] = None,
+        cooldown: Optional[float] = None,
+        max_cooldown: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.user_id = user_id
+        self.action = action
+        self.threshold = threshold or settings.BREAKER_FAILURE_THRESHOLD
+        self.base_cooldown = cooldown or settings.BREAKER_COOLDOWN
+        self.max_cooldown = max_cooldown or settings.BREAKER_MAX_COOLDOWN
+        self.clock = clock
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.cooldown = self.base_cooldown
+        self.opened_at: Optional[float] = None
+        self._probing = False
+        # (Zeitpunkt, von, nach, Grund) der letzten Wechsel
+        self.transitions: Deque[Tuple[float, str, str, str]] = deque(maxlen=50)
+
+    def allow(self) -> bool:
+        """True, wenn die Aktion laufen darf; im HALF_OPEN-Zustand nur ein Probeaufruf."""
+        if self.state == BreakerState.CLOSED:
+            return True
+        if self.state == BreakerState.OPEN:
+            if self.clock() - self.opened_at < self.cooldown:
+                CIRCUIT_BREAKER_REJECTED.labels(self.action).inc()
+                return False
+            self._transition(BreakerState.HALF_OPEN, "Pause abgelaufen")
+        if self._probing:
+            CIRCUIT_BREAKER_REJECTED.labels(self.action).inc()
+            return False
+        self._probing = True
+        return True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._probing = False
+        if self.state != BreakerState.CLOSED:
+            self.cooldown = self.base_cooldown
+            self._transition(BreakerState.CLOSED, "Probeaufruf erfolgreich")
+
+    def record_failure(self, reason: str = "failure") -> None:
+        self.failures += 1
+        if self.state == BreakerState.HALF_OPEN:
+            self._probing = False
+            self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+            self._open(f"Probeaufruf fehlgeschlagen ({reason})")
+        elif self.state == BreakerState.CLOSED and self.failures >= self.threshold:
+            self._open(f"{self.failures} Fehlschläge in Folge ({reason})")
+
+    def release(self) -> None:
+        """Aufruf ohne Ergebnis (nichts zu tun): ein laufender Probeaufruf zählt nicht."""
+        self._probing = False
+
+    def _open(self, reason: str) -> None:
+        self.opened_at = self.clock()
+        self._transition(BreakerState.OPEN, reason)
+
+    def _transition(self, state: BreakerState, reason: str) -> None:
+        previous, self.state = self.state, state
+        self.transitions.append((time.time(), previous.value, state.value, reason))
+        CIRCUIT_BREAKER_TRANSITIONS.labels(self.action, previous.value, state.value).inc()
+        record_span(
+            "circuit_breaker.transition", 0.0,
+            user_id=self.user_id, action=self.action, from_state=previous.value, to_state=state.value, reason=reason
+        )
+        message = f"Circuit Breaker {self.action} (User {self.user_id}): {previous.value} -> {state.value}, {reason}"
+        if state == BreakerState.OPEN:
+            logger.warning(f"{message}; Pause {self.cooldown:.0f}s")
+        else:
+            logger.info(message)
+
+
+class CircuitBreakers:
+    """Breaker eines Accounts, einer pro Aktion (bei Bedarf angelegt)."""
+
+    def __init__(self, user_id: int):
+        self.user_id = user_id
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def __getitem__(self, action: str) -> CircuitBreaker:
+        breaker = self._breakers.get(action)
+        if breaker is None:
+            breaker = self._breakers[action] = CircuitBreaker(self.user_id, action)
+        return breaker
+
+    def states(self) -> Dict[str, str]:
+        return {action: breaker.state.value for action, breaker in self._breakers.items()}
+
+
+def guarded(action: str):
+    """Decorator für perform_*-Methoden eines Workers mit ``breakers``.
+
+    Rückgabewert True zählt als Erfolg, False oder ``BackendUnavailable`` als Fehlschlag,
+    None (nichts zu tun) als keins von beiden. Nicht lesbare Seiten müssen die Methoden
+    daher als False bzw. ``BackendUnavailable`` melden, nicht als None. Andere Exceptions
+    (KI-Timeouts, Router, Konfiguration, DB) sagen nichts über LinkedIn: sie geben den
+    Versuch frei und werden weitergereicht. Bei offenem Breaker wird nichts ausgeführt.
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            breaker = self.breakers[action]
+            if not breaker.allow():
+                logger.debug(f"{action} für User {self.user_id} pausiert (Circuit Breaker {breaker.state.value})")
+                return None
+            try:
+                value = await func(self, *args, **kwargs)
+            except BackendUnavailable as e:
+                breaker.record_failure(type(e).__name__)
+                raise
+            except Exception:
+                breaker.release()
+                raise
+            if value is None:
+                breaker.release()
+            elif value:
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+            return value
+        return wrapper
+    return decorator
@@ -0,0 +1,166 @@
+"""Abgleich der gesendeten Verbindungsanfragen mit LinkedIn.
+
+Pro Lauf werden "Kontakte" und "Gesendete Einladungen" je einmal gelesen und als Mengen
+normalisierter Profil-URLs mit den offenen Anfragen (``ContactStatus.PENDING``) verglichen:
+unter den Kontakten -> CONNECTED; weder dort noch unter den Einladungen (und vor mehr als
+``CONNECTION_REJECT_AFTER_HOURS`` angefragt) -> REJECTED, also abgelehnt oder zurückgezogen.
+REJECTED wird nur gesetzt, wenn die Einladungsliste vollständig gelesen wurde; sonst bleiben
+fehlende Anfragen offen.
+Importierte, aber nie angefragte Kontakte bleiben außen vor. Zielkontakte gehören je
+einem Account; ``last_contact_attempt`` ist ein UTC-Zeitstempel im ISO-Format. Alle
+Änderungen gehen als ein Bulk-Update in die DB; zurückgegeben werden nur die neu
+angenommenen Kontakte, damit genau diese eine Follow-up-Nachricht bekommen.
+"""
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+from datetime import timedelta
+import logging
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.clock import utcnow
+from app.core.config import settings
+from app.core.tracing import span
+from app.db.session import run_in_session
+from app.models.interaction import Interaction, InteractionType
+from app.models.target_contact import TargetContact, ContactStatus
+from app.services.browser import BrowserBackend
+from app.services.contact_import import normalize_profile_url, upsert_contacts
+
+logger = logging.getLogger(__name__)
+
+
+def _normalized(urls: Iterable[Optional[str]]) -> Set[str]:
+    return {url for url in map(normalize_profile_url, urls) if url}
+
+
+def _profile(row) -> Dict:
+    """Kontakt im Profil-Format des ``BrowserBackend`` (``id`` = Profil-URL)."""
+    return {"id": row.profile_url, "url": row.profile_url, "name": row.name, "title": row.title, "company": row.company}
+
+
+class ConnectionTracker:
+    """Hält den Status der Verbindungsanfragen eines Accounts aktuell."""
+
+    def __init__(self, user_id: int, backend: BrowserBackend):
+        self.user_id = user_id
+        self.backend = backend
+
+    def unknown(self, db: Session, profiles: Sequence[Dict]) -> List[Dict]:
+        """Suchtreffer, die der Account weder angefragt noch anders entschieden hat.
+
+        Importierte Kontakte, die noch offen und nie angefragt sind, gelten als unbekannt.
+        """
+        urls = _normalized(profile["url"] for profile in profiles)
+        if not urls:
+            return []
+        known = set(db.scalars(
+            select(TargetContact.profile_url)
+            .where(
+                TargetContact.user_id == self.user_id,
+                TargetContact.profile_url.in_(urls),
+                or_(
+                    TargetContact.last_contact_attempt.isnot(None),
+                    TargetContact.status != ContactStatus.PENDING
+                )
+            )
+        ))
+        return [profile for profile in profiles if normalize_profile_url(profile["url"]) not in known]
+
+    def record_requests(self, db: Session, profiles: Sequence[Dict], keywords: Sequence[str] = ()) -> int:
+        """Speichert gesendete Anfragen als offene Zielkontakte des Accounts (ein Upsert für alle)."""
+        attempted_at = utcnow().isoformat()
+        rows = [
+            {
+                "profile_url": normalize_profile_url(profile["url"]),
+                "name": profile.get("name") or None,
+                "title": profile.get("title") or None,
+                "company": profile.get("company") or None,
+                "location": profile.get("location") or None,
+                "connection_degree": profile.get("degree") or None,
+                "keywords": ",".join(keywords) or None,
+                "user_id": self.user_id,
+                "status": ContactStatus.PENDING,
+                "last_contact_attempt": attempted_at
+            }
+            for profile in profiles if normalize_profile_url(profile["url"])
+        ]
+        return upsert_contacts(db, rows, overwrite=("status", "last_contact_attempt"))
+
+    def pending(self, db: Session) -> Dict[str, tuple]:
+        """Gesendete, noch offene Anfragen des Accounts nach Profil-URL."""
+        rows = db.execute(
+            select(
+                TargetContact.id, TargetContact.profile_url, TargetContact.name,
+                TargetContact.title, TargetContact.company, TargetContact.last_contact_attempt
+            )
+            .where(
+                TargetContact.user_id == self.user_id,
+                TargetContact.status == ContactStatus.PENDING,
+                TargetContact.last_contact_attempt.isnot(None)
+            )
+        )
+        return {row.profile_url: row for row in rows}
+
+    @staticmethod
+    def save(db: Session, updates: List[Dict]) -> None:
+        """Schreibt alle Statuswechsel eines Laufs als ein Bulk-Update per Primärschlüssel."""
+        if updates:
+            db.execute(update(TargetContact), updates)
+            db.commit()
+
+    def next_follow_up(self, db: Session) -> Optional[Dict]:
+        """Zuletzt angenommener Kontakt, der noch keine Nachricht bekommen hat."""
+        messaged = select(Interaction.target_id).where(
+            Interaction.user_id == self.user_id,
+            Interaction.type == InteractionType.MESSAGE,
+            Interaction.target_id.isnot(None)
+        )
+        row = db.execute(
+            select(TargetContact.profile_url, TargetContact.name, TargetContact.title, TargetContact.company)
+            .where(
+                TargetContact.user_id == self.user_id,
+                TargetContact.status == ContactStatus.CONNECTED,
+                TargetContact.profile_url.not_in(messaged)
+            )
+            .order_by(TargetContact.updated_at.desc())
+            .limit(1)
+        ).first()
+        return _profile(row) if row else None
+
+    async def sync(self) -> List[Dict]:
+        """Ein Abgleich; liefert die seit dem letzten Lauf angenommenen Kontakte."""
+        with span("connections.sync", user_id=self.user_id):
+            pending = await run_in_session(self.pending)
+            if not pending:
+                return []
+
+            connections = await self.backend.get_connections()
+            if connections is None:
+                return []
+            connected = _normalized(connections)
+            # Ohne vollständige Einladungsliste lässt sich "abgelehnt" nicht von "offen" unterscheiden
+            invitations = await self.backend.get_sent_invitations()
+            invited = _normalized(invitations) if invitations is not None else None
+
+            now = utcnow()
+            cutoff = (now - timedelta(hours=settings.CONNECTION_REJECT_AFTER_HOURS)).isoformat()
+            accepted, updates, rejected = [], [], 0
+            for url in pending.keys() & connected:
+                accepted.append(_profile(pending[url]))
+                updates.append({"id": pending[url].id, "status": ContactStatus.CONNECTED, "updated_at": now})
+            if invited is not None:
+                for url in pending.keys() - connected - invited:
+                    # Frisch gesendet: taucht evtl. noch nicht in der Einladungsliste auf
+                    if pending[url].last_contact_attempt > cutoff:
+                        continue
+                    updates.append({"id": pending[url].id, "status": ContactStatus.REJECTED, "updated_at": now})
+                    rejected += 1
+
+            await run_in_session(self.save, updates)
+
+        logger.info(
+            f"Verbindungsabgleich für User {self.user_id}: {len(pending)} offen, "
+            f"{len(accepted)} angenommen, {rejected} abgelehnt"
+        )
+        return accepted
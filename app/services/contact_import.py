@@ -0,0 +1,271 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, TextIO
+from itertools import islice
+from urllib.parse import urlsplit, urlunsplit, unquote
+import csv
+import io
+import json
+import logging
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.core.clock import utcnow
+from app.models.target_contact import TargetContact, ContactStatus
+
+logger = logging.getLogger(__name__)
+
+# Anzahl Datensätze pro Batch (Import-Upsert und Export-Cursor)
+CHUNK_SIZE = 1000
+
+SUPPORTED_FORMATS = ("csv", "jsonl")
+
+# Felder, die beim Import übernommen werden
+IMPORT_FIELDS = (
+    "profile_url",
+    "name",
+    "title",
+    "company",
+    "location",
+    "keywords",
+    "industry",
+    "connection_degree",
+    "notes",
+)
+
+# Felder, die bei bestehenden Kontakten aktualisiert werden (Status bleibt unangetastet)
+UPDATE_FIELDS = tuple(f for f in IMPORT_FIELDS if f != "profile_url")
+
+EXPORT_FIELDS = ("id",) + IMPORT_FIELDS + ("status", "user_id", "last_contact_attempt", "error_message")
+
+
+def normalize_profile_url(url: Optional[str]) -> Optional[str]:
+    """Normalisiert eine LinkedIn-Profil-URL auf eine kanonische Form."""
+    if not url:
+        return None
+    url = url.strip()
+    if not url:
+        return None
+    if "://" not in url:
+        url = "https://" + url.lstrip("/")
+
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    if host == "linkedin.com" or host.endswith(".linkedin.com"):
+        # Länder-Subdomains (de.linkedin.com, ...) zeigen auf dasselbe Profil
+        host = "www.linkedin.com"
+
+    path = unquote(parts.path).rstrip("/").lower()
+    if not host or not path:
+        return None
+
+    # Query-Parameter und Fragmente (Tracking etc.) verwerfen
+    return urlunsplit(("https", host, path, "", ""))
+
+
+def detect_format(filename: Optional[str], fmt: Optional[str] = None) -> str:
+    """Ermittelt das Dateiformat aus dem expliziten Parameter oder der Dateiendung."""
+    if fmt:
+        fmt = fmt.lower()
+    elif filename and "." in filename:
+        fmt = filename.rsplit(".", 1)[1].lower()
+        if fmt in ("ndjson", "json"):
+            fmt = "jsonl"
+    if fmt not in SUPPORTED_FORMATS:
+        raise ValueError(f"Nicht unterstütztes Format: {fmt}")
+    return fmt
+
+
+def iter_records(stream: TextIO, fmt: str) -> Iterator[Optional[Dict]]:
+    """Liest Datensätze zeilenweise aus einem CSV- oder JSONL-Stream.
+
+    Unbrauchbare JSONL-Zeilen (kein JSON, kein Objekt) kommen als None, damit der Import
+    sie als übersprungen zählt.
+    """
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+    elif fmt == "jsonl":
+        for line_number, line in enumerate(stream, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.warning(f"Ungültige JSONL-Zeile {line_number} übersprungen: {str(e)}")
+                record = None
+            if record is not None and not isinstance(record, dict):
+                logger.warning(f"JSONL-Zeile {line_number} ist kein Objekt, übersprungen")
+                record = None
+            yield record
+    else:
+        raise ValueError(f"Nicht unterstütztes Format: {fmt}")
+
+
+def iter_chunks(records: Iterable[Dict], size: int = CHUNK_SIZE) -> Iterator[List[Dict]]:
+    """Teilt einen Datensatz-Stream in Listen fester Größe."""
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _prepare_row(record: Optional[Dict], user_id: Optional[int]) -> Optional[Dict]:
+    """Bereitet einen Rohdatensatz für den Upsert vor; None, wenn er übersprungen wird."""
+    if not isinstance(record, dict):
+        return None
+    profile_url = normalize_profile_url(record.get("profile_url") or record.get("url"))
+    if not profile_url:
+        return None
+
+    row = {"profile_url": profile_url}
+    for field in UPDATE_FIELDS:
+        value = record.get(field)
+        if isinstance(value, (list, tuple)):
+            value = ",".join(str(v) for v in value)
+        if isinstance(value, str):
+            value = value.strip() or None
+        row[field] = value
+    if user_id is None and str(record.get("user_id") or "").isdigit():
+        user_id = int(record["user_id"])
+    row["user_id"] = user_id
+    return row
+
+
+def _upsert_statement(db: Session, rows: List[Dict], overwrite: Sequence[str] = (), owned: bool = True):
+    """Erstellt ein dialektspezifisches INSERT ... ON CONFLICT für die Zeilen.
+
+    ``owned``: alle Zeilen haben einen Account und treffen bestehende Kontakte über
+    (user_id, profile_url); sonst gibt es ohne Account eine Zeile je Profil-URL.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        insert = postgresql.insert
+    elif dialect == "sqlite":
+        insert = sqlite.insert
+    else:
+        raise ValueError(f"Upsert wird für {dialect} nicht unterstützt")
+
+    now = utcnow()
+    stmt = insert(TargetContact).values(
+        [{"status": ContactStatus.PENDING, **row, "created_at": now, "updated_at": now} for row in rows]
+    )
+    # Leere Importwerte überschreiben keine vorhandenen Daten
+    update = {
+        field: func.coalesce(stmt.excluded[field], getattr(TargetContact, field))
+        for field in UPDATE_FIELDS
+    }
+    # Felder, die immer den neuen Wert bekommen (z. B. Status nach einer Verbindungsanfrage)
+    for field in overwrite:
+        update[field] = stmt.excluded[field]
+    update["updated_at"] = now
+    if owned:
+        return stmt.on_conflict_do_update(index_elements=["user_id", "profile_url"], set_=update)
+    return stmt.on_conflict_do_update(
+        index_elements=["profile_url"], index_where=TargetContact.user_id.is_(None), set_=update
+    )
+
+
+def upsert_contacts(db: Session, rows: List[Dict], overwrite: Sequence[str] = ()) -> int:
+    """Fügt Kontakte batchweise ein bzw. aktualisiert sie anhand von Account und Profil-URL."""
+    # Duplikate innerhalb eines Batches würden ON CONFLICT zweimal dieselbe Zeile treffen lassen;
+    # zusammengeführt wie beim Upsert: spätere Werte gewinnen, leere überschreiben nichts
+    unique: Dict[tuple, Dict] = {}
+    for row in rows:
+        merged = unique.setdefault((row.get("user_id"), row["profile_url"]), {})
+        merged.update({field: value for field, value in row.items() if value is not None or field not in merged})
+    if not unique:
+        return 0
+
+    owned = [row for (user_id, _), row in unique.items() if user_id is not None]
+    unowned = [row for (user_id, _), row in unique.items() if user_id is None]
+    if owned:
+        db.execute(_upsert_statement(db, owned, overwrite))
+    if unowned:
+        db.execute(_upsert_statement(db, unowned, overwrite, owned=False))
+    db.commit()
+    return len(unique)
+
+
+def import_contacts(
+    db: Session,
+    stream: TextIO,
+    fmt: str,
+    user_id: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE
+) -> dict:
+    """Importiert Zielkontakte streamend aus CSV/JSONL mit konstantem Speicherbedarf."""
+    processed = 0
+    upserted = 0
+    skipped = 0
+
+    for chunk in iter_chunks(iter_records(stream, fmt), chunk_size):
+        rows = []
+        for record in chunk:
+            row = _prepare_row(record, user_id)
+            if row is None:
+                skipped += 1
+            else:
+                rows.append(row)
+        processed += len(chunk)
+
+        try:
+            upserted += upsert_contacts(db, rows)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Fehler beim Import-Batch (bis Datensatz {processed}): {str(e)}")
+            raise
+
+    logger.info(f"Kontaktimport abgeschlossen: {processed} gelesen, {upserted} übernommen, {skipped} übersprungen")
+    return {
+        "processed": processed,
+        "upserted": upserted,
+        "skipped": skipped
+    }
+
+
+def _export_value(value):
+    if isinstance(value, ContactStatus):
+        return value.value
+    return value
+
+
+def iter_export(
+    db: Session,
+    fmt: str,
+    user_id: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE
+) -> Iterator[str]:
+    """Exportiert Zielkontakte über einen serverseitigen Cursor als CSV/JSONL-Textblöcke."""
+    if fmt not in SUPPORTED_FORMATS:
+        raise ValueError(f"Nicht unterstütztes Format: {fmt}")
+
+    # Nur Spalten statt ORM-Objekte laden, damit die Identity-Map nicht wächst
+    stmt = select(*[getattr(TargetContact, field) for field in EXPORT_FIELDS]).order_by(TargetContact.id)
+    if user_id is not None:
+        stmt = stmt.where(TargetContact.user_id == user_id)
+
+    result = db.execute(stmt.execution_options(stream_results=True, yield_per=chunk_size))
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if fmt == "csv":
+        writer.writerow(EXPORT_FIELDS)
+
+    for partition in result.partitions():
+        for row in partition:
+            values = [_export_value(v) for v in row]
+            if fmt == "csv":
+                writer.writerow(values)
+            else:
+                buffer.write(json.dumps(dict(zip(EXPORT_FIELDS, values)), ensure_ascii=False))
+                buffer.write("\n")
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    remainder = buffer.getvalue()
+    if remainder:
+        yield remainder
@@ -0,0 +1,117 @@
+"""KI-Analyse der Post-Performance, nur wenn sich etwas Relevantes geändert hat.
+
+Jede Analyse wird am Post gespeichert, zusammen mit den Metriken zum Analysezeitpunkt und
+einem Hash über Inhalt und Prompt-Version. Eine neue Analyse gibt es nur, wenn der Hash
+nicht mehr passt oder sich eine Metrik über ``ANALYSIS_MIN_DELTA`` und
+``ANALYSIS_MIN_RELATIVE_CHANGE`` hinaus bewegt hat; sonst wird die gespeicherte geliefert.
+Fällige Posts werden in Gruppen von ``ANALYSIS_BATCH_SIZE`` in einem Prompt analysiert.
+"""
+from typing import TYPE_CHECKING, Dict, List, Optional
+from datetime import timedelta
+import hashlib
+import json
+import logging
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.core.clock import utcnow
+from app.core.config import settings
+from app.core.metrics import AI_CACHE
+from app.db.session import run_in_session
+from app.models.post import Post, PostStatus
+from app.services.prompts import registry as prompt_registry
+
+if TYPE_CHECKING:
+    from app.services.ai_service import AIService
+
+logger = logging.getLogger(__name__)
+
+PROMPT_NAME = "engagement_analysis_batch"
+
+
+def input_hash(content: Optional[str], prompt_ref: str) -> str:
+    """Hash über die Eingaben, die sich nicht über Schwellwerte vergleichen lassen."""
+    return hashlib.sha256(f"{prompt_ref}\n{content or ''}".encode("utf-8")).hexdigest()
+
+
+def metrics_moved(previous: Dict, current: Dict) -> bool:
+    """True, wenn eine Metrik absolut und relativ über die Schwellwerte gestiegen/gefallen ist."""
+    for key, min_delta in settings.ANALYSIS_MIN_DELTA.items():
+        before, after = previous.get(key, 0), current.get(key, 0)
+        delta = abs(after - before)
+        if delta >= min_delta and (before == 0 or delta / before >= settings.ANALYSIS_MIN_RELATIVE_CHANGE):
+            return True
+    return False
+
+
+class EngagementAnalyzer:
+    """Analysiert die veröffentlichten Posts eines Accounts mit so wenig KI-Aufrufen wie möglich."""
+
+    def __init__(self, user_id: int, ai_service: "AIService"):
+        self.user_id = user_id
+        self.ai_service = ai_service
+
+    def published_posts(self, db: Session) -> List:
+        """Posts mit Metriken, die seit mindestens 24 Stunden online sind."""
+        return (
+            db.query(
+                Post.id, Post.content, Post.engagement_metrics,
+                Post.engagement_analysis, Post.analysis_input_hash
+            )
+            .filter(
+                Post.user_id == self.user_id,
+                Post.status == PostStatus.PUBLISHED,
+                Post.published_at <= utcnow() - timedelta(hours=24),
+                Post.engagement_metrics.isnot(None)
+            )
+            .all()
+        )
+
+    @staticmethod
+    def save(db: Session, updates: List[Dict]) -> None:
+        if updates:
+            db.execute(update(Post), updates)
+            db.commit()
+
+    async def run(self) -> Dict[int, dict]:
+        """Liefert {Post-ID: Analyse}; neue Analysen nur für Posts mit relevanten Änderungen."""
+        prompt_ref = prompt_registry.get(PROMPT_NAME).ref
+        results, due = {}, []
+        for row in await run_in_session(self.published_posts):
+            metrics = json.loads(row.engagement_metrics)
+            digest = input_hash(row.content, prompt_ref)
+            stored = json.loads(row.engagement_analysis) if row.engagement_analysis else None
+            if stored and row.analysis_input_hash == digest and not metrics_moved(stored.get("metrics", {}), metrics):
+                AI_CACHE.labels("engagement_analysis", "hit").inc()
+                results[row.id] = stored
+                continue
+            AI_CACHE.labels("engagement_analysis", "miss").inc()
+            due.append({"id": row.id, "content": row.content, "metrics": metrics, "hash": digest})
+
+        updates = []
+        size = max(1, settings.ANALYSIS_BATCH_SIZE)
+        for start in range(0, len(due), size):
+            batch = due[start:start + size]
+            try:
+                analyses = await self.ai_service.analyze_posts_engagement(batch)
+            except Exception as e:
+                logger.error(f"Fehler bei der Post-Analyse (User {self.user_id}): {str(e)}")
+                continue
+            for post in batch:
+                analysis = analyses.get(str(post["id"]))
+                if analysis is None:
+                    continue
+                analysis = {**analysis, "metrics": post["metrics"]}
+                results[post["id"]] = analysis
+                updates.append({
+                    "id": post["id"],
+                    "engagement_analysis": json.dumps(analysis, ensure_ascii=False),
+                    "analysis_input_hash": post["hash"]
+                })
+
+        await run_in_session(self.save, updates)
+        logger.info(
+            f"Post-Analyse für User {self.user_id}: {len(updates)} neu, {len(results) - len(updates)} aus der DB"
+        )
+        return results
@@ -0,0 +1,142 @@
+"""Sammelt die Engagement-Zahlen veröffentlichter Beiträge.
+
+Frische Beiträge werden oft abgefragt, ältere immer seltener (``ENGAGEMENT_POLL_SCHEDULE``).
+Bleiben die Zahlen über mehrere Abrufe gleich, wächst der Abstand weiter, und nach
+``ENGAGEMENT_MAX_UNCHANGED`` Abrufen ohne Änderung wird der Beitrag gar nicht mehr
+abgefragt. Ist die Seite nicht lesbar, zählt das wie ein Abruf ohne Änderung; auch ein
+Beitrag, der schon älter als der letzte Abschnitt des Zeitplans ist, bekommt dann weitere
+Versuche im längsten Abstand. Pro Lauf wird nur geladen, was fällig ist, und alles in
+einem Commit geschrieben.
+Zeitstempel in der DB sind UTC (``app.core.clock``); ``collect`` liefert ``published_at``
+als lokale Zeit für die Posting-Slots.
+"""
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
+import json
+import logging
+
+from sqlalchemy import or_, update
+from sqlalchemy.orm import Session
+
+from app.core.clock import as_utc, to_local_naive, utcnow
+from app.core.config import settings
+from app.core.tracing import span
+from app.db.session import run_in_session
+from app.models.post import Post, PostStatus
+from app.services.browser import BrowserBackend
+
+logger = logging.getLogger(__name__)
+
+METRIC_KEYS = ("likes", "comments", "shares")
+
+
+def poll_interval(age: timedelta, unchanged: int) -> Optional[timedelta]:
+    """Abstand bis zum nächsten Abruf; None, wenn der Beitrag fertig ist."""
+    if unchanged >= settings.ENGAGEMENT_MAX_UNCHANGED:
+        return None
+    for max_hours, minutes in sorted(settings.ENGAGEMENT_POLL_SCHEDULE.items()):
+        if age < timedelta(hours=max_hours):
+            # Jeder Abruf ohne Änderung verdoppelt den Abstand
+            return timedelta(minutes=minutes) * 2 ** unchanged
+    return None
+
+
+def retry_interval(age: timedelta, unchanged: int) -> Optional[timedelta]:
+    """Abstand nach einem nicht lesbaren Abruf; None erst nach ``ENGAGEMENT_MAX_UNCHANGED`` Versuchen."""
+    if unchanged >= settings.ENGAGEMENT_MAX_UNCHANGED:
+        return None
+    interval = poll_interval(age, unchanged)
+    if interval is None:
+        interval = timedelta(minutes=max(settings.ENGAGEMENT_POLL_SCHEDULE.items())[1]) * 2 ** unchanged
+    return interval
+
+
+def metrics_delta(old: Dict, new: Dict) -> Dict[str, int]:
+    """Änderung seit dem letzten Abruf, nur für die bekannten Zähler."""
+    return {key: new.get(key, 0) - old.get(key, 0) for key in METRIC_KEYS}
+
+
+class EngagementCollector:
+    """Fragt die fälligen Beiträge eines Accounts ab und schreibt die Zahlen gesammelt zurück."""
+
+    def __init__(self, user_id: int, backend: BrowserBackend):
+        self.user_id = user_id
+        self.backend = backend
+
+    def due_posts(self, db: Session, now: datetime) -> List[Tuple]:
+        """Fällige Beiträge: noch nie abgefragt oder ``metrics_next_check_at`` erreicht."""
+        return (
+            db.query(
+                Post.id, Post.linkedin_post_id, Post.published_at,
+                Post.engagement_metrics, Post.metrics_unchanged_checks
+            )
+            .filter(
+                Post.user_id == self.user_id,
+                Post.status == PostStatus.PUBLISHED,
+                Post.linkedin_post_id.isnot(None),
+                Post.published_at.isnot(None),
+                or_(
+                    Post.metrics_checked_at.is_(None),
+                    Post.metrics_next_check_at <= now
+                )
+            )
+            .order_by(Post.metrics_next_check_at.asc().nullsfirst())
+            .limit(settings.ENGAGEMENT_POLL_BATCH)
+            .all()
+        )
+
+    @staticmethod
+    def save(db: Session, updates: List[Dict]) -> None:
+        """Schreibt alle Änderungen eines Laufs als ein Bulk-Update per Primärschlüssel."""
+        if updates:
+            db.execute(update(Post), updates)
+            db.commit()
+
+    def post_url(self, linkedin_post_id: str) -> str:
+        return f"{settings.LINKEDIN_BASE_URL}/feed/update/{linkedin_post_id}/"
+
+    async def collect(self) -> List[Tuple[int, datetime, Dict, Dict[str, int]]]:
+        """Ein Lauf; liefert (post_id, published_at, metrics, delta) der geänderten Beiträge."""
+        now = utcnow()
+        with span("engagement.collect", user_id=self.user_id):
+            due = await run_in_session(self.due_posts, now)
+            updates, changed = [], []
+            for post_id, linkedin_post_id, published_at, raw_metrics, unchanged in due:
+                published_at = as_utc(published_at)
+                stats = await self.backend.get_post_stats(self.post_url(linkedin_post_id))
+                if stats is None:
+                    # Seite nicht lesbar: Zahlen nicht anfassen, später erneut versuchen
+                    unchanged = (unchanged or 0) + 1
+                    interval = retry_interval(now - published_at, unchanged)
+                    updates.append({
+                        "id": post_id,
+                        "metrics_checked_at": now,
+                        "metrics_next_check_at": now + interval if interval else None,
+                        "metrics_unchanged_checks": unchanged
+                    })
+                    continue
+
+                old = json.loads(raw_metrics) if raw_metrics else {}
+                delta = metrics_delta(old, stats)
+                unchanged = (unchanged or 0) + 1 if raw_metrics and not any(delta.values()) else 0
+                interval = poll_interval(now - published_at, unchanged)
+                row = {
+                    "id": post_id,
+                    "metrics_checked_at": now,
+                    "metrics_next_check_at": now + interval if interval else None,
+                    "metrics_unchanged_checks": unchanged
+                }
+                if unchanged == 0:
+                    metrics = {**old, **stats}
+                    row["engagement_metrics"] = json.dumps(metrics)
+                    row["updated_at"] = now
+                    changed.append((post_id, to_local_naive(published_at), metrics, delta))
+                updates.append(row)
+
+            await run_in_session(self.save, updates)
+
+        if due:
+            logger.info(
+                f"Engagement für User {self.user_id}: {len(due)} Beiträge abgefragt, {len(changed)} geändert"
+            )
+        return changed
@@ -1,163 +1,458 @@
-from typing import Optional, List, Dict
-import json
-from datetime import datetime
-from playwright.async_api import async_playwright, Browser, Page
+from typing import TYPE_CHECKING, Optional, List, Dict, Tuple
+from urllib.parse import unquote, urlencode, urljoin
 import asyncio
 import random
 import logging
+import re
+import time
 
 from app.core.config import settings
+from app.core.metrics import BROWSER_NAVIGATIONS, BROWSER_NAVIGATION_DURATION, BROWSER_SELECTOR_WAIT
+from app.core.tracing import traced
 from app.models.post import Post, PostStatus
-from app.models.interaction import Interaction, InteractionType
-from app.models.target_contact import TargetContact, ContactStatus
+from app.services.browser import BrowserBackend
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page, Playwright
 
 logger = logging.getLogger(__name__)
 
-class LinkedInService:
-    def __init__(self):
-        self.browser: Optional[Browser] = None
-        self.page: Optional[Page] = None
+# Deutsche und englische Oberfläche in einem Selektor
+LIKE_BUTTON = "button.react-button__trigger, button[aria-label='Like']"
+CONNECT_BUTTON = "button[aria-label='Verbinden'], button[aria-label='Connect']"
+SEND_INVITE_BUTTON = "button[aria-label='Senden'], button[aria-label='Send now']"
+COMMENT_SUBMIT = ".comments-comment-box button[type='submit'], button[aria-label='Post']"
+
+# Profil-Links in "Gesendete Einladungen" und "Kontakte"
+SENT_INVITATION_LINKS = "a.invitation-card__link"
+CONNECTION_LINKS = "a.mn-connection-card__link"
+# Weitere Einträge: "Mehr anzeigen" (Endlos-Scroll) bzw. "Weiter" (Seitennavigation)
+LIST_MORE_BUTTON = "button.scaffold-finite-scroll__load-button, button.artdeco-pagination__button--next:not([disabled])"
+
+# Zählerfelder unter einem Beitrag; fehlende Felder zählen als 0
+POST_STATS = {
+    "likes": ".social-details-social-counts__reactions-count",
+    "comments": ".social-details-social-counts__comments",
+    "shares": ".social-details-social-counts__item--reposts",
+}
+# Link "Beitrag ansehen" in der Erfolgsmeldung nach dem Posten
+POST_SUCCESS_LINK = ".post-success-message a[href]"
+
+# /feed/update/urn:li:activity:123/ (auch URL-kodiert) bzw. /posts/name_titel-activity-123-abcd/
+POST_URN = re.compile(r"urn:li:(?:activity|share|ugcPost):\d+")
+POST_ACTIVITY_SLUG = re.compile(r"-activity-(\d+)")
+
+
+def post_id_from_url(url: Optional[str]) -> Optional[str]:
+    """LinkedIn-ID (URN) eines Beitrags aus seiner URL; None, wenn die URL keine enthält."""
+    url = unquote(url or "")
+    match = POST_URN.search(url)
+    if match:
+        return match.group(0)
+    match = POST_ACTIVITY_SLUG.search(url)
+    return f"urn:li:activity:{match.group(1)}" if match else None
+
+
+async def launch_browser() -> Tuple["Playwright", "Browser"]:
+    """Startet Playwright und einen Chromium-Browser, den mehrere Accounts teilen können."""
+    # Playwright erst bei Bedarf importieren (Startzeit von API und CLI)
+    from playwright.async_api import async_playwright
+
+    playwright = await async_playwright().start()
+    launch_args = {"headless": settings.BROWSER_HEADLESS}
+    if settings.PROXY_ENABLED and settings.PROXY_URL:
+        launch_args["proxy"] = {"server": settings.PROXY_URL}
+    browser = await playwright.chromium.launch(**launch_args)
+    return playwright, browser
+
+
+def _count(text: str) -> int:
+    """Zahl aus einem Zählertext wie "1.234 Kommentare" oder "1,2K"."""
+    token = text.strip().split(" ")[0] if text.strip() else "0"
+    suffix = {"K": 1000, "M": 1_000_000}.get(token[-1:].upper())
+    if suffix:
+        return int(float(token[:-1].replace(",", ".")) * suffix)
+    digits = "".join(char for char in token if char.isdigit())
+    return int(digits) if digits else 0
+
+
+class LinkedInService(BrowserBackend):
+    def __init__(
+        self,
+        email: Optional[str] = None,
+        password: Optional[str] = None,
+        storage_state: Optional[str] = None
+    ):
+        # Zugangsdaten pro Account; ohne Angabe die globalen Settings
+        self.email = email
+        self.password = password
+        # Gespeicherte Session (Cookies) statt Login, siehe Playwright storage_state
+        self.storage_state = storage_state
+        self.browser: Optional["Browser"] = None
+        self.context: Optional["BrowserContext"] = None
+        self.page: Optional["Page"] = None
         self.is_logged_in = False
+        self._playwright: Optional["Playwright"] = None
+
+    async def initialize(self, browser: Optional["Browser"] = None):
+        """Öffnet einen eigenen Browser-Kontext (im geteilten oder eigenen Browser) und meldet sich an."""
+        if browser is None:
+            self._playwright, browser = await launch_browser()
+        self.browser = browser
+
+        context_args = {}
+        if settings.BROWSER_USER_AGENT:
+            context_args["user_agent"] = settings.BROWSER_USER_AGENT
+        if self.storage_state:
+            context_args["storage_state"] = self.storage_state
+        self.context = await browser.new_context(**context_args)
+        self.page = await self.context.new_page()
+
+        if self.storage_state:
+            self.is_logged_in = True
+        else:
+            await self.login()
+
+    async def _goto(self, url: str):
+        """Ruft eine Seite auf und erfasst die Dauer."""
+        start = time.perf_counter()
+        result = "error"
+        try:
+            response = await self.page.goto(url)
+            result = "success"
+            return response
+        finally:
+            BROWSER_NAVIGATIONS.labels("playwright", result).inc()
+            BROWSER_NAVIGATION_DURATION.labels("playwright").observe(time.perf_counter() - start)
+
+    async def _wait_for(self, selector: str, timeout: Optional[int] = None):
+        """Wartet auf einen Selektor und erfasst die Wartezeit."""
+        start = time.perf_counter()
+        result = "timeout"
+        try:
+            kwargs = {"timeout": timeout} if timeout is not None else {}
+            element = await self.page.wait_for_selector(selector, **kwargs)
+            result = "found"
+            return element
+        finally:
+            BROWSER_SELECTOR_WAIT.labels("playwright", selector, result).observe(time.perf_counter() - start)
+
+    async def _open(self, url: str):
+        """Navigiert nur, wenn die Seite nicht bereits geöffnet ist."""
+        if self.page.url.rstrip("/") != url.rstrip("/"):
+            await self._goto(url)
 
-    async def initialize(self):
-        """Initialisiert den Browser und meldet sich bei LinkedIn an."""
-        playwright = await async_playwright().start()
-        self.browser = await playwright.chromium.launch(headless=True)
-        self.page = await self.browser.new_page()
-        await self.login()
+    def _absolute(self, url: str) -> str:
+        return urljoin(f"{settings.LINKEDIN_BASE_URL}/", url)
 
+    @traced("linkedin.login")
     async def login(self):
         """Meldet sich bei LinkedIn an."""
+        email = self.email or settings.LINKEDIN_EMAIL
+        password = self.password or settings.LINKEDIN_PASSWORD
+        if not email or not password:
+            raise ValueError("LINKEDIN_EMAIL und LINKEDIN_PASSWORD müssen gesetzt sein")
         try:
-            await self.page.goto("https://www.linkedin.com/login")
-            await self.page.fill("#username", settings.LINKEDIN_EMAIL)
-            await self.page.fill("#password", settings.LINKEDIN_PASSWORD)
+            await self._goto(f"{settings.LINKEDIN_BASE_URL}/login")
+            await self.page.fill("#username", email)
+            await self.page.fill("#password", password)
             await self.page.click("button[type='submit']")
-            await self.page.wait_for_selector(".feed-identity-module", timeout=10000)
+            await self._wait_for(".feed-identity-module", timeout=10000)
             self.is_logged_in = True
             logger.info("Erfolgreich bei LinkedIn angemeldet")
         except Exception as e:
             logger.error(f"Fehler beim LinkedIn-Login: {str(e)}")
             raise
 
-    async def create_draft_post(self, post: Post) -> bool:
-        """Erstellt einen LinkedIn-Post als Entwurf."""
+    def _post_text(self, post: Post) -> str:
+        if not post.hashtags:
+            return post.content
+        tags = [tag.strip() for tag in post.hashtags.replace(",", " ").split() if tag.strip()]
+        hashtags = " ".join(tag if tag.startswith("#") else f"#{tag}" for tag in tags)
+        return f"{post.content}\n\n{hashtags}"
+
+    @traced("linkedin.create_post")
+    async def create_post(self, post: Post, publish: bool = True) -> bool:
+        """Veröffentlicht einen Beitrag oder speichert ihn als Entwurf."""
         try:
-            await self.page.goto("https://www.linkedin.com/post/new/")
-            await self.page.wait_for_selector(".ql-editor")
-            
-            # Text eingeben
-            await self.page.fill(".ql-editor", post.content)
-            
-            # Hashtags hinzufügen
-            if post.hashtags:
-                hashtags = post.hashtags.split()
-                for hashtag in hashtags:
-                    await self.page.fill(".ql-editor", f" {hashtag}")
-            
-            # Als Entwurf speichern
-            await self.page.click("button[aria-label='Als Entwurf speichern']")
-            await self.page.wait_for_selector(".feed-shared-update-v2", timeout=5000)
-            
-            # Post-ID extrahieren
-            post_url = await self.page.url()
-            post.linkedin_post_id = post_url.split("/")[-1]
-            post.status = PostStatus.DRAFT
-            
+            await self._goto(f"{settings.LINKEDIN_BASE_URL}/post/new/")
+            await self._wait_for(".ql-editor")
+            await self.page.fill(".ql-editor", self._post_text(post))
+
+            if publish:
+                await self.page.click("button[aria-label='Posten']")
+                await self._wait_for(".post-success-message", timeout=10000)
+                post.status = PostStatus.PUBLISHED
+            else:
+                await self.page.click("button[aria-label='Als Entwurf speichern']")
+                await self._wait_for(".feed-shared-update-v2", timeout=5000)
+                post.status = PostStatus.DRAFT
+
+            # Post-ID aus der URL übernehmen, auf die LinkedIn weiterleitet, sonst aus dem Link der Erfolgsmeldung
+            post_id = post_id_from_url(self.page.url)
+            if post_id is None and publish:
+                link = await self.page.query_selector(POST_SUCCESS_LINK)
+                post_id = post_id_from_url(await link.get_attribute("href")) if link else None
+            if post_id:
+                post.linkedin_post_id = post_id
             return True
         except Exception as e:
-            logger.error(f"Fehler beim Erstellen des Entwurfs: {str(e)}")
+            logger.error(f"Fehler beim Erstellen des Beitrags: {str(e)}")
             post.status = PostStatus.FAILED
             return False
 
+    async def create_draft_post(self, post: Post) -> bool:
+        """Erstellt einen LinkedIn-Post als Entwurf."""
+        return await self.create_post(post, publish=False)
+
+    @traced("linkedin.like_post")
     async def like_post(self, post_url: str) -> bool:
         """Liked einen LinkedIn-Post."""
         try:
-            await self.page.goto(post_url)
-            await self.page.wait_for_selector("button[aria-label='Like']")
-            await self.page.click("button[aria-label='Like']")
+            await self._open(post_url)
+            await self._wait_for(LIKE_BUTTON)
+            await self.page.click(LIKE_BUTTON)
             return True
         except Exception as e:
             logger.error(f"Fehler beim Liken des Posts: {str(e)}")
             return False
 
+    @traced("linkedin.comment_on_post")
     async def comment_on_post(self, post_url: str, comment: str) -> bool:
         """Kommentiert einen LinkedIn-Post."""
         try:
-            await this.page.goto(post_url)
-            await this.page.wait_for_selector(".comments-comment-texteditor")
-            await this.page.fill(".comments-comment-texteditor", comment)
-            await this.page.click("button[aria-label='Post']")
+            await self._open(post_url)
+            await self._wait_for(".comments-comment-texteditor")
+            await self.page.fill(".comments-comment-texteditor", comment)
+            await self.page.click(COMMENT_SUBMIT)
             return True
         except Exception as e:
             logger.error(f"Fehler beim Kommentieren des Posts: {str(e)}")
             return False
 
-    async def send_connection_request(self, profile_url: str) -> bool:
-        """Sendet eine Verbindungsanfrage an ein Profil."""
+    @traced("linkedin.share_post")
+    async def share_post(self, post_url: str) -> bool:
+        """Teilt einen LinkedIn-Post ohne eigenen Text."""
+        try:
+            await self._open(post_url)
+            await self._wait_for("button[aria-label='Teilen']")
+            await self.page.click("button[aria-label='Teilen']")
+            await self._wait_for("button[aria-label='Jetzt teilen']")
+            await self.page.click("button[aria-label='Jetzt teilen']")
+            return True
+        except Exception as e:
+            logger.error(f"Fehler beim Teilen des Posts: {str(e)}")
+            return False
+
+    @traced("linkedin.send_connection_request")
+    async def send_connection_request(self, profile_url: str, message: Optional[str] = None) -> bool:
+        """Sendet eine Verbindungsanfrage an ein Profil, optional mit Notiz."""
         try:
-            await this.page.goto(profile_url)
-            await this.page.wait_for_selector("button[aria-label='Connect']")
-            await this.page.click("button[aria-label='Connect']")
-            
+            await self._open(profile_url)
+            await self._wait_for(CONNECT_BUTTON)
+            await self.page.click(CONNECT_BUTTON)
+
+            if message:
+                await self._wait_for("button[aria-label='Notiz hinzufügen']")
+                await self.page.click("button[aria-label='Notiz hinzufügen']")
+                await self._wait_for("#custom-message")
+                await self.page.fill("#custom-message", message)
+
             # Zufällige Verzögerung zwischen 2-5 Sekunden
             await asyncio.sleep(random.uniform(2, 5))
-            
-            # "Send" Button klicken
-            await this.page.click("button[aria-label='Send now']")
+
+            await self.page.click(SEND_INVITE_BUTTON)
             return True
         except Exception as e:
             logger.error(f"Fehler beim Senden der Verbindungsanfrage: {str(e)}")
             return False
 
+    @traced("linkedin.send_message")
+    async def send_message(self, profile_url: str, message: str) -> bool:
+        """Schreibt einer bestehenden Verbindung eine Nachricht."""
+        try:
+            await self._open(profile_url)
+            await self._wait_for("button[aria-label='Nachricht']")
+            await self.page.click("button[aria-label='Nachricht']")
+            await self._wait_for(".msg-form__contenteditable")
+            await self.page.fill(".msg-form__contenteditable", message)
+            await self.page.click(".msg-form__send-button")
+            return True
+        except Exception as e:
+            logger.error(f"Fehler beim Senden der Nachricht: {str(e)}")
+            return False
+
+    @traced("linkedin.follow_profile")
     async def follow_profile(self, profile_url: str) -> bool:
         """Folgt einem LinkedIn-Profil."""
         try:
-            await this.page.goto(profile_url)
-            await this.page.wait_for_selector("button[aria-label='Follow']")
-            await this.page.click("button[aria-label='Follow']")
+            await self._open(profile_url)
+            await self._wait_for("button[aria-label='Follow']")
+            await self.page.click("button[aria-label='Follow']")
             return True
         except Exception as e:
             logger.error(f"Fehler beim Folgen des Profils: {str(e)}")
             return False
 
-    async def search_target_contacts(self, keywords: List[str], industry: Optional[str] = None) -> List[Dict]:
+    @traced("linkedin.search_profiles")
+    async def search_profiles(self, keywords: List[str], filters: Optional[Dict] = None) -> Optional[List[Dict]]:
+        """Sucht Profile; die Ergebnisse werden in einem Browser-Roundtrip ausgelesen."""
+        try:
+            params = {"keywords": " ".join(keywords), "origin": "GLOBAL_SEARCH_HEADER"}
+            for key, value in (filters or {}).items():
+                if value:
+                    params[key] = ",".join(value) if isinstance(value, (list, tuple)) else value
+
+            await self._goto(f"{settings.LINKEDIN_BASE_URL}/search/results/people/?{urlencode(params)}")
+            await self._wait_for(".search-result__info")
+
+            results = await self.page.eval_on_selector_all(
+                ".search-result__info",
+                """elements => elements.map(e => {
+                    const text = s => (e.querySelector(s) || {}).innerText || "";
+                    const link = e.querySelector("a");
+                    return {
+                        name: text(".entity-result__title-text"),
+                        title: text(".entity-result__primary-subtitle"),
+                        company: text(".entity-result__secondary-subtitle"),
+                        location: text(".entity-result__location"),
+                        degree: text(".entity-result__badge-text"),
+                        url: link ? link.href : null
+                    };
+                })"""
+            )
+            return [
+                {
+                    "id": result["url"],
+                    "name": result["name"].strip(),
+                    "title": result["title"].strip(),
+                    "company": result["company"].strip(),
+                    "location": result["location"].strip(),
+                    "degree": result["degree"].strip(),
+                    "url": result["url"]
+                }
+                for result in results if result["url"]
+            ]
+        except Exception as e:
+            logger.error(f"Fehler bei der Profilsuche: {str(e)}")
+            return None
+
+    async def search_target_contacts(self, keywords: List[str], industry: Optional[str] = None) -> Optional[List[Dict]]:
         """Sucht nach potenziellen Zielkontakten basierend auf Keywords."""
+        return await self.search_profiles(keywords, {"industry": industry} if industry else None)
+
+    @traced("linkedin.get_feed_posts")
+    async def get_feed_posts(self, limit: int = 10) -> Optional[List[Dict]]:
+        """Liest die Beitrags-Links aus dem Feed."""
+        try:
+            await self._goto(f"{settings.LINKEDIN_BASE_URL}/feed/")
+            await self._wait_for(".feed-shared-update-v2__link")
+            hrefs = await self.page.eval_on_selector_all(
+                ".feed-shared-update-v2__link", "links => links.map(a => a.getAttribute('href'))"
+            )
+            posts = []
+            for href in hrefs[:limit]:
+                url = self._absolute(href)
+                posts.append({"id": url.rstrip("/").split("/")[-1], "url": url})
+            return posts
+        except Exception as e:
+            logger.error(f"Fehler beim Lesen des Feeds: {str(e)}")
+            return None
+
+    @traced("linkedin.get_post")
+    async def get_post(self, post_url: str) -> Optional[Dict]:
+        """Öffnet einen Beitrag und liest Autor und Text."""
         try:
-            search_url = "https://www.linkedin.com/search/results/people/?"
-            params = {
-                "keywords": " ".join(keywords),
-                "origin": "GLOBAL_SEARCH_HEADER"
+            await self._goto(post_url)
+            await self._wait_for(".feed-shared-update-v2")
+            details = await self.page.eval_on_selector(
+                ".feed-shared-update-v2",
+                """e => ({
+                    urn: e.getAttribute("data-urn"),
+                    name: (e.querySelector(".feed-shared-actor__name") || {}).innerText || "",
+                    content: (e.querySelector(".feed-shared-update-v2__description") || {}).innerText || ""
+                })"""
+            )
+            return {
+                "id": details["urn"] or post_url.rstrip("/").split("/")[-1],
+                "url": post_url,
+                "name": details["name"].strip(),
+                "content": details["content"].strip()
             }
-            if industry:
-                params["industry"] = industry
-                
-            await this.page.goto(search_url + "&".join(f"{k}={v}" for k, v in params.items()))
-            await this.page.wait_for_selector(".search-results-container")
-            
-            # Extrahiere Profilinformationen
-            profiles = []
-            for profile in await this.page.query_selector_all(".entity-result__item"):
-                name = await profile.query_selector(".entity-result__title-text")
-                title = await profile.query_selector(".entity-result__primary-subtitle")
-                company = await profile.query_selector(".entity-result__secondary-subtitle")
-                
-                profiles.append({
-                    "name": await name.inner_text() if name else "",
-                    "title": await title.inner_text() if title else "",
-                    "company": await company.inner_text() if company else "",
-                    "profile_url": await profile.get_attribute("href")
-                })
-            
-            return profiles
         except Exception as e:
-            logger.error(f"Fehler bei der Kontaktsuche: {str(e)}")
-            return []
+            logger.error(f"Fehler beim Lesen des Beitrags: {str(e)}")
+            return None
+
+    @traced("linkedin.get_post_stats")
+    async def get_post_stats(self, post_url: str) -> Optional[Dict]:
+        """Liest Likes, Kommentare und Reposts eines Beitrags."""
+        try:
+            await self._goto(self._absolute(post_url))
+            await self._wait_for(".feed-shared-update-v2")
+            texts = await self.page.eval_on_selector(
+                ".feed-shared-update-v2",
+                """(e, selectors) => Object.fromEntries(Object.entries(selectors).map(
+                    ([key, selector]) => [key, (e.querySelector(selector) || {}).innerText || ""]
+                ))""",
+                POST_STATS
+            )
+            return {key: _count(text) for key, text in texts.items()}
+        except Exception as e:
+            logger.error(f"Fehler beim Lesen der Beitragszahlen: {str(e)}")
+            return None
+
+    async def _profile_links(self, url: str, selector: str, require_complete: bool = False) -> Optional[List[str]]:
+        """Profil-URLs einer Liste; scrollt bzw. blättert, bis keine weiteren Einträge kommen.
+
+        Eine leere Liste ist gültig. Mit ``require_complete`` wird None geliefert, wenn das Ende
+        der Liste nicht innerhalb von ``CONNECTION_SYNC_MAX_PAGES`` erreicht wurde.
+        """
+        try:
+            await self._goto(url)
+            await self._wait_for("main")
+            links: Dict[str, None] = {}
+            for _ in range(settings.CONNECTION_SYNC_MAX_PAGES):
+                before = len(links)
+                for href in await self.page.eval_on_selector_all(selector, "elements => elements.map(e => e.href)"):
+                    links.setdefault(href, None)
+                await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                more = await self.page.query_selector(LIST_MORE_BUTTON)
+                if more is None and len(links) == before:
+                    return list(links)
+                if more is not None:
+                    await more.click()
+                await self.page.wait_for_load_state("networkidle")
+            logger.warning(f"{url}: Ende der Liste nach {settings.CONNECTION_SYNC_MAX_PAGES} Seiten nicht erreicht")
+            return None if require_complete else list(links)
+        except Exception as e:
+            logger.error(f"Fehler beim Lesen von {url}: {str(e)}")
+            return None
+
+    @traced("linkedin.get_sent_invitations")
+    async def get_sent_invitations(self) -> Optional[List[str]]:
+        """Profil-URLs aller noch offenen gesendeten Einladungen; None, wenn nicht vollständig gelesen."""
+        return await self._profile_links(
+            f"{settings.LINKEDIN_BASE_URL}/mynetwork/invitation-manager/sent/", SENT_INVITATION_LINKS,
+            require_complete=True
+        )
+
+    @traced("linkedin.get_connections")
+    async def get_connections(self) -> Optional[List[str]]:
+        """Profil-URLs der Kontakte, die neuesten zuerst (bei sehr vielen Kontakten die neuesten Seiten)."""
+        return await self._profile_links(
+            f"{settings.LINKEDIN_BASE_URL}/mynetwork/invite-connect/connections/", CONNECTION_LINKS
+        )
 
     async def close(self):
-        """Schließt den Browser und beendet die Session."""
-        if self.browser:
-            await self.browser.close()
-            self.browser = None
+        """Schließt Kontext bzw. eigenen Browser und beendet die Session."""
+        if self.context:
+            await self.context.close()
+            self.context = None
             self.page = None
-            self.is_logged_in = False 
\ No newline at end of file
+        if self._playwright:
+            # Eigener Browser (nicht geteilt): komplett beenden
+            await self.browser.close()
+            await self._playwright.stop()
+            self._playwright = None
+        self.browser = None
+        self.is_logged_in = False
@@ -0,0 +1,204 @@
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+import asyncio
+import logging
+import threading
+import time
+
+from app.core.config import settings
+from app.core.metrics import AI_LATENCY, AI_REQUESTS, AI_TOKENS
+from app.core.tracing import span
+
+logger = logging.getLogger(__name__)
+
+
+def _openai():
+    """Importiert den OpenAI-Client erst beim ersten Call und setzt Key/Endpoint aus den Settings."""
+    import openai
+
+    openai.api_key = settings.OPENAI_API_KEY
+    openai.api_base = settings.OPENAI_API_URL
+    return openai
+
+
+@lru_cache()
+def timeout_errors() -> tuple:
+    try:
+        from openai.error import Timeout as OpenAITimeout
+    except ImportError:  # pragma: no cover - ältere/neuere Client-Versionen
+        OpenAITimeout = TimeoutError
+    return (OpenAITimeout, asyncio.TimeoutError, TimeoutError)
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    """Modellzuordnung für einen Aufgabentyp."""
+    task: str
+    model: str
+    fallback_model: Optional[str]
+    timeout: float
+
+
+@dataclass
+class RouteStats:
+    """Aggregierte Latenz- und Kostenwerte pro Route (Aufgabe + Modell)."""
+    calls: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    fallbacks: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost: float = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "fallbacks": self.fallbacks,
+            "avg_latency": self.total_latency / self.calls if self.calls else 0.0,
+            "max_latency": self.max_latency,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cost": round(self.cost, 6)
+        }
+
+
+# Prozessweite Statistik, von allen Router-Instanzen geteilt
+_stats: Dict[str, RouteStats] = {}
+_stats_lock = threading.Lock()
+
+
+def route_stats() -> Dict[str, dict]:
+    """Liefert Latenz- und Kostenstatistiken pro Route."""
+    with _stats_lock:
+        return {key: stats.as_dict() for key, stats in _stats.items()}
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """Berechnet die Kosten eines Calls anhand der konfigurierten Modellpreise."""
+    prices = settings.AI_MODEL_PRICES.get(model)
+    if not prices:
+        return 0.0
+    return (prompt_tokens * prices[0] + completion_tokens * prices[1]) / 1000
+
+
+class ModelRouter:
+    """Leitet KI-Aufgaben je nach Typ an das passende Modell weiter."""
+
+    def __init__(self, overrides: Optional[Dict[str, str]] = None):
+        # Benutzerspezifische Zuordnungen aus Settings.model_routes
+        self.overrides = overrides or {}
+
+    def route(self, task: str) -> ModelRoute:
+        """Ermittelt Modell, Ausweichmodell und Timeout für einen Aufgabentyp."""
+        model = (
+            self.overrides.get(task)
+            or settings.AI_MODEL_ROUTES.get(task)
+            or settings.AI_DEFAULT_MODEL
+        )
+        fallback = settings.AI_FALLBACK_MODELS.get(model)
+        return ModelRoute(
+            task=task,
+            model=model,
+            fallback_model=fallback if fallback != model else None,
+            timeout=settings.AI_ROUTE_TIMEOUTS.get(task, settings.AI_DEFAULT_TIMEOUT)
+        )
+
+    def complete(self, task: str, messages: List[Dict[str, str]], **params):
+        """Synchroner Chat-Completion-Call über die Route des Aufgabentyps."""
+        route = self.route(task)
+        try:
+            return self._call(route, route.model, messages, params)
+        except timeout_errors():
+            if not route.fallback_model:
+                raise
+            logger.warning(f"Timeout bei {task} mit {route.model}, weiche auf {route.fallback_model} aus")
+            return self._call(route, route.fallback_model, messages, params, fallback=True)
+
+    async def acomplete(self, task: str, messages: List[Dict[str, str]], **params):
+        """Asynchroner Chat-Completion-Call über die Route des Aufgabentyps."""
+        route = self.route(task)
+        try:
+            return await self._acall(route, route.model, messages, params)
+        except timeout_errors():
+            if not route.fallback_model:
+                raise
+            logger.warning(f"Timeout bei {task} mit {route.model}, weiche auf {route.fallback_model} aus")
+            return await self._acall(route, route.fallback_model, messages, params, fallback=True)
+
+    def _call(self, route: ModelRoute, model: str, messages, params, fallback: bool = False):
+        start = time.perf_counter()
+        try:
+            with span("ai.completion", task=route.task, model=model, fallback=fallback):
+                response = _openai().ChatCompletion.create(
+                    model=model,
+                    messages=messages,
+                    request_timeout=route.timeout,
+                    **params
+                )
+        except Exception as e:
+            self._record(route, model, time.perf_counter() - start, None, fallback, e)
+            raise
+        self._record(route, model, time.perf_counter() - start, response, fallback)
+        return response
+
+    async def _acall(self, route: ModelRoute, model: str, messages, params, fallback: bool = False):
+        start = time.perf_counter()
+        try:
+            with span("ai.completion", task=route.task, model=model, fallback=fallback):
+                response = await asyncio.wait_for(
+                    _openai().ChatCompletion.acreate(
+                        model=model,
+                        messages=messages,
+                        request_timeout=route.timeout,
+                        **params
+                    ),
+                    timeout=route.timeout
+                )
+        except Exception as e:
+            self._record(route, model, time.perf_counter() - start, None, fallback, e)
+            raise
+        self._record(route, model, time.perf_counter() - start, response, fallback)
+        return response
+
+    def _record(self, route: ModelRoute, model: str, latency: float, response, fallback: bool, error=None):
+        usage = getattr(response, "usage", None)
+        prompt_tokens = getattr(usage, "prompt_tokens", 0) if usage else 0
+        completion_tokens = getattr(usage, "completion_tokens", 0) if usage else 0
+        cost = estimate_cost(model, prompt_tokens, completion_tokens)
+
+        if error is None:
+            result = "success"
+        elif isinstance(error, timeout_errors()):
+            result = "timeout"
+        else:
+            result = "error"
+        AI_REQUESTS.labels(route.task, model, result).inc()
+        AI_LATENCY.labels(route.task, model).observe(latency)
+        if usage:
+            AI_TOKENS.labels(route.task, model, "prompt").inc(prompt_tokens)
+            AI_TOKENS.labels(route.task, model, "completion").inc(completion_tokens)
+
+        key = f"{route.task}:{model}"
+        with _stats_lock:
+            stats = _stats.setdefault(key, RouteStats())
+            stats.calls += 1
+            stats.total_latency += latency
+            stats.max_latency = max(stats.max_latency, latency)
+            stats.prompt_tokens += prompt_tokens
+            stats.completion_tokens += completion_tokens
+            stats.cost += cost
+            if fallback:
+                stats.fallbacks += 1
+            if error is not None:
+                stats.failures += 1
+                if isinstance(error, timeout_errors()):
+                    stats.timeouts += 1
+
+        logger.debug(
+            f"KI-Call {key}: {latency:.2f}s, {prompt_tokens}+{completion_tokens} Tokens, ${cost:.5f}"
+        )
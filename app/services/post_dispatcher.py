@@ -0,0 +1,123 @@
+"""Veröffentlicht geplante Posts zum Termin über die Browser-Kontexte des Schedulers.
+
+Zwischen zwei Terminen schläft der Dispatcher bis zum nächsten fälligen Post. Neue
+Termine wecken ihn per Postgres-NOTIFY bzw. lokalem Listener
+(``publishing.register_scheduled_posts``); ohne Benachrichtigung schläft er höchstens
+``DISPATCH_MAX_SLEEP`` Sekunden. Alle ``DISPATCH_RELEASE_INTERVAL`` Sekunden gibt er
+Posts wieder frei, deren Veröffentlichung seit ``DISPATCH_CLAIM_TIMEOUT`` hängt (z. B.
+nach einem Absturz eines anderen Workers).
+"""
+from typing import TYPE_CHECKING, Dict, Optional
+from datetime import timedelta
+import asyncio
+import logging
+import time
+
+from app.core.clock import utcnow
+from app.core.config import settings
+from app.core.tracing import span
+from app.db.session import get_engine, run_in_session
+from app.models.post import Post
+from app.services import publishing
+
+if TYPE_CHECKING:
+    from app.services.scheduler_service import SchedulerService
+
+logger = logging.getLogger(__name__)
+
+
+class PostDispatcher:
+    def __init__(self, scheduler: "SchedulerService"):
+        self.scheduler = scheduler
+        self.is_running = False
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._next_release = 0.0
+
+    def notify(self, *_):
+        """Weckt den Dispatcher; darf aus anderen Threads aufgerufen werden."""
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def run(self):
+        self.is_running = True
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        publishing.add_listener(self.notify)
+        unlisten = publishing.listen(get_engine(), self._loop, self.notify)
+        try:
+            while self.is_running:
+                # Vor der Abfrage zurücksetzen, damit kein NOTIFY dazwischen verloren geht
+                self._wakeup.clear()
+                await self.release_stale()
+                timeout = await self.dispatch_due()
+                if timeout == 0:
+                    continue
+                timeout = min(timeout, max(0.0, self._next_release - time.monotonic()))
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            publishing.remove_listener(self.notify)
+            if unlisten is not None:
+                unlisten()
+
+    def stop(self):
+        self.is_running = False
+        self.notify()
+
+    async def release_stale(self) -> int:
+        """Plant verwaiste Claims wieder ein; höchstens alle ``DISPATCH_RELEASE_INTERVAL`` Sekunden."""
+        if time.monotonic() < self._next_release:
+            return 0
+        self._next_release = time.monotonic() + settings.DISPATCH_RELEASE_INTERVAL
+        try:
+            released = await run_in_session(
+                publishing.release_stale_claims,
+                utcnow() - timedelta(seconds=settings.DISPATCH_CLAIM_TIMEOUT)
+            )
+        except Exception as e:
+            logger.error(f"Fehler beim Freigeben verwaister Veröffentlichungen: {str(e)}")
+            return 0
+        if released:
+            logger.warning(f"{released} verwaiste Veröffentlichungen wieder eingeplant")
+        return released
+
+    async def dispatch_due(self) -> float:
+        """Veröffentlicht alle fälligen Posts; liefert die Sekunden bis zum nächsten Termin."""
+        user_ids = list(self.scheduler.workers)
+        if not user_ids:
+            return settings.DISPATCH_MAX_SLEEP
+
+        now = utcnow()
+        claimed = await run_in_session(publishing.claim_due_posts, user_ids, now, settings.DISPATCH_BATCH_SIZE)
+        if claimed:
+            # Verschiedene Accounts parallel, pro Account nacheinander (Account-Lock)
+            await asyncio.gather(*(self.publish(post) for post in claimed))
+            return 0
+
+        due = await run_in_session(publishing.next_due, user_ids)
+        if due is None:
+            return settings.DISPATCH_MAX_SLEEP
+        return min(settings.DISPATCH_MAX_SLEEP, max(0.0, (due - utcnow()).total_seconds()))
+
+    async def publish(self, claimed: Dict):
+        worker = self.scheduler.workers.get(claimed["user_id"])
+        post = Post(
+            title=claimed["title"],
+            content=claimed["content"],
+            hashtags=claimed["hashtags"],
+            user_id=claimed["user_id"]
+        )
+        published = False
+        try:
+            if worker is None:
+                raise RuntimeError(f"Kein aktiver Account für User {claimed['user_id']}")
+            with span("dispatcher.publish", post_id=claimed["id"], user_id=claimed["user_id"]):
+                async with worker.lock:
+                    published = await worker.linkedin_service.create_post(post, publish=True)
+        except Exception as e:
+            logger.error(f"Geplanter Post {claimed['id']} konnte nicht veröffentlicht werden: {str(e)}")
+        await run_in_session(publishing.finish_publication, claimed["id"], published, post.linkedin_post_id)
+        logger.info(f"Geplanter Post {claimed['id']} {'veröffentlicht' if published else 'fehlgeschlagen'}")
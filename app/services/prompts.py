@@ -0,0 +1,276 @@
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from string import Formatter
+import logging
+import re
+import textwrap
+
+logger = logging.getLogger(__name__)
+
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+def normalize_whitespace(text: str) -> str:
+    """Entfernt Einrückung, Zeilenend-Leerzeichen und doppelte Leerzeilen."""
+    text = textwrap.dedent(text)
+    text = "\n".join(line.strip() for line in text.strip().splitlines())
+    return _BLANK_LINES.sub("\n\n", text)
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens(text: str, model: str = "gpt-4") -> int:
+    """Zählt die Tokens eines Textes (tiktoken, sonst Näherung ~4 Zeichen/Token)."""
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return max(1, (len(text) + 3) // 4)
+    return len(encoding.encode(text))
+
+
+@dataclass(frozen=True)
+class RenderedPrompt:
+    """Gerenderter Prompt inklusive Herkunft und Token-Anzahl."""
+    ref: str
+    system: str
+    user: str
+    tokens: int
+
+    @property
+    def messages(self) -> List[Dict[str, str]]:
+        return [
+            {"role": "system", "content": self.system},
+            {"role": "user", "content": self.user}
+        ]
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    """Versioniertes, beim Laden vorkompiliertes Prompt-Template."""
+    name: str
+    version: int
+    system: str
+    text: str
+    _parts: Tuple[Tuple[str, Optional[str]], ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        system = normalize_whitespace(self.system)
+        text = normalize_whitespace(self.text)
+        object.__setattr__(self, "system", system)
+        object.__setattr__(self, "text", text)
+
+        # Template einmalig in Literal-/Platzhalter-Segmente zerlegen
+        parts = []
+        for literal, field_name, format_spec, conversion in Formatter().parse(text):
+            if format_spec or conversion:
+                raise ValueError(f"Prompt {self.name}: Formatangaben werden nicht unterstützt")
+            parts.append((literal, field_name))
+        object.__setattr__(self, "_parts", tuple(parts))
+
+    @cached_property
+    def _system_tokens(self) -> int:
+        return count_tokens(self.system)
+
+    @property
+    def ref(self) -> str:
+        """Eindeutige Kennung für Post.ai_prompt, z. B. 'post@v2'."""
+        return f"{self.name}@v{self.version}"
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        return tuple(name for _, name in self._parts if name)
+
+    def render(self, **values) -> RenderedPrompt:
+        """Setzt die Werte in das vorkompilierte Template ein."""
+        chunks = []
+        for literal, field_name in self._parts:
+            chunks.append(literal)
+            if field_name:
+                chunks.append(str(values[field_name]))
+        user = "".join(chunks)
+        tokens = self._system_tokens + count_tokens(user)
+        logger.debug(f"Prompt {self.ref} gerendert: {tokens} Tokens")
+        return RenderedPrompt(ref=self.ref, system=self.system, user=user, tokens=tokens)
+
+
+class PromptRegistry:
+    """Verwaltet alle Prompt-Templates nach Name und Version."""
+
+    def __init__(self):
+        self._templates: Dict[Tuple[str, int], PromptTemplate] = {}
+        self._latest: Dict[str, PromptTemplate] = {}
+
+    def register(self, template: PromptTemplate) -> PromptTemplate:
+        key = (template.name, template.version)
+        if key in self._templates:
+            raise ValueError(f"Prompt {template.ref} ist bereits registriert")
+        self._templates[key] = template
+        latest = self._latest.get(template.name)
+        if latest is None or template.version > latest.version:
+            self._latest[template.name] = template
+        return template
+
+    def get(self, name: str, version: Optional[int] = None) -> PromptTemplate:
+        """Liefert ein Template; ohne Version die neueste."""
+        if version is None:
+            return self._latest[name]
+        return self._templates[(name, version)]
+
+    def render(self, name: str, version: Optional[int] = None, **values) -> RenderedPrompt:
+        return self.get(name, version).render(**values)
+
+    def __iter__(self):
+        return iter(self._templates.values())
+
+
+registry = PromptRegistry()
+
+# Templates werden einmalig beim Import geladen und normalisiert
+registry.register(PromptTemplate(
+    name="post",
+    version=1,
+    system="Du bist ein erfahrener LinkedIn-Content-Creator.",
+    text="""
+        Erstelle einen LinkedIn-Post zum Thema: {topic}
+
+        Anforderungen:
+        - Ton: {tone}
+        - Länge: {length}
+        - Format: Professionell, aber persönlich
+        - Struktur: Einleitung, Hauptteil, Call-to-Action
+        - Hashtags: {hashtags}
+
+        Der Post soll:
+        - Wertvolle Insights bieten und zum Nachdenken anregen
+        - Engagement fördern
+        - Authentisch wirken und die Hashtags natürlich einbinden
+        - LinkedIn-Best-Practices folgen
+    """
+))
+
+registry.register(PromptTemplate(
+    name="comment",
+    version=1,
+    system="Du bist ein erfahrener LinkedIn-Networker, der wertvolle Kommentare verfasst.",
+    text="""
+        Erstelle einen kurzen Kommentar zu diesem LinkedIn-Post:
+        "{post_content}"
+
+        Der Kommentar soll:
+        - Den Ton "{tone}" verwenden
+        - Den Hauptpunkt des Posts aufgreifen und einen Mehrwert bieten
+        - Eine Frage oder einen Diskussionspunkt enthalten
+        - Natürlich und authentisch wirken
+        - Maximal 2-3 Sätze lang sein
+    """
+))
+
+registry.register(PromptTemplate(
+    name="comment_batch",
+    version=1,
+    system="Du bist ein erfahrener LinkedIn-Networker, der wertvolle Kommentare verfasst.",
+    text="""
+        Erstelle für jeden der folgenden LinkedIn-Posts {variants} unterschiedliche Kommentar-Varianten.
+
+        Jeder Kommentar soll:
+        - Den Ton "{tone}" verwenden
+        - Den Hauptpunkt des Posts aufgreifen und einen Mehrwert bieten
+        - Eine Frage oder einen Diskussionspunkt enthalten
+        - Maximal 2-3 Sätze lang sein
+
+        Antworte ausschließlich mit JSON im Format:
+        {{"comments": [{{"id": "<Post-ID>", "variants": ["<Kommentar>"]}}]}}
+
+        Posts (eine JSON-Zeile pro Post):
+        {posts}
+    """
+))
+
+registry.register(PromptTemplate(
+    name="connection_message",
+    version=1,
+    system="Du bist ein erfahrener LinkedIn-Networker, der personalisierte Verbindungsnachrichten verfasst.",
+    text="""
+        Erstelle eine personalisierte LinkedIn-Verbindungsnachricht für:
+        Name: {name}
+        Position: {title}
+
+        Verwende diese Vorlage als Basis:
+        "{template}"
+
+        Die Nachricht soll:
+        - Personalisiert und authentisch sein
+        - Einen klaren Mehrwert bieten
+        - Zum Handeln auffordern
+        - Natürlich und nicht aufdringlich wirken
+    """
+))
+
+registry.register(PromptTemplate(
+    name="follow_up_message",
+    version=1,
+    system="Du bist ein erfahrener LinkedIn-Networker, der effektive Follow-up-Nachrichten verfasst.",
+    text="""
+        Erstelle eine Follow-up-Nachricht nach der LinkedIn-Verbindung für:
+        Name: {name}
+        Position: {title}
+
+        Verwende diese Vorlage als Basis:
+        "{template}"
+
+        Die Nachricht soll:
+        - Freundlich und einladend sein
+        - Einen konkreten nächsten Schritt vorschlagen
+        - Kurz und prägnant sein
+        - Natürlich und nicht aufdringlich wirken
+    """
+))
+
+registry.register(PromptTemplate(
+    name="engagement_analysis",
+    version=1,
+    system="Du bist ein LinkedIn-Content-Analyst.",
+    text="""
+        Analysiere diese LinkedIn-Post-Metriken und gib Verbesserungsvorschläge:
+
+        Post-Inhalt: {content}
+        Metriken: {metrics}
+
+        Bitte analysiere:
+        1. Engagement-Rate
+        2. Kommentar-Qualität
+        3. Reichweite
+        4. Verbesserungspotenzial
+    """
+))
+
+registry.register(PromptTemplate(
+    name="engagement_analysis_batch",
+    version=1,
+    system="Du bist ein LinkedIn-Content-Analyst.",
+    text="""
+        Analysiere die Metriken der folgenden LinkedIn-Posts und gib pro Post Verbesserungsvorschläge.
+
+        Bitte analysiere jeweils:
+        1. Engagement-Rate
+        2. Kommentar-Qualität
+        3. Reichweite
+        4. Verbesserungspotenzial
+
+        Antworte ausschließlich mit JSON im Format:
+        {{"analyses": [{{"id": "<Post-ID>", "analysis": "<Analyse>"}}]}}
+
+        Posts (eine JSON-Zeile pro Post):
+        {posts}
+    """
+))
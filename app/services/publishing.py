@@ -0,0 +1,198 @@
+"""Geplante Posts: Validierung, Anlage, Benachrichtigung und Warteschlange des Dispatchers.
+
+Neue Termine werden mit einem einzigen Aufruf gemeldet: auf Postgres per
+``NOTIFY post_scheduled`` in derselben Transaktion wie die Inserts (zugestellt beim
+Commit, auch an Scheduler in anderen Prozessen), zusätzlich an Listener im selben Prozess.
+
+Fällige Posts werden über den Index ``(status, scheduled_for)`` gelesen und per
+``SELECT ... FOR UPDATE SKIP LOCKED`` auf ``PUBLISHING`` gesetzt, sodass mehrere Worker
+parallel arbeiten, ohne einen Post doppelt zu veröffentlichen (mehrere Worker nur mit
+Postgres; SQLite hat keine Zeilensperren). Geplant werden nur Posts mit Account
+(``user_id``), denn veröffentlicht wird über dessen Browser-Kontext.
+
+Alle Termine und Zeitstempel sind UTC mit Zone (``app.core.clock``).
+"""
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
+from datetime import datetime
+import asyncio
+import logging
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.clock import as_utc, to_utc, utcnow
+from app.models.post import Post, PostStatus
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "post_scheduled"
+
+# Maximal so viele Posts pro Bulk-Request (etwa ein Quartal mit mehreren Posts pro Tag)
+MAX_BULK_POSTS = 500
+
+_listeners: List[Callable[[datetime], None]] = []
+
+
+def validate_schedule(items: Sequence, now: Optional[datetime] = None) -> List[Dict]:
+    """Prüft alle Einträge in einem Durchlauf und sammelt sämtliche Fehler mit Index."""
+    now = now or utcnow()
+    errors = []
+    if len(items) > MAX_BULK_POSTS:
+        errors.append({"index": None, "field": "posts", "message": f"Höchstens {MAX_BULK_POSTS} Posts pro Request"})
+    seen = {}
+    for index, item in enumerate(items):
+        if not item.title.strip():
+            errors.append({"index": index, "field": "title", "message": "Titel ist leer"})
+        if not item.content.strip():
+            errors.append({"index": index, "field": "content", "message": "Inhalt ist leer"})
+        due = to_utc(item.scheduled_for)
+        if due <= now:
+            errors.append({"index": index, "field": "scheduled_for", "message": "Zeitpunkt liegt in der Vergangenheit"})
+        elif due in seen:
+            errors.append({
+                "index": index, "field": "scheduled_for", "message": f"Gleicher Zeitpunkt wie Eintrag {seen[due]}"
+            })
+        else:
+            seen[due] = index
+    return errors
+
+
+def create_scheduled_posts(db: Session, user_id: int, items: Sequence) -> List[Tuple[int, datetime]]:
+    """Legt alle Posts in einer Transaktion an, meldet sie dem Scheduler; liefert (ID, Termin)."""
+    posts = [
+        Post(
+            title=item.title,
+            content=item.content,
+            hashtags=",".join(item.hashtags or []),
+            status=PostStatus.SCHEDULED,
+            scheduled_for=to_utc(item.scheduled_for),
+            user_id=user_id,
+            ai_generated=False
+        )
+        for item in items
+    ]
+    db.add_all(posts)
+    # Ein Flush: SQLAlchemy bündelt die Inserts (insertmanyvalues) und liefert die IDs
+    db.flush()
+    # Vor dem Commit auslesen, danach wären die Attribute expired (ein SELECT pro Post)
+    scheduled = [(post.id, post.scheduled_for) for post in posts]
+    register_scheduled_posts(db, [due for _, due in scheduled])
+    return scheduled
+
+
+def register_scheduled_posts(db: Session, due_times: Sequence[datetime]) -> None:
+    """Ein Aufruf für beliebig viele Termine: NOTIFY mit dem frühesten, Commit, lokale Listener."""
+    if not due_times:
+        return
+    first_due = min(due_times)
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(select(func.pg_notify(CHANNEL, first_due.isoformat())))
+    db.commit()
+    for listener in list(_listeners):
+        try:
+            listener(first_due)
+        except Exception as e:
+            logger.error(f"Fehler im Listener für geplante Posts: {str(e)}")
+
+
+def add_listener(listener: Callable[[datetime], None]) -> None:
+    _listeners.append(listener)
+
+
+def remove_listener(listener: Callable[[datetime], None]) -> None:
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def claim_due_posts(db: Session, user_ids: Sequence[int], now: datetime, limit: int) -> List[Dict]:
+    """Beansprucht bis zu ``limit`` fällige Posts der Accounts und liefert ihre Daten."""
+    query = (
+        db.query(Post)
+        .filter(
+            Post.status == PostStatus.SCHEDULED,
+            Post.scheduled_for <= now,
+            Post.user_id.in_(user_ids)
+        )
+        .order_by(Post.scheduled_for)
+        .limit(limit)
+    )
+    if db.get_bind().dialect.name == "postgresql":
+        # Von anderen Workern gesperrte Zeilen überspringen statt warten
+        query = query.with_for_update(skip_locked=True)
+
+    claimed = []
+    for post in query.all():
+        post.status = PostStatus.PUBLISHING
+        claimed.append({
+            "id": post.id,
+            "user_id": post.user_id,
+            "title": post.title,
+            "content": post.content,
+            "hashtags": post.hashtags
+        })
+    db.commit()
+    return claimed
+
+
+def next_due(db: Session, user_ids: Sequence[int]) -> Optional[datetime]:
+    """Frühester offener Termin (Index-Lookup, kein Scan)."""
+    value = db.execute(
+        select(func.min(Post.scheduled_for)).where(
+            Post.status == PostStatus.SCHEDULED,
+            Post.user_id.in_(user_ids)
+        )
+    ).scalar()
+    return as_utc(value)
+
+
+def finish_publication(db: Session, post_id: int, published: bool, linkedin_post_id: Optional[str] = None) -> None:
+    post = db.get(Post, post_id)
+    if post is None:
+        return
+    post.status = PostStatus.PUBLISHED if published else PostStatus.FAILED
+    if published:
+        post.published_at = utcnow()
+        post.linkedin_post_id = linkedin_post_id or post.linkedin_post_id
+    db.commit()
+
+
+def release_stale_claims(db: Session, older_than: datetime) -> int:
+    """Gibt Posts frei, deren Veröffentlichung (z. B. nach einem Absturz) nie abgeschlossen wurde."""
+    posts = (
+        db.query(Post)
+        .filter(Post.status == PostStatus.PUBLISHING, Post.updated_at < older_than)
+        .all()
+    )
+    for post in posts:
+        post.status = PostStatus.SCHEDULED
+    db.commit()
+    return len(posts)
+
+
+def listen(engine: "Engine", loop: asyncio.AbstractEventLoop, callback: Callable[[str], None]) -> Optional[Callable[[], None]]:
+    """Abonniert ``post_scheduled`` per LISTEN (nur Postgres); liefert eine Funktion zum Beenden."""
+    if engine.dialect.name != "postgresql":
+        return None
+    connection = engine.raw_connection()
+    # Eigene Verbindung außerhalb des Pools, dauerhaft im Autocommit
+    connection.detach()
+    raw = connection.driver_connection
+    raw.set_isolation_level(0)
+    with raw.cursor() as cursor:
+        cursor.execute(f"LISTEN {CHANNEL}")
+
+    def _read():
+        raw.poll()
+        while raw.notifies:
+            callback(raw.notifies.pop(0).payload)
+
+    loop.add_reader(raw.fileno(), _read)
+
+    def close():
+        loop.remove_reader(raw.fileno())
+        connection.close()
+
+    return close
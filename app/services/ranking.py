@@ -0,0 +1,153 @@
+"""Relevanz-Ranking von Suchtreffern für Verbindungsanfragen und Nachrichten.
+
+Jeder Kandidat wird auf fünf Merkmale abgebildet (Position, Keyword-Überdeckung,
+Kontaktgrad, Branche, Ort; jeweils 0..1). Der Score einer ganzen Trefferliste ist ein
+Matrix-Vektor-Produkt mit den Gewichten. Die Startgewichte (``RANKING_WEIGHTS``) werden
+mit den Annahmequoten aus ``TargetContact.status`` nachjustiert: Merkmale, deren Träger
+häufiger annehmen als der Durchschnitt, zählen stärker.
+"""
+from typing import Dict, List, Optional, Sequence
+from datetime import timedelta
+import logging
+import re
+
+import numpy as np
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.core.clock import utcnow
+from app.core.config import settings
+from app.models.target_contact import TargetContact, ContactStatus
+from app.services.screening import compile_terms
+
+logger = logging.getLogger(__name__)
+
+FEATURES = ("position", "keywords", "degree", "industry", "location")
+
+# 1. Grad ist schon verbunden, 2. Grad nimmt am ehesten an
+DEGREE_SCORES = {1: 0.0, 2: 1.0, 3: 0.4}
+UNKNOWN_DEGREE = 0.5
+
+_DEGREE = re.compile(r"\d")
+
+
+def degree_score(value: Optional[str]) -> float:
+    """Score aus Texten wie "2nd", "• 3rd+" oder "1st degree connection"."""
+    match = _DEGREE.search(value or "")
+    return DEGREE_SCORES.get(int(match.group(0)), UNKNOWN_DEGREE) if match else UNKNOWN_DEGREE
+
+
+def default_weights() -> np.ndarray:
+    return np.array([float(settings.RANKING_WEIGHTS.get(name, 0.0)) for name in FEATURES])
+
+
+class TargetFeatures:
+    """Vorkompilierte Zielgruppen-Begriffe eines Settings-Snapshots."""
+
+    def __init__(self, account_settings):
+        self.version = account_settings.version
+        self.positions = compile_terms(account_settings.target_positions)
+        self.keywords = compile_terms(account_settings.target_keywords)
+        self.keyword_count = len({keyword.strip().lower() for keyword in account_settings.target_keywords if keyword.strip()})
+        self.industries = compile_terms(account_settings.target_industries)
+        self.locations = compile_terms(account_settings.target_locations)
+
+    @staticmethod
+    def _match(pattern, text: str) -> float:
+        return 1.0 if pattern is not None and pattern.search(text) else 0.0
+
+    def row(self, candidate: Dict) -> List[float]:
+        title = candidate.get("title") or ""
+        text = " \n ".join(str(candidate.get(key) or "") for key in ("name", "title", "company"))
+        # Suchtreffer haben keine Branche; dann Titel und Unternehmen prüfen
+        industry = candidate.get("industry") or text
+        keyword_hits = (
+            len({match.lower() for match in self.keywords.findall(text)}) / self.keyword_count
+            if self.keywords is not None else 0.0
+        )
+        return [
+            self._match(self.positions, title),
+            keyword_hits,
+            degree_score(candidate.get("degree") or candidate.get("connection_degree")),
+            self._match(self.industries, industry),
+            self._match(self.locations, candidate.get("location") or ""),
+        ]
+
+    def matrix(self, candidates: Sequence[Dict]) -> np.ndarray:
+        """Merkmalsmatrix (Kandidaten x ``FEATURES``)."""
+        return np.array([self.row(candidate) for candidate in candidates], dtype=float).reshape(-1, len(FEATURES))
+
+
+class CandidateRanker:
+    """Gewichte eines Accounts und Ranking ganzer Trefferlisten."""
+
+    def __init__(self, user_id: int):
+        self.user_id = user_id
+        self.weights = default_weights()
+        self.samples = 0
+        self._features: Optional[TargetFeatures] = None
+
+    def features(self, account_settings) -> TargetFeatures:
+        """Merkmale des Snapshots; neu kompiliert nur nach einer Änderung der Einstellungen."""
+        if self._features is None or self._features.version != account_settings.version:
+            self._features = TargetFeatures(account_settings)
+        return self._features
+
+    def scores(self, candidates: Sequence[Dict], account_settings) -> np.ndarray:
+        return self.features(account_settings).matrix(candidates) @ self.weights
+
+    def rank(self, candidates: Sequence[Dict], account_settings) -> List[Dict]:
+        """Kandidaten absteigend nach Score; bei Gleichstand bleibt die Reihenfolge der Suche."""
+        if not candidates:
+            return []
+        order = np.argsort(-self.scores(candidates, account_settings), kind="stable")
+        return [candidates[index] for index in order]
+
+    def decided_contacts(self, db: Session) -> List:
+        """Angenommene, abgelehnte und lange offene Anfragen des Accounts.
+
+        Nur Kontakte, die tatsächlich angefragt wurden (``last_contact_attempt``); importierte
+        oder nie angeschriebene Einträge sagen nichts über die Annahmequote. Offen gilt als
+        abgelehnt, wenn die Anfrage (nicht der Import) länger als ``RANKING_PENDING_DAYS`` zurückliegt.
+        """
+        stale = (utcnow() - timedelta(days=settings.RANKING_PENDING_DAYS)).isoformat()
+        return (
+            db.query(
+                TargetContact.name, TargetContact.title, TargetContact.company, TargetContact.location,
+                TargetContact.industry, TargetContact.connection_degree, TargetContact.status
+            )
+            .filter(
+                TargetContact.user_id == self.user_id,
+                TargetContact.last_contact_attempt.isnot(None),
+                or_(
+                    TargetContact.status.in_([ContactStatus.CONNECTED, ContactStatus.REJECTED]),
+                    and_(TargetContact.status == ContactStatus.PENDING, TargetContact.last_contact_attempt < stale)
+                )
+            )
+            .all()
+        )
+
+    def fit(self, db: Session, account_settings) -> int:
+        """Justiert die Gewichte an den Annahmequoten; liefert die Anzahl ausgewerteter Kontakte."""
+        rows = self.decided_contacts(db)
+        self.samples = len(rows)
+        if len(rows) < settings.RANKING_MIN_SAMPLES:
+            self.weights = default_weights()
+            return len(rows)
+
+        features = self.features(account_settings).matrix([row._asdict() for row in rows])
+        accepted = np.array([row.status == ContactStatus.CONNECTED for row in rows], dtype=float)
+        base_rate = accepted.mean()
+        if base_rate == 0:
+            self.weights = default_weights()
+            return len(rows)
+
+        # Annahmequote je Merkmal (gewichtet mit der Ausprägung), geglättet Richtung Gesamtquote
+        prior = settings.RANKING_PRIOR_WEIGHT
+        rates = (features.T @ accepted + prior * base_rate) / (features.sum(axis=0) + prior)
+        self.weights = default_weights() * rates / base_rate
+        logger.info(
+            f"Ranking-Gewichte für User {self.user_id} ({len(rows)} Kontakte, Annahmequote {base_rate:.0%}): "
+            f"{dict(zip(FEATURES, np.round(self.weights, 2).tolist()))}"
+        )
+        return len(rows)
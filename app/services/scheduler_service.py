@@ -1,159 +1,788 @@
-import asyncio
-import schedule
-import time
+"""Asynchroner Scheduler: ein Event-Loop für die Jobs aller Accounts.
+
+Jeder Account bekommt einen ``AccountWorker`` mit eigenem Browser-Kontext (im gemeinsamen
+Chromium) und eigenem KI-Routing. Ein einzelner Loop hält die fälligen Jobs in einem Heap,
+schläft bis zum nächsten Termin und startet die Jobs als Tasks; pro Account laufen Jobs
+nacheinander, verschiedene Accounts parallel.
+"""
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Union
+import asyncio
+import heapq
+import itertools
 import logging
-from typing import List, Optional
+import random
 
+from app.core.clock import to_utc, utcnow
 from app.core.config import settings
-from app.services.linkedin_service import LinkedInService
-from app.services.ai_service import AIService
+from app.core.metrics import ACTION_DURATION, ACTIONS, track_action
+from app.core.profiler import profile_job
+from app.core.tracing import trace, traced
+from app.db.session import run_in_session
+from app.models.interaction import Interaction, InteractionStatus, InteractionType
 from app.models.post import Post, PostStatus
-from app.models.interaction import Interaction, InteractionType
-from app.models.target_contact import TargetContact, ContactStatus
+from app.models.settings import Settings
+from app.services.ai_service import AIService
+from app.services.account_settings import AccountSettings, SettingsStore, snapshot
+from app.services.browser import BackendUnavailable, BrowserBackend
+from app.services.candidate_selection import CandidateSelector
+from app.services.circuit_breaker import CircuitBreakers, guarded
+from app.services.connection_sync import ConnectionTracker
+from app.services.engagement_analysis import EngagementAnalyzer
+from app.services.engagement_collector import EngagementCollector
+from app.services.linkedin_service import LinkedInService, launch_browser
+from app.services.post_dispatcher import PostDispatcher
+from app.services.ranking import CandidateRanker
+from app.services.screening import CandidateScreen
+from app.services.send_time import SendTimeOptimizer, random_slots
 
 logger = logging.getLogger(__name__)
 
-class SchedulerService:
-    def __init__(self):
-        self.linkedin_service = LinkedInService()
-        this.ai_service = AIService()
-        this.is_running = False
 
-    async def start(self):
-        """Startet den Scheduler-Service."""
+class IntervalTrigger:
+    def __init__(self, **interval):
+        self.interval = timedelta(**interval)
+
+    def next_after(self, now: datetime) -> datetime:
+        return now + self.interval
+
+
+class DailyTrigger:
+    def __init__(self, hour: int, minute: int = 0):
+        self.hour = hour
+        self.minute = minute
+
+    def next_after(self, now: datetime) -> datetime:
+        candidate = now.replace(hour=self.hour, minute=self.minute, second=0, microsecond=0)
+        return candidate if candidate > now else candidate + timedelta(days=1)
+
+
+class WeeklyTrigger:
+    def __init__(self, weekday: int, hour: int, minute: int = 0):
+        self.weekday = weekday  # 0 = Montag
+        self.hour = hour
+        self.minute = minute
+
+    def next_after(self, now: datetime) -> datetime:
+        candidate = now.replace(hour=self.hour, minute=self.minute, second=0, microsecond=0)
+        candidate += timedelta(days=(self.weekday - now.weekday()) % 7)
+        return candidate if candidate > now else candidate + timedelta(days=7)
+
+
+class LeadTrigger:
+    """Läuft ``lead`` vor jedem Termin eines anderen Triggers."""
+
+    def __init__(self, trigger, lead: timedelta):
+        self.trigger = trigger
+        self.lead = lead
+
+    def next_after(self, now: datetime) -> datetime:
+        return self.trigger.next_after(now + self.lead) - self.lead
+
+
+_job_sequence = itertools.count()
+
+
+@dataclass(order=True)
+class Job:
+    next_run: datetime
+    sequence: int = field(default_factory=lambda: next(_job_sequence))
+    name: str = field(default="", compare=False)
+    user_id: int = field(default=0, compare=False)
+    func: Callable[[], Awaitable] = field(default=None, compare=False)
+    trigger: object = field(default=None, compare=False)
+    running: bool = field(default=False, compare=False)
+    cancelled: bool = field(default=False, compare=False)
+
+
+class AccountWorker:
+    """Alle Automatisierungsaktionen eines Accounts."""
+
+    def __init__(
+        self,
+        account_settings: Union[AccountSettings, Settings],
+        linkedin_service: BrowserBackend,
+        ai_service: Optional[AIService] = None
+    ):
+        # Unveränderlicher Snapshot; Änderungen tauscht der SchedulerService als Ganzes aus
+        self.settings = snapshot(account_settings)
+        self.user_id = self.settings.user_id
+        self._screen: Optional[CandidateScreen] = None
+        self.linkedin_service = linkedin_service
+        self.ai_service = ai_service or AIService(dict(self.settings.model_routes))
+        self.send_time = SendTimeOptimizer(self.user_id)
+        self.engagement = EngagementCollector(self.user_id, linkedin_service)
+        self.analyzer = EngagementAnalyzer(self.user_id, self.ai_service)
+        self.ranker = CandidateRanker(self.user_id)
+        self.connections = ConnectionTracker(self.user_id, linkedin_service)
+        # Pausiert eine Aktion nach Fehlschlägen in Folge (z. B. geänderter Selektor, Checkpoint)
+        self.breakers = CircuitBreakers(self.user_id)
+        # Ein Browser-Kontext pro Account: Jobs eines Accounts laufen nacheinander
+        self.lock = asyncio.Lock()
+        # Pausen in Sekunden (min, max)
+        self.interaction_pause = (30, 120)
+        self.connection_delay = (30, 60)
+        self.feed_interaction_delay = (60, 120)
+
+    def jobs(self) -> List[tuple]:
+        """(Name, Trigger, Coroutine-Funktion) der festen Jobs; Posting-Slots plant ``plan_post_slots``."""
+        jobs = [
+            ("tune_ranking", DailyTrigger(8, 30), self.tune_ranking),
+            ("daily_connections", DailyTrigger(9, 0), self.process_daily_connections),
+            ("sync_connections", IntervalTrigger(minutes=settings.CONNECTION_SYNC_INTERVAL), self.sync_connections),
+            ("feed_interactions", IntervalTrigger(hours=settings.INTERACTION_INTERVAL_HOURS), self.process_interactions),
+            ("collect_engagement", IntervalTrigger(minutes=settings.ENGAGEMENT_COLLECT_INTERVAL), self.collect_engagement),
+            ("analyze_posts", DailyTrigger(20, 0), self.analyze_post_performance)
+        ]
+        if self.settings.interaction_interval:
+            jobs.append((
+                "interaction", IntervalTrigger(minutes=self.settings.interaction_interval), self.perform_interaction
+            ))
+        return jobs
+
+    async def plan_post_slots(self) -> List[tuple]:
+        """Posting-Termine der Woche aus der Engagement-Historie (inkrementell aktualisiert)."""
+        if not self.settings.post_frequency:
+            return []
+        changed = await run_in_session(self.send_time.refresh)
+        slots = self.send_time.best_slots(self.settings.post_frequency)
+        if slots is None:
+            # Zu wenig Historie: zufällig im Posting-Fenster
+            return random_slots(self.settings.post_frequency)
+        logger.info(f"Posting-Slots für User {self.user_id} ({changed} neue Metriken): {slots}")
+        return slots
+
+    async def tune_ranking(self):
+        """Passt die Ranking-Gewichte an die bisherigen Annahmequoten an."""
         try:
-            await this.linkedin_service.initialize()
-            this.is_running = True
-            
-            # Scheduler-Jobs einrichten
-            schedule.every().monday.at("10:00").do(this.generate_weekly_posts)
-            schedule.every().wednesday.at("10:00").do(this.generate_weekly_posts)
-            schedule.every().friday.at("10:00").do(this.generate_weekly_posts)
-            
-            schedule.every().day.at("09:00").do(this.process_daily_connections)
-            schedule.every(4).hours.do(this.process_interactions)
-            
-            # Scheduler-Loop starten
-            while this.is_running:
-                schedule.run_pending()
-                await asyncio.sleep(60)
-                
+            await run_in_session(self.ranker.fit, self.settings)
         except Exception as e:
-            logger.error(f"Fehler im Scheduler-Service: {str(e)}")
-            this.is_running = False
-            raise
-        finally:
-            await this.linkedin_service.close()
+            logger.error(f"Fehler beim Anpassen des Rankings: {str(e)}")
 
-    async def stop(self):
-        """Beendet den Scheduler-Service."""
-        this.is_running = False
-        await this.linkedin_service.close()
+    @property
+    def screen(self) -> CandidateScreen:
+        """Filter des aktuellen Settings-Snapshots; neu kompiliert nur nach einer Änderung."""
+        if self._screen is None or self._screen.version != self.settings.version:
+            self._screen = CandidateScreen.from_settings(self.settings)
+        return self._screen
 
-    async def generate_weekly_posts(self):
-        """Generiert wöchentliche LinkedIn-Posts."""
-        try:
-            # Themen für die Woche generieren
-            topics = [
-                "Aktuelle Trends in der Branche",
-                "Best Practices und Tipps",
-                "Erfolgsgeschichten und Case Studies"
-            ]
-            
-            for topic in topics:
-                # KI-generierten Content erstellen
-                content = await this.ai_service.generate_post_content(
-                    topic=topic,
-                    tone="professional",
-                    length="medium"
-                )
-                
-                # Post-Objekt erstellen
-                post = Post(
-                    title=topic,
-                    content=content["content"],
-                    hashtags=" ".join(content["hashtags"]),
-                    status=PostStatus.DRAFT,
-                    ai_generated=True,
-                    ai_prompt=f"Topic: {topic}"
+    def _search_filters(self, **extra) -> Dict:
+        return {**self.settings.search_filters, **extra}
+
+    async def _save(self, *objects):
+        """Speichert Objekte in einer eigenen Session, ohne den Event-Loop zu blockieren."""
+        def _add(db):
+            db.add_all(objects)
+            db.commit()
+        await run_in_session(_add)
+
+    async def _candidate_selector(self, interaction_type: InteractionType, **kwargs) -> CandidateSelector:
+        """Selector mit den zuletzt gesendeten Texten dieses Typs für die Duplikatprüfung."""
+        def _recent(db):
+            return [
+                row.content for row in db.query(Interaction.content)
+                .filter(
+                    Interaction.user_id == self.user_id,
+                    Interaction.type == interaction_type,
+                    Interaction.content.isnot(None)
                 )
-                
-                # Als Entwurf in LinkedIn speichern
-                success = await this.linkedin_service.create_draft_post(post)
-                if success:
-                    logger.info(f"Post-Entwurf erstellt: {post.title}")
-                else:
-                    logger.error(f"Fehler beim Erstellen des Post-Entwurfs: {post.title}")
-                    
+                .order_by(Interaction.id.desc())
+                .limit(settings.AI_RECENT_INTERACTIONS)
+            ]
+        return CandidateSelector(await run_in_session(_recent), **kwargs)
+
+    def _interaction(self, interaction_type: InteractionType, target: Dict, content: Optional[str] = None) -> Interaction:
+        return Interaction(
+            type=interaction_type,
+            status=InteractionStatus.COMPLETED,
+            target_id=target["id"],
+            target_name=target.get("name"),
+            target_title=target.get("title"),
+            content=content,
+            user_id=self.user_id
+        )
+
+    @traced("scheduler.create_post")
+    async def create_post(self, publish_at: Optional[datetime] = None):
+        """Einen neuen Post erstellen; ohne Auto-Publish als Entwurf für den Termin ``publish_at``"""
+        try:
+            topic = random.choice(self.settings.post_topics)
+            tone = random.choice(self.settings.post_tones)
+            length = random.choice(self.settings.post_lengths)
+            hashtags = random.sample(self.settings.post_hashtags, min(3, len(self.settings.post_hashtags)))
+
+            content = await self.ai_service.generate_post_content(
+                topic=topic,
+                tone=tone,
+                length=length,
+                hashtags=hashtags
+            )
+
+            post = Post(
+                title=topic,
+                content=content["content"],
+                hashtags=",".join(hashtags),
+                status=PostStatus.DRAFT,
+                user_id=self.user_id,
+                ai_generated=True,
+                ai_prompt=f"{content['prompt_ref']} | Topic: {topic}"
+            )
+
+            # Post veröffentlichen oder als Entwurf speichern
+            if self.settings.auto_publish_posts:
+                if await self.linkedin_service.create_post(post):
+                    post.published_at = utcnow()
+            elif publish_at is not None:
+                # Nach der Freigabe (PUT /posts, status=scheduled) veröffentlicht der Dispatcher zum Slot
+                post.scheduled_for = to_utc(publish_at)
+
+            success = post.status != PostStatus.FAILED
+            await self._save(post)
+            return success
+
         except Exception as e:
-            logger.error(f"Fehler bei der Post-Generierung: {str(e)}")
+            logger.error(f"Post-Erstellung fehlgeschlagen: {str(e)}")
+            return False
+
+    async def perform_interaction(self):
+        """Eine zufällige Interaktion aus den aktivierten Typen durchführen"""
+        if not self.settings.interaction_types:
+            return
+        interaction_type = InteractionType(random.choice(self.settings.interaction_types))
+        actions = {
+            InteractionType.LIKE: self.perform_like,
+            InteractionType.COMMENT: self.perform_comment,
+            InteractionType.CONNECTION: self.perform_connection,
+            InteractionType.MESSAGE: self.perform_message,
+            InteractionType.SHARE: self.perform_share
+        }
+
+        # Eigene Trace-ID pro Interaktion
+        with trace("perform_interaction", interaction_type=interaction_type.value, user_id=self.user_id):
+            await actions[interaction_type]()
+
+        await asyncio.sleep(random.uniform(*self.interaction_pause))
+
+    async def _feed_posts(self) -> List[Dict]:
+        posts = await self.linkedin_service.get_feed_posts()
+        if posts is None:
+            raise BackendUnavailable("Feed nicht lesbar")
+        return posts
+
+    async def _random_feed_post(self) -> Optional[Dict]:
+        posts = await self._feed_posts()
+        return random.choice(posts) if posts else None
+
+    async def _search_profiles(self, keywords: List[str], filters: Dict) -> List[Dict]:
+        profiles = await self.linkedin_service.search_profiles(keywords, filters)
+        if profiles is None:
+            raise BackendUnavailable("Profilsuche fehlgeschlagen")
+        return profiles
+
+    @traced("scheduler.perform_like")
+    @guarded("like")
+    @track_action("like")
+    @profile_job("like")
+    async def perform_like(self):
+        """Einen Beitrag aus dem Feed liken"""
+        try:
+            post = await self._random_feed_post()
+            if not post:
+                return
+
+            success = await self.linkedin_service.like_post(post["url"])
+            if success:
+                await self._save(self._interaction(InteractionType.LIKE, post))
+            return success
+
+        except BackendUnavailable as e:
+            logger.error(f"Like fehlgeschlagen: {str(e)}")
+            return False
+
+    @traced("scheduler.perform_comment")
+    @guarded("comment")
+    @track_action("comment")
+    @profile_job("comment")
+    async def perform_comment(self):
+        """Einen Beitrag aus dem Feed kommentieren"""
+        try:
+            feed_post = await self._random_feed_post()
+            if not feed_post:
+                return
+            post = await self.linkedin_service.get_post(feed_post["url"])
+            if post is None:
+                raise BackendUnavailable("Beitrag nicht lesbar")
+            if not post["content"]:
+                return
+            if not self.screen.posts([post])[0]:
+                return
+
+            # Mehrere Kommentar-Varianten generieren und lokal die beste auswählen
+            comment = await self.ai_service.generate_comment(
+                post_content=post["content"],
+                tone=random.choice(self.settings.post_tones),
+                n=settings.AI_CANDIDATES,
+                selector=await self._candidate_selector(InteractionType.COMMENT, prefer_question=True)
+            )
+            if not comment:
+                return
+
+            success = await self.linkedin_service.comment_on_post(post["url"], comment)
+            if success:
+                await self._save(self._interaction(InteractionType.COMMENT, post, comment))
+            return success
+
+        except BackendUnavailable as e:
+            logger.error(f"Kommentar fehlgeschlagen: {str(e)}")
+            return False
+
+    @traced("scheduler.perform_connection")
+    @guarded("connection")
+    @track_action("connection")
+    @profile_job("connection")
+    async def perform_connection(self):
+        """Eine Verbindungsanfrage mit persönlicher Notiz senden"""
+        try:
+            profiles = await self._search_profiles([self.settings.search_query], self._search_filters())
+            profiles, _ = self.screen.profiles(profiles)
+            profiles = await run_in_session(self.connections.unknown, profiles)
+            if not profiles:
+                return
+
+            profile = self.ranker.rank(profiles, self.settings)[0]
+            message = await self.ai_service.generate_connection_message(
+                profile_info=profile,
+                template=random.choice(self.settings.message_templates["connection"]),
+                n=settings.AI_CANDIDATES,
+                selector=await self._candidate_selector(InteractionType.CONNECTION, max_chars=300)
+            )
+            if not message:
+                return
+
+            success = await self.linkedin_service.send_connection_request(profile["url"], message)
+            if success:
+                await self._save(self._interaction(InteractionType.CONNECTION, profile, message))
+                await run_in_session(self.connections.record_requests, [profile], [self.settings.search_query])
+            return success
+
+        except BackendUnavailable as e:
+            logger.error(f"Verbindungsanfrage fehlgeschlagen: {str(e)}")
+            return False
+
+    @traced("scheduler.perform_message")
+    @guarded("message")
+    @track_action("message")
+    @profile_job("message")
+    async def perform_message(self):
+        """Einem angenommenen Kontakt ohne bisherige Nachricht ein Follow-up senden"""
+        try:
+            contact = await run_in_session(self.connections.next_follow_up)
+            if not contact:
+                return
+            return await self._send_follow_up(contact)
+
+        except BackendUnavailable as e:
+            logger.error(f"Nachricht fehlgeschlagen: {str(e)}")
+            return False
+
+    async def _send_follow_up(self, contact: Dict) -> Optional[bool]:
+        """Sendet die Follow-up-Nachricht; None, wenn keine Nachricht entstanden ist."""
+        message = await self.ai_service.generate_follow_up_message(
+            profile_info=contact,
+            template=random.choice(self.settings.message_templates["follow_up"])
+        )
+        if not message:
+            return None
+
+        success = await self.linkedin_service.send_message(contact["url"], message)
+        if success:
+            # target_id = Profil-URL: ``next_follow_up`` überspringt den Kontakt danach
+            await self._save(self._interaction(InteractionType.MESSAGE, contact, message))
+        return success
+
+    @traced("scheduler.perform_share")
+    @guarded("share")
+    @track_action("share")
+    @profile_job("share")
+    async def perform_share(self):
+        """Einen Beitrag aus dem Feed teilen"""
+        try:
+            post = await self._random_feed_post()
+            if not post:
+                return
+
+            success = await self.linkedin_service.share_post(post["url"])
+            if success:
+                await self._save(self._interaction(InteractionType.SHARE, post))
+            return success
+
+        except BackendUnavailable as e:
+            logger.error(f"Teilen fehlgeschlagen: {str(e)}")
+            return False
 
     async def process_daily_connections(self):
         """Verarbeitet die täglichen Verbindungsanfragen."""
+        sent = []
+        keywords = [self.settings.search_query] if self.settings.search_query else []
+        breaker = self.breakers["connection"]
+        if not breaker.allow():
+            logger.warning(f"Verbindungsanfragen für User {self.user_id} pausiert (Circuit Breaker)")
+            return
         try:
-            # Zielkontakte suchen
-            keywords = ["Software Engineer", "Product Manager", "Data Scientist"]
-            profiles = await this.linkedin_service.search_target_contacts(keywords)
-            
-            # Maximal 39 Kontakte pro Tag
-            for profile in profiles[:settings.DAILY_CONNECTION_LIMIT]:
-                # Verbindungsanfrage senden
-                success = await this.linkedin_service.send_connection_request(profile["profile_url"])
-                
+            try:
+                profiles = await self._search_profiles(keywords, self._search_filters())
+            except BackendUnavailable:
+                breaker.record_failure("search")
+                raise
+            # Suche lesbar: noch kein Urteil über das Senden selbst
+            breaker.release()
+            profiles, rejected = self.screen.profiles(profiles)
+            if rejected:
+                logger.info(f"{len(rejected)} Profile vorab aussortiert (User {self.user_id})")
+            # Bereits angefragte oder importierte Kontakte nicht erneut anschreiben
+            profiles = await run_in_session(self.connections.unknown, profiles)
+            limit = self.settings.daily_connection_limit or settings.DAILY_CONNECTION_LIMIT
+
+            # Begrenzte Tagesaktionen zuerst für die relevantesten Treffer
+            for profile in self.ranker.rank(profiles, self.settings)[:limit]:
+                if not breaker.allow():
+                    logger.warning(f"Verbindungsanfragen für User {self.user_id} pausiert (Circuit Breaker)")
+                    break
+                with trace("connection", profile_url=profile["url"], user_id=self.user_id), \
+                        ACTION_DURATION.labels("connection").time():
+                    success = await self.linkedin_service.send_connection_request(profile["url"])
+                ACTIONS.labels("connection", "success" if success else "failure").inc()
+
                 if success:
-                    # Kontakt in DB speichern
-                    contact = TargetContact(
-                        profile_url=profile["profile_url"],
-                        name=profile["name"],
-                        title=profile["title"],
-                        company=profile["company"],
-                        status=ContactStatus.PENDING,
-                        keywords=",".join(keywords)
-                    )
-                    # TODO: Kontakt in DB speichern
+                    breaker.record_success()
+                    sent.append(profile)
                     logger.info(f"Verbindungsanfrage gesendet an: {profile['name']}")
                 else:
+                    breaker.record_failure()
                     logger.error(f"Fehler beim Senden der Verbindungsanfrage an: {profile['name']}")
-                
+
                 # Zufällige Verzögerung zwischen Anfragen
-                await asyncio.sleep(random.uniform(30, 60))
-                
+                await asyncio.sleep(random.uniform(*self.connection_delay))
+
         except Exception as e:
             logger.error(f"Fehler bei der Verarbeitung der täglichen Verbindungen: {str(e)}")
+        finally:
+            # Gesendete Anfragen als offene Zielkontakte speichern (ein Upsert für alle)
+            if sent:
+                await run_in_session(self.connections.record_requests, sent, keywords)
+
+    async def sync_connections(self):
+        """Gleicht offene Anfragen ab und schreibt nur neu angenommenen Kontakten."""
+        try:
+            breaker = self.breakers["message"]
+            for contact in await self.connections.sync():
+                # Übersprungene Kontakte holt perform_message später nach
+                if not breaker.allow():
+                    break
+                try:
+                    success = await self._send_follow_up(contact)
+                except Exception as e:
+                    # KI- oder Konfigurationsfehler: kein Urteil über LinkedIn, perform_message holt nach
+                    breaker.release()
+                    ACTIONS.labels("message", "error").inc()
+                    logger.error(f"Follow-up an {contact['url']} fehlgeschlagen: {str(e)}")
+                    continue
+                if success is None:
+                    breaker.release()
+                    continue
+                if success:
+                    breaker.record_success()
+                else:
+                    breaker.record_failure()
+                ACTIONS.labels("message", "success" if success else "failure").inc()
+                await asyncio.sleep(random.uniform(*self.connection_delay))
+        except Exception as e:
+            logger.error(f"Fehler beim Abgleich der Verbindungen: {str(e)}")
 
     async def process_interactions(self):
-        """Verarbeitet die regelmäßigen Interaktionen (Likes, Kommentare)."""
+        """Likes und Kommentare für Feed-Beiträge; Kommentare in einem einzigen KI-Request."""
+        # Der Feed-Abruf fällt unter den Like-Breaker (Likes sind die Standardaktion)
+        feed_breaker = self.breakers["like"]
+        if not feed_breaker.allow():
+            return
         try:
-            # TODO: Relevante Posts aus der Timeline oder von Zielkontakten abrufen
-            
-            for post in relevant_posts:
-                # Zufällig entscheiden, ob geliked oder kommentiert wird
-                if random.random() < 0.7:  # 70% Chance für Like
-                    success = await this.linkedin_service.like_post(post.url)
-                    if success:
-                        logger.info(f"Post geliked: {post.url}")
-                else:  # 30% Chance für Kommentar
-                    # KI-generierten Kommentar erstellen
-                    comment = await this.ai_service.generate_comment(post.content)
-                    success = await this.linkedin_service.comment_on_post(post.url, comment)
-                    if success:
-                        logger.info(f"Kommentar hinzugefügt: {post.url}")
-                
+            try:
+                feed_posts = await self._feed_posts()
+            except BackendUnavailable:
+                feed_breaker.record_failure("feed")
+                raise
+            feed_breaker.release()
+
+            posts = []
+            for feed_post in feed_posts:
+                post = await self.linkedin_service.get_post(feed_post["url"])
+                if post:
+                    posts.append(post)
+            # Ausgeschlossene Beiträge weder liken noch kommentieren
+            posts, _ = self.screen.posts(posts)
+
+            # Zufällig entscheiden, ob geliked oder kommentiert wird (70% Like, 30% Kommentar)
+            to_comment = [post for post in posts if post["content"] and random.random() >= 0.7]
+
+            comments: Dict[str, str] = {}
+            try:
+                comments = await self.ai_service.generate_comments_batch(
+                    [{"id": post["url"], "content": post["content"]} for post in to_comment],
+                    variants=settings.AI_CANDIDATES,
+                    selector=await self._candidate_selector(InteractionType.COMMENT, prefer_question=True)
+                )
+            except Exception as e:
+                # Z. B. abgeschnittenes oder ungültiges JSON: diese Runde ohne Kommentare, Likes laufen weiter
+                logger.error(f"Kommentar-Batch für User {self.user_id} fehlgeschlagen, nur Likes: {str(e)}")
+
+            for post in posts:
+                comment = comments.get(post["url"])
+                action = "comment" if comment else "like"
+                breaker = self.breakers[action]
+                if not breaker.allow():
+                    continue
+                with trace(action, post_url=post["url"], user_id=self.user_id), \
+                        ACTION_DURATION.labels(action).time():
+                    if comment:
+                        success = await self.linkedin_service.comment_on_post(post["url"], comment)
+                    else:
+                        success = await self.linkedin_service.like_post(post["url"])
+                ACTIONS.labels(action, "success" if success else "failure").inc()
+                if success:
+                    breaker.record_success()
+                    interaction_type = InteractionType.COMMENT if comment else InteractionType.LIKE
+                    await self._save(self._interaction(interaction_type, post, comment))
+                    logger.info(f"{'Kommentar hinzugefügt' if comment else 'Post geliked'}: {post['url']}")
+                else:
+                    breaker.record_failure()
+
                 # Zufällige Verzögerung zwischen Interaktionen
-                await asyncio.sleep(random.uniform(60, 120))
-                
+                await asyncio.sleep(random.uniform(*self.feed_interaction_delay))
+
         except Exception as e:
             logger.error(f"Fehler bei der Verarbeitung der Interaktionen: {str(e)}")
 
+    async def collect_engagement(self):
+        """Holt die Zahlen fälliger Beiträge und rechnet Änderungen in die Posting-Zeiten ein."""
+        try:
+            changed = await self.engagement.collect()
+            self.send_time.update_many((post_id, published_at, metrics) for post_id, published_at, metrics, _ in changed)
+        except Exception as e:
+            logger.error(f"Fehler beim Sammeln der Engagement-Zahlen: {str(e)}")
+
     async def analyze_post_performance(self):
         """Analysiert die Performance der Posts und gibt Empfehlungen."""
         try:
-            # TODO: Posts aus der DB abrufen, die älter als 24 Stunden sind
-            
-            for post in recent_posts:
-                analysis = await this.ai_service.analyze_post_engagement(post)
-                logger.info(f"Post-Analyse für {post.title}: {analysis['analysis']}")
-                
+            for post_id, analysis in (await self.analyzer.run()).items():
+                logger.debug(f"Post-Analyse für Post {post_id}: {analysis['analysis']}")
+
+        except Exception as e:
+            logger.error(f"Fehler bei der Post-Analyse: {str(e)}")
+
+
+def default_backend(account_settings: AccountSettings) -> BrowserBackend:
+    """Playwright-Backend; eine gespeicherte Session kann über browser_settings.storage_state kommen."""
+    browser_settings = account_settings.browser_settings or {}
+    return LinkedInService(storage_state=browser_settings.get("storage_state"))
+
+
+class SchedulerService:
+    """Ein Scheduler-Loop für alle Accounts auf einem Event-Loop."""
+
+    def __init__(self, backend_factory: Callable[[AccountSettings], BrowserBackend] = default_backend):
+        self.backend_factory = backend_factory
+        self.workers: Dict[int, AccountWorker] = {}
+        self.settings_store = SettingsStore()
+        self.settings_store.add_listener(self._on_settings_changed)
+        self.is_running = False
+        self._jobs: List[Job] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: set = set()
+        self._playwright = None
+        self._browser = None
+        # Geplante Posts aus der DB (Bulk-Planung, API) zum Termin veröffentlichen
+        self.dispatcher = PostDispatcher(self)
+
+    async def start(self, accounts: Optional[List[Union[AccountSettings, Settings]]] = None):
+        """Startet den Browser, registriert die Accounts und läuft bis ``stop()``."""
+        try:
+            self._playwright, self._browser = await launch_browser()
+            if accounts is None:
+                accounts = await run_in_session(SettingsStore.load)
+            for account_settings in accounts:
+                await self.add_account(account_settings)
+            await self.run()
+        except Exception as e:
+            logger.error(f"Fehler im Scheduler-Service: {str(e)}")
+            raise
+        finally:
+            await self.stop()
+
+    async def add_account(self, account_settings: Union[AccountSettings, Settings]) -> AccountWorker:
+        """Öffnet einen Browser-Kontext für den Account und plant seine Jobs ein."""
+        await self.remove_account(account_settings.user_id)
+        worker_settings = self.settings_store.apply([snapshot(account_settings)])[0]
+        backend = self.backend_factory(worker_settings)
+        await backend.initialize(self._browser)
+        worker = AccountWorker(worker_settings, backend)
+        self.workers[worker.user_id] = worker
+        self._schedule_jobs(worker)
+        await self.schedule_posts(worker)
+        return worker
+
+    def _schedule_jobs(self, worker: AccountWorker):
+        """Plant die festen Jobs eines Accounts (ohne Posting-Slots) ein."""
+        now = datetime.now()
+        jobs = worker.jobs() + [
+            # Sonntagabend die Posting-Slots der kommenden Woche neu berechnen
+            ("plan_posts", WeeklyTrigger(6, 22, 0), lambda: self.schedule_posts(worker))
+        ]
+        for name, trigger, func in jobs:
+            self.schedule(Job(
+                next_run=trigger.next_after(now),
+                name=name,
+                user_id=worker.user_id,
+                func=func,
+                trigger=trigger
+            ))
+
+    def _on_settings_changed(self, current: AccountSettings, previous: Optional[AccountSettings]):
+        """Neuer Snapshot: Worker umhängen, bei geänderten Intervallen die Jobs neu planen."""
+        worker = self.workers.get(current.user_id)
+        if worker is None:
+            return
+        worker.settings = current
+        if previous is None:
+            return
+        if previous.model_routes != current.model_routes:
+            # Gleiche AIService-Instanz (auch im EngagementAnalyzer), nur das Routing neu
+            worker.ai_service.set_model_routes(dict(current.model_routes))
+        if previous.interaction_interval != current.interaction_interval:
+            for job in self._jobs:
+                if job.user_id == current.user_id and not job.name.startswith("post_"):
+                    job.cancelled = True
+            self._schedule_jobs(worker)
+        if (previous.post_frequency, previous.auto_publish_posts) != (current.post_frequency, current.auto_publish_posts):
+            task = asyncio.create_task(self.schedule_posts(worker))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        logger.info(f"Einstellungen für User {current.user_id} aktualisiert (Version {current.version})")
+
+    async def _watch_settings(self):
+        """Lädt geänderte Einstellungen nach (``updated_at``) und tauscht die Snapshots aus."""
+        while self.is_running:
+            await asyncio.sleep(settings.SETTINGS_POLL_INTERVAL)
+            try:
+                changed = await run_in_session(self.settings_store.fetch_changed)
+                if changed:
+                    self.settings_store.apply(changed)
+            except Exception as e:
+                logger.error(f"Fehler beim Nachladen der Einstellungen: {str(e)}")
+
+    async def schedule_posts(self, worker: AccountWorker):
+        """Ersetzt die Posting-Jobs eines Accounts durch die aktuell besten Slots.
+
+        Mit Auto-Publish wird zum Slot veröffentlicht. Sonst entsteht der Entwurf
+        ``POST_DRAFT_LEAD_HOURS`` vorher und trägt den Slot als ``scheduled_for``.
+        """
+        for job in self._jobs:
+            if job.user_id == worker.user_id and job.name.startswith("post_"):
+                job.cancelled = True
+        now = datetime.now()
+        for weekday, hour, minute in await worker.plan_post_slots():
+            slot = WeeklyTrigger(weekday, hour, minute)
+            if worker.settings.auto_publish_posts:
+                trigger, func = slot, worker.create_post
+            else:
+                trigger = LeadTrigger(slot, timedelta(hours=settings.POST_DRAFT_LEAD_HOURS))
+                func = lambda slot=slot: worker.create_post(publish_at=slot.next_after(datetime.now()))
+            self.schedule(Job(
+                next_run=trigger.next_after(now),
+                name=f"post_{weekday}_{hour}_{minute}",
+                user_id=worker.user_id,
+                func=func,
+                trigger=trigger
+            ))
+
+    async def remove_account(self, user_id: int):
+        worker = self.workers.pop(user_id, None)
+        if worker is None:
+            return
+        for job in self._jobs:
+            if job.user_id == user_id:
+                job.cancelled = True
+        self.settings_store.remove(user_id)
+        async with worker.lock:
+            await worker.linkedin_service.close()
+
+    def schedule(self, job: Job):
+        heapq.heappush(self._jobs, job)
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def run(self):
+        """Schläft bis zum nächsten fälligen Job, startet ihn und plant ihn neu ein."""
+        self.is_running = True
+        self._wakeup = asyncio.Event()
+        for coroutine in (self.dispatcher.run(), self._watch_settings()):
+            task = asyncio.create_task(coroutine)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        while self.is_running:
+            now = datetime.now()
+            while self._jobs and self._jobs[0].next_run <= now:
+                job = heapq.heappop(self._jobs)
+                if job.cancelled:
+                    continue
+                self._spawn(job)
+                job.next_run = job.trigger.next_after(now)
+                heapq.heappush(self._jobs, job)
+
+            timeout = (self._jobs[0].next_run - now).total_seconds() if self._jobs else None
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _spawn(self, job: Job):
+        if job.running:
+            # Vorheriger Lauf noch aktiv: diesen Termin auslassen
+            logger.warning(f"Job {job.name} (User {job.user_id}) läuft noch, Termin übersprungen")
+            return
+        task = asyncio.create_task(self._run_job(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_job(self, job: Job):
+        worker = self.workers.get(job.user_id)
+        if worker is None:
+            return
+        job.running = True
+        try:
+            async with worker.lock:
+                await job.func()
         except Exception as e:
-            logger.error(f"Fehler bei der Post-Analyse: {str(e)}") 
\ No newline at end of file
+            logger.error(f"Job {job.name} (User {job.user_id}) fehlgeschlagen: {str(e)}")
+        finally:
+            job.running = False
+
+    async def stop(self):
+        """Beendet den Loop, laufende Jobs und den Browser."""
+        self.is_running = False
+        self.dispatcher.stop()
+        if self._wakeup is not None:
+            self._wakeup.set()
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        for user_id in list(self.workers):
+            await self.remove_account(user_id)
+        self._jobs.clear()
+        if self._browser is not None:
+            await self._browser.close()
+            await self._playwright.stop()
+            self._browser = None
+            self._playwright = None
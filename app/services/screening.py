@@ -0,0 +1,108 @@
+"""Vorauswahl von Profilen und Beiträgen anhand der Zielgruppen-Einstellungen.
+
+Aus ``excluded_keywords``, ``target_positions``, ``target_seniority`` und
+``target_company_sizes`` wird pro Liste ein einziger, vorkompilierter Regex
+(Alternation mit Wortgrenzen, case-insensitive) gebaut. Ein Kandidat wird damit in
+Mikrosekunden geprüft – bevor ein KI-Aufruf oder eine Navigation Zeit kostet. Jeder
+abgelehnte Kandidat bekommt einen Grund (``excluded_keyword:<Begriff>``, ``position``, ...).
+"""
+from typing import Dict, Iterable, List, Optional, Pattern, Sequence, Tuple
+from dataclasses import dataclass
+import logging
+import re
+
+from app.core.metrics import SCREENING
+
+logger = logging.getLogger(__name__)
+
+# Profilfelder, die gegen die Listen geprüft werden
+PROFILE_TEXT_FIELDS = ("name", "title", "company")
+POST_TEXT_FIELDS = ("name", "content")
+
+
+def compile_terms(terms: Iterable[str]) -> Optional[Pattern]:
+    """Eine Alternation für alle Begriffe; längere zuerst, damit "Senior Manager" vor "Manager" greift."""
+    unique = sorted({term.strip().lower() for term in terms if term and term.strip()}, key=len, reverse=True)
+    if not unique:
+        return None
+    return re.compile(r"(?<!\w)(?:" + "|".join(re.escape(term) for term in unique) + r")(?!\w)", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class Rejection:
+    candidate: Dict
+    reason: str
+
+
+class CandidateScreen:
+    """Vorkompilierte Filter eines Settings-Snapshots (``version`` zum Erkennen von Änderungen)."""
+
+    def __init__(
+        self,
+        excluded_keywords: Sequence[str] = (),
+        target_positions: Sequence[str] = (),
+        target_seniority: Sequence[str] = (),
+        target_company_sizes: Sequence[str] = (),
+        version: int = 0
+    ):
+        self.version = version
+        self.excluded = compile_terms(excluded_keywords)
+        # Positive Kriterien: nur aktiv, wenn die Liste gefüllt ist
+        self.required: Tuple[Tuple[str, str, Pattern], ...] = tuple(
+            (reason, field, pattern)
+            for reason, field, pattern in (
+                ("position", "title", compile_terms(target_positions)),
+                ("seniority", "title", compile_terms(target_seniority)),
+                ("company_size", "company_size", compile_terms(target_company_sizes)),
+            )
+            if pattern is not None
+        )
+
+    @classmethod
+    def from_settings(cls, account_settings) -> "CandidateScreen":
+        return cls(
+            excluded_keywords=account_settings.excluded_keywords,
+            target_positions=account_settings.target_positions,
+            target_seniority=account_settings.target_seniority,
+            target_company_sizes=account_settings.target_company_sizes,
+            version=account_settings.version
+        )
+
+    def reject_reason(self, candidate: Dict, text_fields: Sequence[str], check_targeting: bool) -> Optional[str]:
+        """None, wenn der Kandidat passt, sonst der erste Ablehnungsgrund."""
+        if self.excluded is not None:
+            text = " \n ".join(str(candidate.get(field) or "") for field in text_fields)
+            match = self.excluded.search(text)
+            if match:
+                return f"excluded_keyword:{match.group(0).lower()}"
+        if check_targeting:
+            for reason, field, pattern in self.required:
+                value = candidate.get(field)
+                # Felder, die die Suche nicht liefert (z. B. Unternehmensgröße), nicht gegen den Kandidaten werten
+                if value is None:
+                    continue
+                if not pattern.search(str(value)):
+                    return reason
+        return None
+
+    def _screen(self, kind: str, candidates: Iterable[Dict], text_fields, check_targeting) -> Tuple[List[Dict], List[Rejection]]:
+        accepted, rejected = [], []
+        for candidate in candidates:
+            reason = self.reject_reason(candidate, text_fields, check_targeting)
+            if reason is None:
+                accepted.append(candidate)
+            else:
+                rejected.append(Rejection(candidate, reason))
+                SCREENING.labels(kind, reason.split(":", 1)[0]).inc()
+        SCREENING.labels(kind, "accepted").inc(len(accepted))
+        for rejection in rejected:
+            logger.debug(f"{kind} abgelehnt ({rejection.reason}): {rejection.candidate.get('url')}")
+        return accepted, rejected
+
+    def profiles(self, profiles: Iterable[Dict]) -> Tuple[List[Dict], List[Rejection]]:
+        """Profile aus der Suche: Ausschlussbegriffe plus Position/Seniorität/Unternehmensgröße."""
+        return self._screen("profile", profiles, PROFILE_TEXT_FIELDS, check_targeting=True)
+
+    def posts(self, posts: Iterable[Dict]) -> Tuple[List[Dict], List[Rejection]]:
+        """Beiträge: nur Ausschlussbegriffe in Autor und Text."""
+        return self._screen("post", posts, POST_TEXT_FIELDS, check_targeting=False)
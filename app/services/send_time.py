@@ -0,0 +1,129 @@
+"""Beste Posting-Zeiten pro Account aus der Engagement-Historie.
+
+Die Historie wird als 7x24-Matrix (Wochentag x Stunde) aus Summen und Anzahlen der
+Engagement-Scores gehalten. Neue oder geänderte Metriken werden inkrementell eingerechnet
+(alter Beitrag eines Posts raus, neuer rein); die Auswertung ist ein vektorisierter Pass
+über die Matrix. Wochentag und Stunde sind lokale Zeit wie in den Triggern des Schedulers;
+``update_many`` erwartet ``published_at`` daher lokal ohne Zone (``to_local_naive``).
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+from datetime import datetime
+import json
+import logging
+import random
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.clock import to_local_naive
+from app.core.config import settings
+from app.models.post import Post, PostStatus
+
+logger = logging.getLogger(__name__)
+
+ENGAGEMENT_WEIGHTS = {"likes": 1.0, "comments": 2.0, "shares": 3.0}
+
+# Glättung über benachbarte Stunden (zyklisch)
+HOUR_KERNEL = (0.25, 0.5, 0.25)
+
+
+def engagement_score(metrics) -> float:
+    """Gewichtete Summe der Engagement-Zahlen eines Posts."""
+    if isinstance(metrics, str):
+        metrics = json.loads(metrics) if metrics else {}
+    return float(sum(weight * (metrics or {}).get(key, 0) for key, weight in ENGAGEMENT_WEIGHTS.items()))
+
+
+class SendTimeOptimizer:
+    """Inkrementell gepflegte Engagement-Aggregate und daraus abgeleitete Posting-Slots."""
+
+    def __init__(self, user_id: int):
+        self.user_id = user_id
+        self.sums = np.zeros((7, 24))
+        self.counts = np.zeros((7, 24))
+        # post_id -> (Wochentag, Stunde, Score), um Aktualisierungen herausrechnen zu können
+        self._contributions: Dict[int, Tuple[int, int, float]] = {}
+        self._refreshed_at: Optional[datetime] = None
+
+    @property
+    def history_size(self) -> int:
+        return len(self._contributions)
+
+    def update(self, post_id: int, published_at: datetime, metrics) -> None:
+        """Rechnet die (neuen) Metriken eines einzelnen Posts ein."""
+        self.update_many([(post_id, published_at, metrics)])
+
+    def update_many(self, rows: Iterable[Tuple[int, datetime, object]]) -> None:
+        """Rechnet viele Posts auf einmal ein; vorherige Beiträge derselben Posts werden ersetzt."""
+        # Pro Post nur der letzte Stand
+        rows = list({row[0]: row for row in rows if row[1] is not None}.values())
+        if not rows:
+            return
+
+        old = [self._contributions[post_id] for post_id, _, _ in rows if post_id in self._contributions]
+        if old:
+            days, hours, scores = (np.array(column) for column in zip(*old))
+            np.subtract.at(self.sums, (days, hours), scores)
+            np.subtract.at(self.counts, (days, hours), 1)
+
+        days = np.fromiter((published_at.weekday() for _, published_at, _ in rows), dtype=int, count=len(rows))
+        hours = np.fromiter((published_at.hour for _, published_at, _ in rows), dtype=int, count=len(rows))
+        scores = np.fromiter((engagement_score(metrics) for _, _, metrics in rows), dtype=float, count=len(rows))
+        np.add.at(self.sums, (days, hours), scores)
+        np.add.at(self.counts, (days, hours), 1)
+
+        for (post_id, _, _), day, hour, score in zip(rows, days, hours, scores):
+            self._contributions[post_id] = (int(day), int(hour), float(score))
+
+    def refresh(self, db: Session) -> int:
+        """Lädt nur Posts, deren Metriken sich seit dem letzten Refresh geändert haben."""
+        query = db.query(Post.id, Post.published_at, Post.engagement_metrics, Post.updated_at).filter(
+            Post.user_id == self.user_id,
+            Post.status == PostStatus.PUBLISHED,
+            Post.published_at.isnot(None),
+            Post.engagement_metrics.isnot(None)
+        )
+        if self._refreshed_at is not None:
+            query = query.filter(Post.updated_at > self._refreshed_at)
+
+        rows = query.all()
+        # Wie im Collector: DB-Zeit (UTC) auf lokale Zeit, sonst landet ein Post je nach Weg im falschen Slot
+        self.update_many((row.id, to_local_naive(row.published_at), row.engagement_metrics) for row in rows)
+        timestamps = [row.updated_at for row in rows if row.updated_at is not None]
+        if timestamps and (self._refreshed_at is None or max(timestamps) > self._refreshed_at):
+            self._refreshed_at = max(timestamps)
+        return len(rows)
+
+    def slot_scores(self) -> np.ndarray:
+        """Erwartetes Engagement pro Wochentag/Stunde; Stunden außerhalb des Fensters sind -inf."""
+        total = self.counts.sum()
+        prior = self.sums.sum() / total if total else 0.0
+        # Schwach belegte Slots Richtung Gesamtmittel ziehen
+        k = settings.SEND_TIME_PRIOR_WEIGHT
+        scores = (self.sums + k * prior) / (self.counts + k)
+        scores = sum(weight * np.roll(scores, shift, axis=1) for shift, weight in zip((1, 0, -1), HOUR_KERNEL))
+
+        hours = np.arange(24)
+        window = (hours >= settings.POST_WINDOW_START_HOUR) & (hours <= settings.POST_WINDOW_END_HOUR)
+        scores[:, ~window] = -np.inf
+        return scores
+
+    def best_slots(self, n: int) -> Optional[List[Tuple[int, int, int]]]:
+        """Die ``n`` besten Slots auf verschiedenen Wochentagen, oder None bei zu wenig Historie."""
+        if n <= 0:
+            return []
+        if self.history_size < settings.SEND_TIME_MIN_HISTORY:
+            return None
+        scores = self.slot_scores()
+        best_hours = scores.argmax(axis=1)
+        best_days = np.argsort(-scores.max(axis=1), kind="stable")[:min(n, 7)]
+        return [(int(day), int(best_hours[day]), random.randint(0, 59)) for day in sorted(best_days)]
+
+
+def random_slots(n: int) -> List[Tuple[int, int, int]]:
+    """Fallback ohne Historie: zufällige Tage, Uhrzeit im Posting-Fenster."""
+    days = random.sample(range(7), min(n, 7))
+    return [
+        (day, random.randint(settings.POST_WINDOW_START_HOUR, settings.POST_WINDOW_END_HOUR), random.randint(0, 59))
+        for day in sorted(days)
+    ]
@@ -0,0 +1,273 @@
+"""Inkrementell gepflegte Dashboard-Statistiken.
+
+Bei jedem Flush werden neue, geänderte und gelöschte Posts/Interaktionen in Deltas für
+``stat_counters`` übersetzt und in derselben Transaktion per Upsert addiert. Die
+Tagesaktivität zählt nach dem UTC-Datum von ``created_at``, inkrementell wie bei
+``rebuild_counters``; Löschen nimmt auch sie wieder zurück. Die
+Zusammenfassung liest dann nur noch eine feste Anzahl Zählerzeilen, unabhängig davon,
+wie viel Historie existiert. Jeder Flush mit Änderungen erhöht die Revision der
+betroffenen Benutzer (eine Zeile pro Benutzer statt einer globalen, die alle Schreiber
+serialisieren würde); das ETag von ``/stats/summary`` wird daraus gebildet, für "alle"
+aus der Summe der Revisionen.
+
+ORM-Bulk-Updates (``db.execute(update(Post), ...)``) laufen nicht durch den Flush; wer
+darüber Status ändert, muss ``rebuild_counters`` aufrufen.
+"""
+from typing import Dict, Optional, Tuple
+from collections import Counter
+from datetime import datetime, timedelta
+import logging
+
+from sqlalchemy import delete, func, inspect, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.core.clock import as_utc, utcnow
+from app.models.interaction import Interaction
+from app.models.post import Post
+from app.models.stat_counter import StatCounter
+
+logger = logging.getLogger(__name__)
+
+# Tage Tagesaktivität in der Zusammenfassung (Standard)
+DEFAULT_DAYS = 30
+
+CounterKey = Tuple[int, str, str]
+
+
+def _value(obj, attr: str):
+    value = getattr(obj, attr)
+    if value is None:
+        # Python-seitiger Spalten-Default (z. B. PostStatus.DRAFT), falls noch nicht gesetzt
+        default = inspect(type(obj)).columns[attr].default
+        value = default.arg if default is not None and default.is_scalar else None
+    return getattr(value, "value", value)
+
+
+def _tracked(model) -> Tuple[str, ...]:
+    """Spalten, von denen die Zähler eines Posts bzw. einer Interaktion abhängen."""
+    if model is Interaction:
+        return "user_id", "type", "status", "created_at"
+    return "user_id", "status", "created_at"
+
+
+def activity_day(created_at: Optional[datetime]) -> str:
+    """Tag der Tagesaktivität: UTC-Datum von ``created_at`` (noch nicht gesetzt: heute)."""
+    return (as_utc(created_at) or utcnow()).date().isoformat()
+
+
+def _counters(model, values: Dict) -> Tuple[CounterKey, CounterKey]:
+    """Zählerschlüssel (Stand, Tagesaktivität) zu den Werten aus ``_tracked``."""
+    user_id = values["user_id"] or 0
+    status = getattr(values["status"], "value", values["status"])
+    day = activity_day(values["created_at"])
+    if model is Interaction:
+        interaction_type = getattr(values["type"], "value", values["type"])
+        return (user_id, "interactions", f"{interaction_type}:{status}"), (user_id, "activity_interactions", day)
+    return (user_id, "posts", str(status)), (user_id, "activity_posts", day)
+
+
+def _previous_values(session: Session, objs) -> Dict:
+    """Werte vor der Änderung je Objekt; was nicht geladen war, wird gesammelt nachgelesen."""
+    previous: Dict = {}
+    missing: Dict = {}
+    for obj in objs:
+        state = inspect(obj)
+        values = {}
+        for attr in _tracked(type(obj)):
+            history = state.attrs[attr].history
+            if history.deleted:
+                values[attr] = history.deleted[0]
+            elif attr in state.unloaded or history.added:
+                # Abgelaufen bzw. ohne geladenen Vorwert gesetzt: Stand aus der DB
+                missing.setdefault(type(obj), []).append(state)
+                break
+            else:
+                values[attr] = getattr(obj, attr)
+        else:
+            previous[state] = values
+
+    for model, states in missing.items():
+        columns = [getattr(model, attr) for attr in _tracked(model)]
+        rows = session.connection().execute(
+            select(model.id, *columns).where(model.id.in_([state.identity[0] for state in states]))
+        )
+        loaded = {row[0]: dict(zip(_tracked(model), row[1:])) for row in rows}
+        for state in states:
+            if state.identity[0] in loaded:
+                previous[state] = loaded[state.identity[0]]
+    return previous
+
+
+def flush_deltas(session: Session) -> Counter:
+    """Zähler-Deltas aller Posts/Interaktionen im anstehenden Flush.
+
+    Läuft vor dem Flush: Vorwerte gelöschter oder abgelaufener Objekte sind danach nicht
+    mehr lesbar.
+    """
+    deltas: Counter = Counter()
+    for obj in session.new:
+        if isinstance(obj, (Post, Interaction)):
+            model = type(obj)
+            for key in _counters(model, {attr: _value(obj, attr) for attr in _tracked(model)}):
+                deltas[key] += 1
+
+    changed = [
+        obj for obj in session.dirty
+        if isinstance(obj, (Post, Interaction)) and session.is_modified(obj)
+        and any(inspect(obj).attrs[attr].history.added for attr in _tracked(type(obj)))
+    ]
+    deleted = [obj for obj in session.deleted if isinstance(obj, (Post, Interaction))]
+    previous = _previous_values(session, changed + deleted)
+
+    for obj in changed:
+        state = inspect(obj)
+        before = previous.get(state)
+        if before is None:
+            continue
+        after = {
+            attr: state.attrs[attr].history.added[0] if state.attrs[attr].history.added else value
+            for attr, value in before.items()
+        }
+        for key in _counters(type(obj), before):
+            deltas[key] -= 1
+        for key in _counters(type(obj), after):
+            deltas[key] += 1
+    for obj in deleted:
+        before = previous.get(inspect(obj))
+        if before is not None:
+            for key in _counters(type(obj), before):
+                deltas[key] -= 1
+    return Counter({key: delta for key, delta in deltas.items() if delta})
+
+
+def _insert(dialect: str):
+    if dialect == "postgresql":
+        return postgresql.insert
+    if dialect == "sqlite":
+        return sqlite.insert
+    raise ValueError(f"Upsert wird für {dialect} nicht unterstützt")
+
+
+def apply_deltas(connection, deltas: Dict[CounterKey, int]) -> None:
+    """Addiert Deltas per INSERT ... ON CONFLICT und erhöht die Revision der betroffenen Benutzer."""
+    deltas = Counter(deltas)
+    for user_id in {user_id for user_id, _, _ in deltas}:
+        deltas[(user_id, "revision", "")] += 1
+    # Feste Reihenfolge: parallele Flushes sperren die Zeilen in derselben Abfolge
+    rows = [
+        {"user_id": user_id, "metric": metric, "key": key, "value": value}
+        for (user_id, metric, key), value in sorted(deltas.items())
+    ]
+    table = StatCounter.__table__
+    stmt = _insert(connection.dialect.name)(table).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "metric", "key"],
+        set_={"value": table.c.value + stmt.excluded.value}
+    )
+    connection.execute(stmt)
+
+
+def instrument_stats(session_factory) -> None:
+    """Registriert das Fortschreiben der Zähler bei jedem Flush."""
+    from sqlalchemy import event
+
+    @event.listens_for(session_factory, "before_flush")
+    def _before_flush(session, flush_context, instances):
+        session.info["stat_deltas"] = flush_deltas(session)
+
+    @event.listens_for(session_factory, "after_flush")
+    def _after_flush(session, flush_context):
+        deltas = session.info.pop("stat_deltas", None)
+        if deltas:
+            # Direkt über die Connection: ein ORM-Execute würde erneut flushen
+            apply_deltas(session.connection(), deltas)
+
+
+def revision(db: Session, user_id: Optional[int] = None) -> int:
+    """Revision eines Benutzers bzw. Summe aller Revisionen (steigt bei jeder Änderung)."""
+    query = select(func.sum(StatCounter.value)).where(StatCounter.metric == "revision", StatCounter.key == "")
+    if user_id is not None:
+        query = query.where(StatCounter.user_id == user_id)
+    return int(db.execute(query).scalar() or 0)
+
+
+def summary(db: Session, user_id: Optional[int] = None, days: int = DEFAULT_DAYS) -> Dict:
+    """Zählerstände pro Interaktionstyp/-status, Post-Status und Tag (letzte ``days`` Tage)."""
+    since = (utcnow().date() - timedelta(days=days - 1)).isoformat()
+    query = (
+        select(StatCounter.metric, StatCounter.key, func.sum(StatCounter.value))
+        .where(
+            StatCounter.metric != "revision",
+            (~StatCounter.metric.startswith("activity_")) | (StatCounter.key >= since)
+        )
+        .group_by(StatCounter.metric, StatCounter.key)
+        # Durch Löschen oder Statuswechsel auf 0 gefallene Zähler nicht ausgeben
+        .having(func.sum(StatCounter.value) != 0)
+    )
+    if user_id is not None:
+        query = query.where(StatCounter.user_id == user_id)
+
+    interactions: Dict[str, Dict[str, int]] = {}
+    posts: Dict[str, int] = {}
+    activity: Dict[str, Dict[str, int]] = {}
+    for metric, key, value in db.execute(query):
+        if metric == "interactions":
+            interaction_type, status = key.split(":", 1)
+            interactions.setdefault(interaction_type, {})[status] = int(value)
+        elif metric == "posts":
+            posts[key] = int(value)
+        else:
+            activity.setdefault(key, {"interactions": 0, "posts": 0})[metric[len("activity_"):]] = int(value)
+
+    return {
+        "interactions": interactions,
+        "posts": posts,
+        "daily_activity": [{"date": day, **activity[day]} for day in sorted(activity)],
+        "generated_at": datetime.utcnow().isoformat()
+    }
+
+
+def _utc_date(dialect: str, column):
+    """UTC-Datum einer Zeitstempel-Spalte in SQL, wie ``activity_day``."""
+    if dialect == "postgresql":
+        return func.date(func.timezone("UTC", column))
+    # SQLite speichert die Zeitstempel bereits als UTC
+    return func.date(column)
+
+
+def rebuild_counters(db: Session) -> int:
+    """Berechnet alle Zähler neu aus Posts und Interaktionen (Erstbefüllung/Reparatur)."""
+    deltas: Counter = Counter()
+    dialect = db.get_bind().dialect.name
+    interaction_day = _utc_date(dialect, Interaction.created_at)
+    post_day = _utc_date(dialect, Post.created_at)
+    interaction_rows = db.execute(
+        select(
+            Interaction.user_id, Interaction.type, Interaction.status,
+            interaction_day, func.count()
+        ).group_by(Interaction.user_id, Interaction.type, Interaction.status, interaction_day)
+    )
+    for user_id, interaction_type, status, day, count in interaction_rows:
+        key = f"{getattr(interaction_type, 'value', interaction_type)}:{getattr(status, 'value', status)}"
+        deltas[(user_id or 0, "interactions", key)] += count
+        if day is not None:
+            deltas[(user_id or 0, "activity_interactions", str(day))] += count
+
+    post_rows = db.execute(
+        select(Post.user_id, Post.status, post_day, func.count())
+        .group_by(Post.user_id, Post.status, post_day)
+    )
+    for user_id, status, day, count in post_rows:
+        deltas[(user_id or 0, "posts", str(getattr(status, "value", status)))] += count
+        if day is not None:
+            deltas[(user_id or 0, "activity_posts", str(day))] += count
+
+    db.execute(delete(StatCounter).where(StatCounter.metric != "revision"))
+    # Auch Benutzer ohne verbleibende Zähler bekommen ein neues ETag
+    db.execute(
+        update(StatCounter).where(StatCounter.metric == "revision").values(value=StatCounter.value + 1)
+    )
+    apply_deltas(db.connection(), deltas)
+    db.commit()
+    return len(deltas)
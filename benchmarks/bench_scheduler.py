@@ -0,0 +1,171 @@
+"""End-to-End-Benchmark für Durchsatz und Latenz des Schedulers.
+
+Treibt ``AccountWorker.perform_interaction``, ``create_post`` und
+``process_daily_connections`` des asynchronen Schedulers gegen lokale Stand-ins:
+Fake-OpenAI-Server, LinkedIn-Attrappe und eine temporäre SQLite-Datenbank.
+
+    python -m benchmarks.bench_scheduler --iterations 50 --output bench.json
+    python -m benchmarks.bench_scheduler --baseline bench_alt.json --output bench.json
+
+Benötigt ``playwright install chromium``.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+
+from benchmarks.fakes.linkedin_site import FakeLinkedInConfig, FakeLinkedInSite
+from benchmarks.fakes.openai_server import FakeOpenAIConfig, FakeOpenAIServer, LatencyDistribution
+from benchmarks.harness import ActionRecorder, StatementCounter, compare, write_results
+
+PERFORM_ACTIONS = ("like", "comment", "connection", "message", "share")
+
+DEFAULT_SETTINGS = {
+    "post_frequency": 3,
+    "interaction_interval": 60,
+    "auto_publish_posts": True,
+    "target_industries": ["Software"],
+    "target_locations": ["Berlin"],
+    "target_keywords": ["Software Engineer", "Product Manager"],
+    "interaction_types": list(PERFORM_ACTIONS),
+    "post_topics": ["KI im Vertrieb", "Remote Leadership"],
+    "post_tones": ["professionell", "locker"],
+    "post_lengths": ["kurz", "mittel"],
+    "post_hashtags": ["#ki", "#leadership", "#vertrieb", "#software"],
+    "message_templates": {
+        "connection": ["Hallo {name}, gerne würde ich mich vernetzen."],
+        "follow_up": ["Danke fürs Vernetzen, {name}!"]
+    }
+}
+
+
+def configure_environment(database_url: str, openai_url: str, linkedin_url: str):
+    """Setzt die Umgebung, bevor die App-Module (und ihre Settings) importiert werden."""
+    os.environ["SQLALCHEMY_DATABASE_URI"] = database_url
+    os.environ["OPENAI_API_URL"] = openai_url
+    os.environ["OPENAI_API_KEY"] = "sk-fake"
+    os.environ["LINKEDIN_BASE_URL"] = linkedin_url
+    for key in ("LINKEDIN_EMAIL", "LINKEDIN_PASSWORD", "POSTGRES_SERVER", "POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DB"):
+        os.environ.setdefault(key, "benchmark")
+
+
+def seed_database():
+    """Legt Tabellen, einen Benutzer und dessen Einstellungen an."""
+    from app.db.base_class import Base
+    from app.db.session import SessionLocal, get_engine
+    from app.models.interaction import Interaction  # noqa: F401 - Mapper registrieren
+    from app.models.post import Post  # noqa: F401
+    from app.models.settings import Settings
+    from app.models.target_contact import TargetContact  # noqa: F401
+    from app.models.user import User
+
+    engine = get_engine()
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    user = User(email="bench@example.com", hashed_password="x", is_active=True)
+    db.add(user)
+    db.flush()
+    db.add(Settings(user_id=user.id, **DEFAULT_SETTINGS))
+    db.commit()
+    return db, engine, user.id
+
+
+async def bench_engine(args, engine, user_id) -> dict:
+    """Misst perform_interaction (pro perform_*-Aktion), create_post und process_daily_connections."""
+    from app.core.config import settings
+    from app.db.session import run_in_session
+    from app.models.settings import Settings
+    from app.services.linkedin_service import LinkedInService, launch_browser
+    from app.services.scheduler_service import AccountWorker
+
+    counter = StatementCounter(engine)
+    recorder = ActionRecorder(counter)
+
+    account = await run_in_session(lambda db: db.query(Settings).filter(Settings.user_id == user_id).one())
+    playwright, browser = await launch_browser()
+    backend = LinkedInService()
+    await backend.initialize(browser)
+    worker = AccountWorker(account, backend)
+    worker.interaction_pause = worker.connection_delay = worker.feed_interaction_delay = (0, 0)
+
+    # perform_*-Methoden instrumentieren, damit jede Aktion einzeln gemessen wird
+    for action in PERFORM_ACTIONS:
+        method = getattr(worker, f"perform_{action}")
+
+        async def measured(method=method, action=action):
+            with recorder.measure(f"perform_{action}"):
+                return await method()
+
+        setattr(worker, f"perform_{action}", measured)
+
+    try:
+        for _ in range(args.iterations):
+            with recorder.measure("perform_interaction"):
+                await worker.perform_interaction()
+        for _ in range(args.post_iterations):
+            with recorder.measure("create_post"):
+                await worker.create_post()
+        for _ in range(args.connection_iterations):
+            with recorder.measure("process_daily_connections") as sample:
+                await worker.process_daily_connections()
+                # Verbindungsanfragen landen (noch) nicht zwingend in der DB
+                sample["success"] = True
+    finally:
+        counter.close()
+        await backend.close()
+        await browser.close()
+        await playwright.stop()
+
+    summary = recorder.summary([f"perform_{action}" for action in PERFORM_ACTIONS])
+    summary["connections_per_run"] = account.daily_connection_limit or settings.DAILY_CONNECTION_LIMIT
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scheduler-Benchmark gegen lokale Stand-ins")
+    parser.add_argument("--iterations", type=int, default=50, help="Aufrufe von perform_interaction")
+    parser.add_argument("--post-iterations", type=int, default=10, help="Aufrufe von create_post")
+    parser.add_argument("--connection-iterations", type=int, default=3, help="Läufe von process_daily_connections")
+    parser.add_argument("--openai-latency", default="lognormal:0.3,0.4")
+    parser.add_argument("--linkedin-latency", default="uniform:0.05,0.2")
+    parser.add_argument("--openai-error-rate", type=float, default=0.0)
+    parser.add_argument("--openai-rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--baseline", help="Früheres Ergebnis-JSON zum Vergleich")
+    args = parser.parse_args(argv)
+
+    random.seed(args.seed)
+    openai_config = FakeOpenAIConfig(
+        latency=LatencyDistribution.parse(args.openai_latency),
+        error_rate=args.openai_error_rate,
+        rate_limit_rate=args.openai_rate_limit_rate,
+        seed=args.seed
+    )
+    linkedin_config = FakeLinkedInConfig(latency=LatencyDistribution.parse(args.linkedin_latency), seed=args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp, \
+            FakeOpenAIServer(openai_config) as openai_server, \
+            FakeLinkedInSite(linkedin_config) as linkedin_site:
+        configure_environment(f"sqlite:///{tmp}/bench.db", openai_server.url, linkedin_site.base_url)
+        db, engine, user_id = seed_database()
+
+        db.close()
+        results = {"suites": {"engine": asyncio.run(bench_engine(args, engine, user_id))}}
+
+        results["openai_requests"] = len(openai_server.requests)
+        results["linkedin_hits"] = dict(linkedin_site.hits)
+
+    write_results(args.output, results, vars(args))
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            for line in compare(json.load(f), results):
+                print(line)
+
+
+if __name__ == "__main__":
+    main()
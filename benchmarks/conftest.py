@@ -0,0 +1,44 @@
+import pytest
+
+from benchmarks.fakes.linkedin_site import FakeLinkedInConfig, FakeLinkedInSite
+from benchmarks.fakes.openai_server import FakeOpenAIConfig, FakeOpenAIServer
+
+
+@pytest.fixture
+def fake_openai_config() -> FakeOpenAIConfig:
+    """Standardverhalten des Fake-OpenAI-Servers; in Benchmarks überschreibbar."""
+    return FakeOpenAIConfig(seed=0)
+
+
+@pytest.fixture
+def fake_openai(fake_openai_config, monkeypatch):
+    """Startet den Fake-OpenAI-Server und leitet OPENAI_API_URL darauf um."""
+    import openai
+    from app.core.config import settings
+
+    with FakeOpenAIServer(fake_openai_config) as server:
+        monkeypatch.setenv("OPENAI_API_URL", server.url)
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-fake")
+        # Bereits geladene Settings und den globalen Client ebenfalls umbiegen
+        monkeypatch.setattr(settings, "OPENAI_API_URL", server.url)
+        monkeypatch.setattr(settings, "OPENAI_API_KEY", "sk-fake")
+        monkeypatch.setattr(openai, "api_base", server.url, raising=False)
+        monkeypatch.setattr(openai, "api_key", "sk-fake", raising=False)
+        yield server
+
+
+@pytest.fixture
+def fake_linkedin_config() -> FakeLinkedInConfig:
+    """Standardverhalten der LinkedIn-Attrappe; in Benchmarks überschreibbar."""
+    return FakeLinkedInConfig(seed=0)
+
+
+@pytest.fixture
+def fake_linkedin(fake_linkedin_config, monkeypatch):
+    """Startet die LinkedIn-Attrappe und stellt LINKEDIN_BASE_URL darauf um."""
+    from app.core.config import settings
+
+    with FakeLinkedInSite(fake_linkedin_config) as site:
+        monkeypatch.setenv("LINKEDIN_BASE_URL", site.base_url)
+        monkeypatch.setattr(settings, "LINKEDIN_BASE_URL", site.base_url)
+        yield site
@@ -0,0 +1,237 @@
+"""Lokale LinkedIn-Attrappe mit aufgezeichneten HTML-Fixtures.
+
+Liefert Login-, Feed-, Such-, Profil-, Netzwerk- und Beitragsseiten mit genau den
+Selektoren, auf die sich der Selenium- und der Playwright-``LinkedInService``
+verlassen (``#username``, ``.feed-identity-module``, ``.search-result__info``,
+``.entity-result__item``, ``.ql-editor``, ...). Beide Services werden über
+``LINKEDIN_BASE_URL`` auf die Attrappe umgestellt.
+
+Start als eigenständiger Prozess:
+    python -m benchmarks.fakes.linkedin_site --port 8090 --latency uniform:0.05,0.2
+"""
+from typing import Dict, Optional
+from collections import Counter
+from dataclasses import dataclass, field
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from string import Template
+from urllib.parse import parse_qs, urlsplit
+import argparse
+import hashlib
+import random
+import threading
+import time
+
+from benchmarks.fakes.openai_server import LatencyDistribution
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures" / "linkedin"
+
+FIRST_NAMES = ["Anna", "Ben", "Clara", "David", "Eva", "Felix", "Greta", "Jonas", "Lena", "Paul"]
+LAST_NAMES = ["Müller", "Schmidt", "Schneider", "Fischer", "Weber", "Meyer", "Wagner", "Becker"]
+TITLES = ["Software Engineer", "Product Manager", "Data Scientist", "Head of Sales", "CTO", "Marketing Lead"]
+COMPANIES = ["Acme GmbH", "Beispiel AG", "Muster Tech", "Nordlicht Software", "Datenwerk"]
+DEGREES = ["1st", "2nd", "3rd"]
+
+
+@dataclass
+class FakeLinkedInConfig:
+    """Verhalten der LinkedIn-Attrappe."""
+    latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    results_per_page: int = 10
+    feed_updates: int = 10
+    seed: Optional[int] = 0
+
+
+def _load_fixtures() -> Dict[str, Template]:
+    return {path.stem: Template(path.read_text(encoding="utf-8")) for path in FIXTURES_DIR.glob("*.html")}
+
+
+def _person(key: str) -> Dict[str, str]:
+    """Deterministische Personendaten aus einem Schlüssel (Slug oder Suchindex)."""
+    rng = random.Random(hashlib.sha1(key.encode("utf-8")).hexdigest())
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    return {
+        "slug": f"{first}-{last}-{key[:6]}".lower(),
+        "name": f"{first} {last}",
+        "title": rng.choice(TITLES),
+        "company": rng.choice(COMPANIES),
+        "location": "Berlin, Deutschland",
+        "degree": rng.choice(DEGREES)
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "FakeLinkedInSite"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_html(self, status: int, body: str):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        path = url.path.rstrip("/") + "/"
+        query = parse_qs(url.query)
+        route, body = self.server.render(path, query)
+        self.server.record(route)
+        time.sleep(self.server.next_latency())
+        self._send_html(200 if route != "not_found" else 404, body)
+
+    def do_POST(self):
+        # Formular-Submits (z. B. Login) landen im Feed
+        self.server.record("post")
+        time.sleep(self.server.next_latency())
+        self.send_response(303)
+        self.send_header("Location", "/feed/")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+class FakeLinkedInSite(ThreadingHTTPServer):
+    """HTTP-Stand-in für linkedin.com in einem Hintergrund-Thread."""
+    daemon_threads = True
+
+    def __init__(self, config: Optional[FakeLinkedInConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        super().__init__((host, port), _Handler)
+        self.config = config or FakeLinkedInConfig()
+        self.fixtures = _load_fixtures()
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.hits: Counter = Counter()
+
+    @property
+    def base_url(self) -> str:
+        """Wert für LINKEDIN_BASE_URL."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def next_latency(self) -> float:
+        with self._lock:
+            return self.config.latency.sample(self._rng)
+
+    def record(self, route: str):
+        with self._lock:
+            self.hits[route] += 1
+
+    def render(self, path: str, query: Dict[str, list]):
+        """Ordnet einen Pfad einer Fixture zu und rendert sie."""
+        if path == "/login/":
+            return "login", self.fixtures["login"].substitute()
+        if path == "/feed/":
+            return "feed", self.fixtures["feed"].substitute(updates=self._feed_updates())
+        if path == "/search/results/people/":
+            keywords = " ".join(query.get("keywords", [""]))
+            return "search", self._search_page(keywords)
+        if path == "/mynetwork/invitation-manager/sent/":
+            return "sent_invitations", self._network_page("Gesendete Einladungen", "invitation-card__link", "sent")
+        if path == "/mynetwork/invite-connect/connections/":
+            return "connections", self._network_page("Kontakte", "mn-connection-card__link", "connection")
+        if path == "/post/new/":
+            return "post_new", self.fixtures["post_new"].substitute()
+        if path.startswith("/in/"):
+            slug = path.split("/")[2]
+            person = _person(slug)
+            return "profile", self.fixtures["profile"].substitute(
+                name=escape(person["name"]),
+                title=escape(person["title"]),
+                location=escape(person["location"])
+            )
+        if path.startswith("/feed/update/"):
+            return "post", self._post_page(path.split("/")[3])
+        return "not_found", "<html><body>Seite nicht gefunden</body></html>"
+
+    def _search_page(self, keywords: str) -> str:
+        results = []
+        for index in range(self.config.results_per_page):
+            person = _person(f"{keywords}:{index}")
+            results.append(self.fixtures["search_result"].substitute(
+                profile_url=f"{self.base_url}/in/{person['slug']}/",
+                name=escape(person["name"]),
+                title=escape(person["title"]),
+                company=escape(person["company"]),
+                location=escape(person["location"]),
+                degree=person["degree"]
+            ))
+        return self.fixtures["search_people"].substitute(keywords=escape(keywords), results="\n".join(results))
+
+    def _network_page(self, title: str, link_class: str, key: str) -> str:
+        cards = []
+        for index in range(self.config.results_per_page):
+            person = _person(f"{key}:{index}")
+            cards.append(
+                f'<li><a class="{link_class}" href="{self.base_url}/in/{person["slug"]}/">{escape(person["name"])}</a></li>'
+            )
+        return self.fixtures["network"].substitute(title=escape(title), cards="\n".join(cards))
+
+    def _post_page(self, post_id: str) -> str:
+        rng = random.Random(post_id)
+        person = _person(post_id)
+        return self.fixtures["post"].substitute(
+            post_id=escape(post_id),
+            name=escape(person["name"]),
+            content=escape(f"{person['title']} bei {person['company']} teilt Erfahrungen zu Teamführung und KI."),
+            likes=rng.randint(0, 500),
+            comments=rng.randint(0, 50),
+            shares=rng.randint(0, 20)
+        )
+
+    def _feed_updates(self) -> str:
+        return "\n".join(
+            f'<a class="feed-shared-update-v2__link" href="/feed/update/urn:li:activity:{7000 + i}/">Beitrag {i}</a>'
+            for i in range(self.config.feed_updates)
+        )
+
+    def start(self) -> "FakeLinkedInSite":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="LinkedIn-Attrappe mit HTML-Fixtures")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency", default="fixed:0", help="z. B. fixed:0.1, uniform:0.05,0.2")
+    parser.add_argument("--results-per-page", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    config = FakeLinkedInConfig(
+        latency=LatencyDistribution.parse(args.latency),
+        results_per_page=args.results_per_page,
+        seed=args.seed
+    )
+    site = FakeLinkedInSite(config, args.host, args.port)
+    print(f"Fake-LinkedIn läuft auf {site.base_url}")
+    try:
+        site.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        site.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+"""Lokaler, OpenAI-kompatibler Stand-in-Server für Offline-Lasttests.
+
+Bedient ``POST /v1/chat/completions`` (inkl. ``n`` und ``stream``) mit
+deterministisch erzeugten Antworten. Latenzverteilung, Fehlerrate und
+429-Injektion sind konfigurierbar; mit festem ``seed`` sind Läufe
+reproduzierbar.
+
+Start als eigenständiger Prozess:
+    python -m benchmarks.fakes.openai_server --port 8089 --latency lognormal:0.2,0.4 --rate-limit-rate 0.05
+"""
+from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+import uuid
+
+
+@dataclass
+class LatencyDistribution:
+    """Antwortlatenz in Sekunden: fixed, uniform, normal oder lognormal."""
+    kind: str = "fixed"
+    a: float = 0.0
+    b: float = 0.0
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyDistribution":
+        """Liest eine Angabe wie 'uniform:0.1,0.5' oder 'fixed:0.2'."""
+        kind, _, params = spec.partition(":")
+        values = [float(v) for v in params.split(",") if v] if params else []
+        return cls(kind, *values)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            value = self.a
+        elif self.kind == "uniform":
+            value = rng.uniform(self.a, self.b)
+        elif self.kind == "normal":
+            value = rng.gauss(self.a, self.b)
+        elif self.kind == "lognormal":
+            # a = Median in Sekunden, b = Sigma
+            value = self.a * rng.lognormvariate(0.0, self.b)
+        else:
+            raise ValueError(f"Unbekannte Latenzverteilung: {self.kind}")
+        return max(0.0, value)
+
+
+@dataclass
+class FakeOpenAIConfig:
+    """Verhalten des Stand-in-Servers."""
+    latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    error_rate: float = 0.0  # Anteil Requests mit HTTP 500
+    rate_limit_rate: float = 0.0  # Anteil Requests mit HTTP 429
+    retry_after: float = 1.0  # Retry-After-Header bei 429 (Sekunden)
+    stream_chunk_delay: float = 0.0  # Pause zwischen Streaming-Chunks
+    seed: Optional[int] = 0
+    reply_words: int = 40  # Länge der generierten Antworten
+
+
+def _count_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def _reply_text(prompt: str, index: int, words: int) -> str:
+    """Deterministischer Antworttext, abhängig von Prompt und Choice-Index."""
+    digest = hashlib.sha1(f"{index}:{prompt}".encode("utf-8")).hexdigest()
+    vocabulary = prompt.split() or ["LinkedIn"]
+    rng = random.Random(digest)
+    text = " ".join(rng.choice(vocabulary) for _ in range(words))
+    return f"{text} ({digest[:8]})?"
+
+
+def _batch_reply(prompt: str, n: int, words: int) -> str:
+    """Antwort im JSON-Format des comment_batch-Prompts."""
+    comments = []
+    for line in prompt.splitlines():
+        line = line.strip()
+        if not line.startswith("{\"id\""):
+            continue
+        try:
+            post = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        comments.append({
+            "id": post["id"],
+            "variants": [_reply_text(post.get("content", ""), i, words) for i in range(n)]
+        })
+    return json.dumps({"comments": comments}, ensure_ascii=False)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "FakeOpenAIServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        # Kein Request-Logging auf stderr
+        pass
+
+    def _send_json(self, status: int, payload: dict, headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.rstrip("/").endswith("/models"):
+            self._send_json(200, {
+                "object": "list",
+                "data": [{"id": "gpt-4", "object": "model"}, {"id": "gpt-3.5-turbo", "object": "model"}]
+            })
+        else:
+            self._send_json(404, {"error": {"message": "Not found", "type": "invalid_request_error"}})
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": "Not found", "type": "invalid_request_error"}})
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        request = json.loads(self.rfile.read(length) or b"{}")
+        outcome, latency = self.server.draw()
+        self.server.record(request, outcome, latency)
+        time.sleep(latency)
+
+        if outcome == "rate_limited":
+            self._send_json(
+                429,
+                {"error": {"message": "Rate limit reached", "type": "requests", "code": "rate_limit_exceeded"}},
+                headers={"Retry-After": str(self.server.config.retry_after)}
+            )
+            return
+        if outcome == "error":
+            self._send_json(500, {"error": {"message": "Internal server error", "type": "server_error"}})
+            return
+
+        messages = request.get("messages") or []
+        prompt = "\n".join(str(m.get("content", "")) for m in messages)
+        n = int(request.get("n") or 1)
+        model = request.get("model", "gpt-4")
+        words = self.server.config.reply_words
+
+        if "Antworte ausschließlich mit JSON" in prompt:
+            contents = [_batch_reply(prompt, self._batch_variants(prompt), words)] * n
+        else:
+            contents = [_reply_text(prompt, i, words) for i in range(n)]
+
+        if request.get("stream"):
+            self._stream(model, contents)
+            return
+
+        prompt_tokens = _count_tokens(prompt)
+        completion_tokens = sum(_count_tokens(c) for c in contents)
+        self._send_json(200, {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [
+                {"index": i, "message": {"role": "assistant", "content": c}, "finish_reason": "stop"}
+                for i, c in enumerate(contents)
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        })
+
+    @staticmethod
+    def _batch_variants(prompt: str) -> int:
+        # "Erstelle für jeden der folgenden LinkedIn-Posts 3 unterschiedliche ..."
+        for token in prompt.split():
+            if token.isdigit():
+                return int(token)
+        return 1
+
+    def _stream(self, model: str, contents: List[str]):
+        """Antwort als Server-Sent Events im Chat-Completion-Chunk-Format."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+
+        def chunk(index: int, delta: dict, finish_reason=None):
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": index, "delta": delta, "finish_reason": finish_reason}]
+            }
+            self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+        for index, content in enumerate(contents):
+            chunk(index, {"role": "assistant"})
+            for word in content.split(" "):
+                chunk(index, {"content": word + " "})
+                if self.server.config.stream_chunk_delay:
+                    time.sleep(self.server.config.stream_chunk_delay)
+            chunk(index, {}, "stop")
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+
+class FakeOpenAIServer(ThreadingHTTPServer):
+    """OpenAI-kompatibler HTTP-Server in einem Hintergrund-Thread."""
+    daemon_threads = True
+
+    def __init__(self, config: Optional[FakeOpenAIConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        super().__init__((host, port), _Handler)
+        self.config = config or FakeOpenAIConfig()
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.requests: List[dict] = []
+
+    @property
+    def url(self) -> str:
+        """Basis-URL für OPENAI_API_URL bzw. openai.api_base."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def draw(self):
+        """Bestimmt Ausgang und Latenz des nächsten Requests (thread-sicher, reproduzierbar)."""
+        with self._lock:
+            latency = self.config.latency.sample(self._rng)
+            roll = self._rng.random()
+        if roll < self.config.rate_limit_rate:
+            return "rate_limited", latency
+        if roll < self.config.rate_limit_rate + self.config.error_rate:
+            return "error", latency
+        return "ok", latency
+
+    def record(self, request: dict, outcome: str, latency: float):
+        with self._lock:
+            self.requests.append({
+                "model": request.get("model"),
+                "n": request.get("n", 1),
+                "stream": bool(request.get("stream")),
+                "outcome": outcome,
+                "latency": latency
+            })
+
+    def start(self) -> "FakeOpenAIServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="OpenAI-kompatibler Stand-in-Server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", default="fixed:0", help="z. B. fixed:0.2, uniform:0.1,0.5, lognormal:0.3,0.5")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--stream-chunk-delay", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    config = FakeOpenAIConfig(
+        latency=LatencyDistribution.parse(args.latency),
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        stream_chunk_delay=args.stream_chunk_delay,
+        seed=args.seed
+    )
+    server = FakeOpenAIServer(config, args.host, args.port)
+    print(f"Fake-OpenAI läuft auf {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
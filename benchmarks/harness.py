@@ -0,0 +1,149 @@
+"""Messwerkzeuge für die Benchmark-Suite: Latenzen, DB-Round-Trips, Peak-RSS."""
+from typing import Dict, List, Optional
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+import json
+import platform
+import resource
+import subprocess
+import sys
+import time
+
+from sqlalchemy import event
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Perzentil (0-100) mit linearer Interpolation über eine sortierte Liste."""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def peak_rss_mb() -> float:
+    """Maximaler Resident Set Size des Prozesses in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux liefert KB, macOS Bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class StatementCounter:
+    """Zählt SQL-Statements (DB-Round-Trips) und INSERTs pro Tabelle an einer Engine."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = 0
+        self.inserts: Dict[str, int] = defaultdict(int)
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements += 1
+        if statement.lstrip().upper().startswith("INSERT INTO"):
+            table = statement.split()[2].strip('"')
+            self.inserts[table] += 1
+
+    def total_inserts(self) -> int:
+        return sum(self.inserts.values())
+
+    def close(self):
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+
+class ActionRecorder:
+    """Sammelt Latenz, Erfolg und DB-Round-Trips pro Aktion."""
+
+    def __init__(self, counter: Optional[StatementCounter] = None):
+        self.counter = counter
+        self.samples: Dict[str, List[dict]] = defaultdict(list)
+        self.started = time.perf_counter()
+
+    @contextmanager
+    def measure(self, action: str):
+        """Misst einen Aktionsaufruf; Erfolg = mindestens ein INSERT während der Aktion."""
+        statements = self.counter.statements if self.counter else 0
+        inserts = self.counter.total_inserts() if self.counter else 0
+        sample = {"success": None}
+        start = time.perf_counter()
+        try:
+            yield sample
+        finally:
+            sample["latency"] = time.perf_counter() - start
+            if self.counter:
+                sample["db_roundtrips"] = self.counter.statements - statements
+                if sample["success"] is None:
+                    sample["success"] = self.counter.total_inserts() > inserts
+            self.samples[action].append(sample)
+
+    def summary(self, throughput_actions: Optional[List[str]] = None) -> dict:
+        """Fasst die Messwerte zusammen (Perzentile in Millisekunden)."""
+        elapsed = time.perf_counter() - self.started
+        actions = {}
+        for action, samples in self.samples.items():
+            latencies = sorted(s["latency"] for s in samples)
+            roundtrips = [s.get("db_roundtrips", 0) for s in samples]
+            actions[action] = {
+                "count": len(samples),
+                "successes": sum(1 for s in samples if s["success"]),
+                "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+                "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+                "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+                "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3),
+                "db_roundtrips_per_action": round(sum(roundtrips) / len(roundtrips), 2)
+            }
+
+        completed = sum(
+            actions[a]["successes"] for a in (throughput_actions or actions.keys()) if a in actions
+        )
+        return {
+            "elapsed_s": round(elapsed, 3),
+            "interactions_per_minute": round(completed / elapsed * 60, 2) if elapsed else 0.0,
+            "peak_rss_mb": round(peak_rss_mb(), 1),
+            "actions": actions
+        }
+
+
+def write_results(path: str, results: dict, config: dict):
+    """Schreibt die Ergebnisse samt Metadaten als JSON (vergleichbar über Commits)."""
+    payload = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.utcnow().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "config": config
+        },
+        **results
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, ensure_ascii=False)
+
+
+def compare(baseline: dict, current: dict) -> List[str]:
+    """Vergleicht zwei Ergebnisdateien und liefert lesbare Abweichungen."""
+    lines = []
+    for suite, result in current.get("suites", {}).items():
+        base_suite = baseline.get("suites", {}).get(suite)
+        if not base_suite:
+            continue
+        before, after = base_suite["interactions_per_minute"], result["interactions_per_minute"]
+        if before:
+            lines.append(f"{suite}: Interaktionen/min {before} -> {after} ({(after - before) / before:+.1%})")
+        for action, stats in result["actions"].items():
+            base_stats = base_suite["actions"].get(action)
+            if not base_stats:
+                continue
+            for key in ("p50_ms", "p95_ms", "p99_ms", "db_roundtrips_per_action"):
+                if base_stats[key]:
+                    change = (stats[key] - base_stats[key]) / base_stats[key]
+                    lines.append(f"{suite}.{action}.{key}: {base_stats[key]} -> {stats[key]} ({change:+.1%})")
+    return lines
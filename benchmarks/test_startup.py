@@ -0,0 +1,109 @@
+"""Import-Zeit-Budget für API-Router und CLI-Tools.
+
+Importiert jedes Modul in einem frischen Interpreter ohne LinkedIn-/Postgres-Umgebung,
+misst die Zeit und prüft, dass keine schweren Abhängigkeiten (Browser, OpenAI, pandas)
+mitgeladen werden und noch keine Datenbank-Engine angelegt wird. Läuft als pytest-Test
+(Budget über ``IMPORT_BUDGET_SECONDS``) oder als Skript mit Exit-Code 1 bei Überschreitung:
+
+    python -m pytest benchmarks/test_startup.py
+    python -m benchmarks.test_startup --budget 1.0
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+MODULES = (
+    "app.core.config",
+    "app.db.session",
+    "app.api.api_v1.endpoints.posts",
+    "app.api.api_v1.endpoints.target_contacts",
+    "app.api.api_v1.endpoints.interactions",
+    "app.api.api_v1.endpoints.scheduler",
+    "app.api.api_v1.endpoints.metrics",
+    "app.api.api_v1.endpoints.stats",
+    "app.cli.contacts",
+    "app.cli.stats",
+    "app.cli.scheduler",
+)
+
+HEAVY_MODULES = ("selenium", "playwright", "openai", "pandas")
+
+DEFAULT_BUDGET = float(os.environ.get("IMPORT_BUDGET_SECONDS", "1.0"))
+
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = sorted(m for m in {heavy!r} if m in sys.modules)
+session = sys.modules.get("app.db.session")
+engine = bool(session and session.get_engine.cache_info().currsize)
+print(json.dumps({{"seconds": elapsed, "heavy": heavy, "engine": engine}}))
+"""
+
+
+def clean_env() -> dict:
+    """Umgebung ohne Zugangsdaten, wie bei einem frischen CLI-Aufruf."""
+    env = {
+        key: value for key, value in os.environ.items()
+        if not key.startswith(("LINKEDIN_", "POSTGRES_", "OPENAI_"))
+    }
+    env.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite://")
+    return env
+
+
+def measure(module: str, env: dict) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD.format(module=module, heavy=HEAVY_MODULES)],
+        capture_output=True, text=True, env=env
+    )
+    if result.returncode != 0:
+        return {"error": result.stderr.strip().splitlines()[-1] if result.stderr else "unbekannt"}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def problems(result: dict, budget: float) -> list:
+    found = []
+    if result["seconds"] > budget:
+        found.append(f"> {budget:.2f}s")
+    if result["heavy"]:
+        found.append(f"lädt {', '.join(result['heavy'])}")
+    if result.get("engine"):
+        found.append("legt die DB-Engine beim Import an")
+    return found
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_import_budget(module):
+    result = measure(module, clean_env())
+    assert "error" not in result, result.get("error")
+    assert not problems(result, DEFAULT_BUDGET), f"{module}: {result}"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Import-Zeit-Budget prüfen")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET, help="Sekunden pro Modul")
+    parser.add_argument("--modules", help="Kommagetrennte Modulliste (Standard: API-Router und CLI)")
+    args = parser.parse_args(argv)
+
+    modules = args.modules.split(",") if args.modules else MODULES
+    env = clean_env()
+    failed = False
+    for module in modules:
+        result = measure(module, env)
+        if "error" in result:
+            failed = True
+            print(f"FEHLER  {module}: {result['error']}")
+            continue
+        found = problems(result, args.budget)
+        failed = failed or bool(found)
+        print(f"{'FEHLER' if found else 'OK':7} {module}: {result['seconds']:.3f}s {' '.join(found)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,13 @@
 import streamlit as st
-import pandas as pd
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import json
 import requests
-from typing import Dict, List, Optional
+from requests.adapters import HTTPAdapter
+from typing import Callable, Dict, List, Optional
 import os
+import threading
 
 # Konfiguration
 st.set_page_config(
@@ -21,13 +24,63 @@ if 'token' not in st.session_state:
 
 # API URL
 API_URL = os.getenv("API_URL", "http://localhost:8000/api/v1")
+CACHE_TTL = int(os.getenv("DASHBOARD_CACHE_TTL", "30"))  # Sekunden
+REQUEST_TIMEOUT = 10  # Sekunden
+RECENT_LIMIT = 5  # Einträge pro Dashboard-Liste
+# Nur die angezeigten Felder anfordern (serverseitige Projektion)
+POST_FIELDS = "id,title,status,content,hashtags,scheduled_for"
+INTERACTION_FIELDS = "id,type,status,target_name,target_title,content"
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """Eine Session pro Prozess: Verbindungen (TCP/TLS) werden über Reruns wiederverwendet."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def fetch_json(path: str, token: str, params: tuple = ()) -> List[Dict]:
+    """GET gegen die API; Ergebnis pro Token, Pfad und Parametern kurz zwischengespeichert.
+
+    Fehler werden als Exception weitergegeben und damit nicht gecacht.
+    """
+    response = get_http_session().get(
+        f"{API_URL}{path}",
+        headers={"Authorization": f"Bearer {token}"},
+        params=dict(params),
+        timeout=REQUEST_TIMEOUT
+    )
+    response.raise_for_status()
+    return response.json()
+
+def fetch_parallel(calls: Dict[str, Callable[[], object]]) -> Dict[str, object]:
+    """Lädt unabhängige Panels gleichzeitig; die Threads erhalten den Streamlit-Kontext."""
+    ctx = get_script_run_ctx()
+
+    def run(fn):
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return fn()
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+        futures = {name: pool.submit(run, fn) for name, fn in calls.items()}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                st.error(f"Fehler beim Abrufen ({name}): {str(e)}")
+                results[name] = []
+    return results
 
 def login(email: str, password: str) -> bool:
     """Benutzeranmeldung"""
     try:
-        response = requests.post(
+        response = get_http_session().post(
             f"{API_URL}/auth/login",
-            json={"email": email, "password": password}
+            json={"email": email, "password": password},
+            timeout=REQUEST_TIMEOUT
         )
         if response.ok:
             data = response.json()
@@ -41,36 +94,30 @@ def login(email: str, password: str) -> bool:
 
 def logout():
     """Benutzerabmeldung"""
+    fetch_json.clear()
     st.session_state.authenticated = False
     st.session_state.token = None
 
-def get_posts() -> List[Dict]:
-    """Posts vom Backend abrufen"""
-    try:
-        response = requests.get(
-            f"{API_URL}/posts",
-            headers={"Authorization": f"Bearer {st.session_state.token}"}
-        )
-        if response.ok:
-            return response.json()
-        return []
-    except Exception as e:
-        st.error(f"Fehler beim Abrufen der Posts: {str(e)}")
-        return []
+def get_posts(limit: int = RECENT_LIMIT) -> List[Dict]:
+    """Neueste Posts vom Backend abrufen (Limit wird serverseitig angewendet)"""
+    return fetch_json("/posts/", st.session_state.token, (("limit", limit), ("fields", POST_FIELDS)))
 
-def get_interactions() -> List[Dict]:
-    """Interaktionen vom Backend abrufen"""
-    try:
-        response = requests.get(
-            f"{API_URL}/interactions",
-            headers={"Authorization": f"Bearer {st.session_state.token}"}
-        )
-        if response.ok:
-            return response.json()
-        return []
-    except Exception as e:
-        st.error(f"Fehler beim Abrufen der Interaktionen: {str(e)}")
-        return []
+def get_interactions(limit: int = RECENT_LIMIT) -> List[Dict]:
+    """Neueste Interaktionen vom Backend abrufen (Limit wird serverseitig angewendet)"""
+    return fetch_json("/interactions/", st.session_state.token, (("limit", limit), ("fields", INTERACTION_FIELDS)))
+
+def get_summary() -> Dict:
+    """Dashboard-Zähler; bei unverändertem ETag liefert die API 304 und der letzte Stand bleibt."""
+    cached = st.session_state.get("summary")
+    headers = {"Authorization": f"Bearer {st.session_state.token}"}
+    if cached:
+        headers["If-None-Match"] = cached["etag"]
+    response = get_http_session().get(f"{API_URL}/stats/summary", headers=headers, timeout=REQUEST_TIMEOUT)
+    if response.status_code == 304 and cached:
+        return cached["data"]
+    response.raise_for_status()
+    st.session_state.summary = {"etag": response.headers.get("ETag", ""), "data": response.json()}
+    return st.session_state.summary["data"]
 
 def create_post(title: str, content: str, hashtags: List[str], scheduled_for: Optional[datetime] = None):
     """Neuen Post erstellen"""
@@ -81,11 +128,15 @@ def create_post(title: str, content: str, hashtags: List[str], scheduled_for: Op
             "hashtags": hashtags,
             "scheduled_for": scheduled_for.isoformat() if scheduled_for else None
         }
-        response = requests.post(
-            f"{API_URL}/posts",
+        response = get_http_session().post(
+            f"{API_URL}/posts/",
             headers={"Authorization": f"Bearer {st.session_state.token}"},
-            json=data
+            json=data,
+            timeout=REQUEST_TIMEOUT
         )
+        if response.ok:
+            # Neuer Post soll sofort in der Liste erscheinen
+            fetch_json.clear()
         return response.ok
     except Exception as e:
         st.error(f"Fehler beim Erstellen des Posts: {str(e)}")
@@ -124,11 +175,14 @@ else:
     with tab1:
         st.header("Dashboard")
         
+        # Beide Listen sind unabhängig voneinander: gleichzeitig laden
+        panels = fetch_parallel({"posts": get_posts, "interactions": get_interactions})
+        
         # Posts
         st.subheader("Letzte Posts")
-        posts = get_posts()
+        posts = panels["posts"]
         if posts:
-            for post in posts[:5]:  # Zeige die letzten 5 Posts
+            for post in posts:
                 with st.expander(f"{post['title']} - {post['status']}"):
                     st.write(post['content'])
                     st.write(f"Hashtags: {', '.join(post['hashtags'])}")
@@ -137,9 +191,9 @@ else:
         
         # Interaktionen
         st.subheader("Letzte Interaktionen")
-        interactions = get_interactions()
+        interactions = panels["interactions"]
         if interactions:
-            for interaction in interactions[:5]:  # Zeige die letzten 5 Interaktionen
+            for interaction in interactions:
                 with st.expander(f"{interaction['type']} - {interaction['status']}"):
                     st.write(f"Ziel: {interaction['target_name']}")
                     st.write(f"Titel: {interaction['target_title']}")
@@ -174,4 +228,31 @@ else:
     # Statistiken Tab
     with tab4:
         st.header("Statistiken")
-        # TODO: Implementiere Statistiken 
\ No newline at end of file
+        try:
+            summary = get_summary()
+        except Exception as e:
+            st.error(f"Fehler beim Abrufen der Statistiken: {str(e)}")
+            summary = None
+        if summary:
+            st.subheader("Posts nach Status")
+            columns = st.columns(max(1, len(summary["posts"])))
+            for column, (post_status, count) in zip(columns, sorted(summary["posts"].items())):
+                column.metric(post_status, count)
+
+            st.subheader("Interaktionen nach Typ und Status")
+            st.table([
+                {"Typ": interaction_type, **counts}
+                for interaction_type, counts in sorted(summary["interactions"].items())
+            ])
+
+            st.subheader("Tägliche Aktivität")
+            activity = summary["daily_activity"]
+            if activity:
+                st.bar_chart(
+                    {
+                        "Datum": [day["date"] for day in activity],
+                        "Interaktionen": [day["interactions"] for day in activity],
+                        "Posts": [day["posts"] for day in activity]
+                    },
+                    x="Datum"
+                ) 
\ No newline at end of file
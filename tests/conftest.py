@@ -0,0 +1,32 @@
+import pytest
+
+from app.core.config import settings
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """Frische SQLite-Datenbank über die echte Session-Factory (inkl. Statistik-Hooks).
+
+    Auch ``run_in_session`` und ``SessionLocal`` arbeiten während des Tests auf dieser Datei.
+    """
+    from app.db.base_class import Base
+    from app.db.session import SessionLocal, get_engine, get_sessionmaker
+    from app.models.interaction import Interaction  # noqa: F401 - Mapper registrieren
+    from app.models.post import Post  # noqa: F401
+    from app.models.settings import Settings  # noqa: F401
+    from app.models.stat_counter import StatCounter  # noqa: F401
+    from app.models.target_contact import TargetContact  # noqa: F401
+    from app.models.user import User  # noqa: F401
+
+    monkeypatch.setattr(settings, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{tmp_path / 'test.db'}")
+    get_engine.cache_clear()
+    get_sessionmaker.cache_clear()
+    Base.metadata.create_all(get_engine())
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        get_engine().dispose()
+        get_engine.cache_clear()
+        get_sessionmaker.cache_clear()
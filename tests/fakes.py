@@ -0,0 +1,136 @@
+"""Attrappen für Browser-Backend und KI-Service in Unit-Tests (ohne Playwright/OpenAI)."""
+from typing import Dict, List, Optional
+
+from app.models.post import PostStatus
+from app.services.account_settings import AccountSettings
+from app.services.browser import BrowserBackend
+
+DEFAULT_ACCOUNT = {
+    "post_frequency": 3,
+    "daily_connection_limit": 10,
+    "interaction_interval": 60,
+    "auto_publish_posts": False,
+    "auto_approve_comments": False,
+    "target_industries": (),
+    "target_locations": (),
+    "target_company_sizes": (),
+    "target_positions": (),
+    "target_seniority": (),
+    "target_keywords": ("ki",),
+    "excluded_keywords": (),
+    "interaction_types": ("like",),
+    "post_topics": ("KI",),
+    "post_tones": ("locker",),
+    "post_lengths": ("short",),
+    "post_hashtags": ("#ki",),
+    "search_query": "ki",
+}
+
+
+def account(user_id: int = 1, **overrides) -> AccountSettings:
+    return AccountSettings(user_id=user_id, version=0, updated_at=None, **{**DEFAULT_ACCOUNT, **overrides})
+
+
+class FakeBackend(BrowserBackend):
+    """Liefert konfigurierte Antworten und merkt sich die ausgeführten Aktionen."""
+
+    def __init__(self):
+        self.feed: Optional[List[Dict]] = []
+        self.posts: Dict[str, Dict] = {}
+        self.profiles: Optional[List[Dict]] = []
+        self.invitations: Optional[List[str]] = []
+        self.connections: Optional[List[str]] = []
+        self.stats: Dict[str, Optional[Dict]] = {}
+        self.succeed = True
+        self.actions: List[tuple] = []
+
+    async def initialize(self, browser=None):
+        self.is_logged_in = True
+
+    async def close(self):
+        pass
+
+    async def create_post(self, post, publish: bool = True) -> bool:
+        self.actions.append(("post", post.title))
+        if self.succeed:
+            post.status = PostStatus.PUBLISHED if publish else PostStatus.DRAFT
+        else:
+            post.status = PostStatus.FAILED
+        return self.succeed
+
+    async def like_post(self, post_url: str) -> bool:
+        self.actions.append(("like", post_url))
+        return self.succeed
+
+    async def comment_on_post(self, post_url: str, comment: str) -> bool:
+        self.actions.append(("comment", post_url, comment))
+        return self.succeed
+
+    async def share_post(self, post_url: str) -> bool:
+        self.actions.append(("share", post_url))
+        return self.succeed
+
+    async def send_connection_request(self, profile_url: str, message: Optional[str] = None) -> bool:
+        self.actions.append(("connection", profile_url))
+        return self.succeed
+
+    async def send_message(self, profile_url: str, message: str) -> bool:
+        self.actions.append(("message", profile_url))
+        return self.succeed
+
+    async def follow_profile(self, profile_url: str) -> bool:
+        self.actions.append(("follow", profile_url))
+        return self.succeed
+
+    async def search_profiles(self, keywords, filters=None):
+        return self.profiles
+
+    async def get_sent_invitations(self):
+        return self.invitations
+
+    async def get_connections(self):
+        return self.connections
+
+    async def get_feed_posts(self, limit: int = 10):
+        return self.feed
+
+    async def get_post(self, post_url: str):
+        return self.posts.get(post_url)
+
+    async def get_post_stats(self, post_url: str):
+        return self.stats.get(post_url)
+
+
+class FakeAI:
+    """Antwortet ohne Modellaufruf; ``error`` lässt jede Generierung scheitern."""
+
+    def __init__(self, error: Optional[Exception] = None):
+        self.error = error
+        self.comments: Dict[str, str] = {}
+
+    def _check(self):
+        if self.error is not None:
+            raise self.error
+
+    def set_model_routes(self, model_routes):
+        pass
+
+    async def generate_post_content(self, topic, tone="", length="", hashtags=None) -> dict:
+        self._check()
+        return {"content": f"Post über {topic}", "hashtags": list(hashtags or []), "prompt_ref": "post@test"}
+
+    async def generate_comment(self, post_content, tone="", n=1, selector=None) -> str:
+        self._check()
+        return "Spannend!"
+
+    async def generate_comments_batch(self, posts, variants=1, selector=None) -> Dict[str, str]:
+        self._check()
+        return {post["id"]: self.comments[post["id"]] for post in posts if post["id"] in self.comments}
+
+    async def generate_connection_message(self, profile_info, template, n=1, selector=None) -> str:
+        self._check()
+        return template
+
+    async def generate_follow_up_message(self, profile_info, template) -> str:
+        self._check()
+        return template
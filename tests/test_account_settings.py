@@ -0,0 +1,79 @@
+from dataclasses import FrozenInstanceError
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.settings import Settings
+from app.services.account_settings import AccountSettings, SettingsStore
+
+BASE = datetime(2024, 5, 1, 12, 0)
+
+
+def _settings(db, user_id, updated_at, **values) -> Settings:
+    model = Settings(user_id=user_id, target_keywords=["ki", "saas"], target_locations=["Berlin"], **values)
+    db.add(model)
+    db.flush()
+    model.updated_at = updated_at
+    db.commit()
+    return model
+
+
+def _touch(db, model, updated_at, **values):
+    for key, value in values.items():
+        setattr(model, key, value)
+    model.updated_at = updated_at
+    db.commit()
+
+
+def _store(db) -> SettingsStore:
+    store = SettingsStore()
+    store.apply(SettingsStore.load(db))
+    return store
+
+
+def test_snapshot_is_immutable_and_precomputed(db):
+    snapshot = AccountSettings.from_model(_settings(db, 1, BASE, message_templates={"connection": ["Hallo"]}))
+    assert snapshot.search_query == "ki saas"
+    assert dict(snapshot.search_filters) == {"location": "Berlin"}
+    assert snapshot.message_templates["connection"] == ("Hallo",)
+    with pytest.raises(FrozenInstanceError):
+        snapshot.post_frequency = 5
+    with pytest.raises(TypeError):
+        snapshot.model_routes["comment"] = "gpt-4"
+
+
+def test_unchanged_settings_are_not_reloaded(db):
+    _settings(db, 1, BASE)
+    assert _store(db).fetch_changed(db) == []
+
+
+def test_change_with_older_timestamp_is_detected(db):
+    first = _settings(db, 1, BASE)
+    _settings(db, 2, BASE + timedelta(minutes=5))
+    store = _store(db)
+    # Spät committete Transaktion: Zeitstempel liegt vor dem jüngsten bereits bekannten Stand
+    _touch(db, first, BASE + timedelta(minutes=1), post_frequency=7)
+    assert [(s.user_id, s.post_frequency) for s in store.fetch_changed(db)] == [(1, 7)]
+
+
+def test_changes_with_equal_timestamps_are_all_detected(db):
+    first = _settings(db, 1, BASE)
+    second = _settings(db, 2, BASE)
+    store = _store(db)
+    _touch(db, first, BASE + timedelta(minutes=1), post_frequency=4)
+    changed = store.fetch_changed(db)
+    store.apply(changed)
+    _touch(db, second, BASE + timedelta(minutes=1), post_frequency=6)
+    assert [(s.user_id, s.post_frequency) for s in store.fetch_changed(db)] == [(2, 6)]
+
+
+def test_apply_versions_and_notifies(db):
+    _settings(db, 1, BASE)
+    store = SettingsStore()
+    calls = []
+    store.add_listener(lambda current, previous: calls.append((current.version, previous and previous.version)))
+    snapshots = SettingsStore.load(db)
+    store.apply(snapshots)
+    store.apply(snapshots)
+    assert calls == [(1, None), (2, 1)]
+    assert store.get(1).version == 2
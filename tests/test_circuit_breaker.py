@@ -0,0 +1,184 @@
+import asyncio
+
+import pytest
+
+from app.services.browser import BackendUnavailable
+from app.services.circuit_breaker import BreakerState, CircuitBreaker, CircuitBreakers, guarded
+from app.services.scheduler_service import AccountWorker
+from tests.fakes import FakeAI, FakeBackend, account
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_breaker(clock: FakeClock) -> CircuitBreaker:
+    return CircuitBreaker(1, "like", threshold=3, cooldown=10, max_cooldown=40, clock=clock)
+
+
+def fail(breaker: CircuitBreaker, times: int):
+    for _ in range(times):
+        assert breaker.allow()
+        breaker.record_failure()
+
+
+def test_opens_after_consecutive_failures():
+    breaker = make_breaker(FakeClock())
+    fail(breaker, 2)
+    assert breaker.state == BreakerState.CLOSED
+    fail(breaker, 1)
+    assert breaker.state == BreakerState.OPEN
+    assert not breaker.allow()
+
+
+def test_success_resets_failure_count():
+    breaker = make_breaker(FakeClock())
+    fail(breaker, 2)
+    breaker.record_success()
+    fail(breaker, 2)
+    assert breaker.state == BreakerState.CLOSED
+
+
+def test_half_open_allows_single_probe():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    fail(breaker, 3)
+    clock.now = 9
+    assert not breaker.allow()
+    clock.now = 10
+    assert breaker.allow()
+    assert breaker.state == BreakerState.HALF_OPEN
+    assert not breaker.allow()
+
+
+def test_successful_probe_closes():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    fail(breaker, 3)
+    clock.now = 10
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == BreakerState.CLOSED
+    assert breaker.allow()
+
+
+def test_failed_probe_reopens_with_doubled_cooldown():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    fail(breaker, 3)
+    for expected in (20, 40, 40):
+        clock.now += breaker.cooldown
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == BreakerState.OPEN
+        assert breaker.cooldown == expected
+
+
+def test_released_probe_can_be_retried():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    fail(breaker, 3)
+    clock.now = 10
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.state == BreakerState.HALF_OPEN
+    assert breaker.allow()
+
+
+def test_transitions_are_recorded():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    fail(breaker, 3)
+    clock.now = 10
+    breaker.allow()
+    breaker.record_success()
+    assert [(previous, current) for _, previous, current, _ in breaker.transitions] == [
+        ("closed", "open"), ("open", "half_open"), ("half_open", "closed")
+    ]
+
+
+class Worker:
+    user_id = 1
+
+    def __init__(self, result):
+        self.breakers = CircuitBreakers(self.user_id)
+        self.result = result
+        self.calls = 0
+
+    @guarded("like")
+    async def perform_like(self):
+        self.calls += 1
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def test_guarded_counts_false_as_failure_and_skips_when_open():
+    worker = Worker(False)
+    threshold = worker.breakers["like"].threshold
+    for _ in range(threshold + 2):
+        asyncio.run(worker.perform_like())
+    assert worker.calls == threshold
+    assert worker.breakers.states() == {"like": "open"}
+
+
+def test_guarded_counts_backend_unavailable_as_failure():
+    worker = Worker(BackendUnavailable("Feed nicht lesbar"))
+    for _ in range(worker.breakers["like"].threshold):
+        with pytest.raises(BackendUnavailable):
+            asyncio.run(worker.perform_like())
+    assert worker.breakers["like"].state == BreakerState.OPEN
+
+
+def test_guarded_releases_on_other_exceptions():
+    worker = Worker(KeyError("connection"))
+    for _ in range(worker.breakers["like"].threshold + 2):
+        with pytest.raises(KeyError):
+            asyncio.run(worker.perform_like())
+    assert worker.breakers["like"].state == BreakerState.CLOSED
+    assert worker.breakers["like"].failures == 0
+
+
+def test_guarded_none_is_neutral():
+    worker = Worker(None)
+    for _ in range(worker.breakers["like"].threshold + 2):
+        asyncio.run(worker.perform_like())
+    assert worker.breakers["like"].state == BreakerState.CLOSED
+    assert worker.breakers["like"].failures == 0
+
+
+FEED_URL = "https://www.linkedin.com/feed/update/urn:li:activity:1/"
+
+
+def _worker(ai=None, **overrides) -> AccountWorker:
+    backend = FakeBackend()
+    backend.feed = [{"url": FEED_URL}]
+    backend.posts[FEED_URL] = {"url": FEED_URL, "content": "Neues zu KI"}
+    backend.profiles = [{"url": "https://www.linkedin.com/in/a", "name": "A", "title": "CTO"}]
+    return AccountWorker(account(**overrides), backend, ai or FakeAI())
+
+
+@pytest.mark.parametrize("action, worker", [
+    ("comment", lambda: _worker(FakeAI(error=TimeoutError("KI-Timeout")))),
+    ("connection", lambda: _worker(message_templates={})),
+])
+def test_errors_outside_the_browser_do_not_open_the_breaker(db, action, worker):
+    worker = worker()
+    perform = getattr(worker, f"perform_{action}")
+    for _ in range(worker.breakers[action].threshold + 1):
+        with pytest.raises((TimeoutError, KeyError)):
+            asyncio.run(perform())
+    assert worker.breakers[action].state == BreakerState.CLOSED
+    assert worker.linkedin_service.actions == []
+
+
+def test_unreadable_feed_opens_the_breaker(db):
+    worker = _worker()
+    worker.linkedin_service.feed = None
+    for _ in range(worker.breakers["like"].threshold):
+        assert asyncio.run(worker.perform_like()) is False
+    assert worker.breakers["like"].state == BreakerState.OPEN
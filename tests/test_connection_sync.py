@@ -0,0 +1,92 @@
+import asyncio
+from datetime import timedelta
+
+from app.core.clock import utcnow
+from app.core.config import settings
+from app.models.target_contact import ContactStatus, TargetContact
+from app.services.connection_sync import ConnectionTracker
+from app.services.contact_import import upsert_contacts
+from tests.fakes import FakeBackend
+
+
+def _url(name: str) -> str:
+    return f"https://www.linkedin.com/in/{name}"
+
+
+def _profiles(*names):
+    return [{"url": _url(name) + "/?trk=x", "name": name} for name in names]
+
+
+def _contacts(db, user_id=None):
+    query = db.query(TargetContact).order_by(TargetContact.profile_url)
+    if user_id is not None:
+        query = query.filter(TargetContact.user_id == user_id)
+    return {contact.profile_url: contact for contact in query}
+
+
+def test_accounts_keep_their_own_rows(db):
+    first, second = ConnectionTracker(1, FakeBackend()), ConnectionTracker(2, FakeBackend())
+    first.record_requests(db, _profiles("a"), ["ki"])
+    second.record_requests(db, _profiles("a"), ["saas"])
+    db.expire_all()
+
+    assert db.query(TargetContact).count() == 2
+    assert _contacts(db, 1)[_url("a")].keywords == "ki"
+    assert _contacts(db, 2)[_url("a")].keywords == "saas"
+
+
+def test_unknown_includes_imported_contacts_never_requested(db):
+    upsert_contacts(db, [
+        {"profile_url": _url("imported"), "user_id": 1},
+        {"profile_url": _url("connected"), "user_id": 1, "status": ContactStatus.CONNECTED},
+    ])
+    tracker = ConnectionTracker(1, FakeBackend())
+    tracker.record_requests(db, _profiles("requested"))
+
+    unknown = tracker.unknown(db, _profiles("imported", "connected", "requested", "new"))
+    assert [profile["name"] for profile in unknown] == ["imported", "new"]
+
+    # Die Anfrage macht aus dem importierten Kontakt eine offene Anfrage desselben Datensatzes
+    tracker.record_requests(db, unknown)
+    db.expire_all()
+    contacts = _contacts(db, 1)
+    assert len(contacts) == 4
+    assert contacts[_url("imported")].last_contact_attempt is not None
+
+
+def test_sync_marks_connected_and_rejected(db):
+    backend = FakeBackend()
+    tracker = ConnectionTracker(1, backend)
+    tracker.record_requests(db, _profiles("accepted", "rejected", "open", "fresh"))
+    old = (utcnow() - timedelta(hours=settings.CONNECTION_REJECT_AFTER_HOURS + 1)).isoformat()
+    db.query(TargetContact).filter(TargetContact.profile_url != _url("fresh")).update(
+        {"last_contact_attempt": old}, synchronize_session=False
+    )
+    db.commit()
+
+    backend.connections = [_url("accepted") + "/"]
+    backend.invitations = [_url("open")]
+    accepted = asyncio.run(tracker.sync())
+
+    assert [profile["name"] for profile in accepted] == ["accepted"]
+    db.expire_all()
+    statuses = {url: contact.status for url, contact in _contacts(db, 1).items()}
+    assert statuses == {
+        _url("accepted"): ContactStatus.CONNECTED,
+        _url("fresh"): ContactStatus.PENDING,
+        _url("open"): ContactStatus.PENDING,
+        _url("rejected"): ContactStatus.REJECTED,
+    }
+
+
+def test_sync_without_invitation_list_never_rejects(db):
+    backend = FakeBackend()
+    tracker = ConnectionTracker(1, backend)
+    tracker.record_requests(db, _profiles("a"))
+    db.query(TargetContact).update({"last_contact_attempt": (utcnow() - timedelta(days=30)).isoformat()})
+    db.commit()
+
+    backend.invitations = None
+    assert asyncio.run(tracker.sync()) == []
+    db.expire_all()
+    assert db.query(TargetContact).one().status == ContactStatus.PENDING
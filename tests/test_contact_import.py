@@ -0,0 +1,78 @@
+import io
+import json
+
+import pytest
+
+from app.models.target_contact import ContactStatus, TargetContact
+from app.services import contact_import
+from app.services.contact_import import detect_format, import_contacts, iter_export, normalize_profile_url
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://www.linkedin.com/in/jane-doe/", "https://www.linkedin.com/in/jane-doe"),
+    ("de.linkedin.com/in/Jane-Doe?trk=abc#top", "https://www.linkedin.com/in/jane-doe"),
+    ("  http://LinkedIn.com/in/j%C3%BCrgen  ", "https://www.linkedin.com/in/jürgen"),
+    ("", None),
+    ("   ", None),
+    (None, None),
+])
+def test_normalize_profile_url(url, expected):
+    assert normalize_profile_url(url) == expected
+
+
+def test_detect_format():
+    assert detect_format("contacts.CSV") == "csv"
+    assert detect_format("contacts.ndjson") == "jsonl"
+    assert detect_format("contacts.txt", "JSONL") == "jsonl"
+    with pytest.raises(ValueError):
+        detect_format("contacts.xlsx")
+
+
+def _jsonl(*lines) -> io.StringIO:
+    return io.StringIO("\n".join(line if isinstance(line, str) else json.dumps(line) for line in lines))
+
+
+def test_invalid_and_non_object_lines_are_skipped(db):
+    stream = _jsonl(
+        {"profile_url": "linkedin.com/in/a", "name": "A"},
+        "{kein json",
+        [1, 2],
+        '"x"',
+        "3",
+        {"name": "ohne URL"},
+        {"url": "linkedin.com/in/b"},
+    )
+    result = import_contacts(db, stream, "jsonl", user_id=None, chunk_size=2)
+    assert result == {"processed": 7, "upserted": 2, "skipped": 5}
+    assert db.query(TargetContact).count() == 2
+
+
+def test_duplicates_in_batch_merge_non_empty_fields(db):
+    stream = _jsonl(
+        {"profile_url": "linkedin.com/in/a", "title": "CTO", "company": ""},
+        {"profile_url": "https://www.linkedin.com/in/A/", "title": "", "company": "ACME", "keywords": ["ki", "saas"]},
+    )
+    assert import_contacts(db, stream, "jsonl")["upserted"] == 1
+    contact = db.query(TargetContact).one()
+    assert (contact.title, contact.company, contact.keywords) == ("CTO", "ACME", "ki,saas")
+
+
+def test_reimport_keeps_existing_values_and_status(db):
+    import_contacts(db, _jsonl({"profile_url": "linkedin.com/in/a", "name": "A", "title": "CTO"}), "jsonl")
+    db.query(TargetContact).update({"status": ContactStatus.CONNECTED})
+    db.commit()
+
+    csv_stream = io.StringIO("profile_url,name,title\nhttps://www.linkedin.com/in/a,A. Neu,\n")
+    import_contacts(db, csv_stream, "csv")
+    db.expire_all()
+    contact = db.query(TargetContact).one()
+    assert (contact.name, contact.title, contact.status) == ("A. Neu", "CTO", ContactStatus.CONNECTED)
+
+
+def test_export_roundtrip(db):
+    import_contacts(db, _jsonl(*({"profile_url": f"linkedin.com/in/p{i}", "name": f"P{i}"} for i in range(5))), "jsonl")
+    lines = "".join(iter_export(db, "jsonl", chunk_size=2)).splitlines()
+    rows = [json.loads(line) for line in lines]
+    assert [row["name"] for row in rows] == [f"P{i}" for i in range(5)]
+    assert rows[0]["status"] == ContactStatus.PENDING.value
+    assert set(rows[0]) == set(contact_import.EXPORT_FIELDS)
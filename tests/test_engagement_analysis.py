@@ -0,0 +1,61 @@
+import asyncio
+import json
+from datetime import timedelta
+
+from app.core.clock import utcnow
+from app.core.config import settings
+from app.models.post import Post, PostStatus
+from app.services.engagement_analysis import EngagementAnalyzer, metrics_moved
+
+
+class AnalysisAI:
+    """Zählt die analysierten Posts statt ein Modell aufzurufen."""
+
+    def __init__(self):
+        self.batches = []
+
+    async def analyze_posts_engagement(self, posts):
+        self.batches.append([post["id"] for post in posts])
+        return {str(post["id"]): {"analysis": f"Analyse {post['id']}"} for post in posts}
+
+
+def _post(db, content, metrics) -> Post:
+    post = Post(
+        title="T", content=content, status=PostStatus.PUBLISHED, user_id=1,
+        published_at=utcnow() - timedelta(days=2), engagement_metrics=json.dumps(metrics)
+    )
+    db.add(post)
+    db.commit()
+    return post
+
+
+def test_metrics_moved_needs_absolute_and_relative_change(monkeypatch):
+    monkeypatch.setattr(settings, "ANALYSIS_MIN_DELTA", {"likes": 20})
+    monkeypatch.setattr(settings, "ANALYSIS_MIN_RELATIVE_CHANGE", 0.25)
+    assert not metrics_moved({"likes": 100}, {"likes": 119})
+    # Absolut genug, relativ zu wenig
+    assert not metrics_moved({"likes": 100}, {"likes": 124})
+    assert metrics_moved({"likes": 100}, {"likes": 125})
+    assert metrics_moved({}, {"likes": 20})
+
+
+def test_analysis_is_reused_until_content_or_metrics_change(db, monkeypatch):
+    monkeypatch.setattr(settings, "ANALYSIS_BATCH_SIZE", 1)
+    first = _post(db, "A", {"likes": 10})
+    second = _post(db, "B", {"likes": 10})
+    ai = AnalysisAI()
+    analyzer = EngagementAnalyzer(1, ai)
+
+    assert set(asyncio.run(analyzer.run())) == {first.id, second.id}
+    assert ai.batches == [[first.id], [second.id]]
+
+    # Unverändert: nur die gespeicherten Analysen
+    results = asyncio.run(analyzer.run())
+    assert results[first.id]["analysis"] == f"Analyse {first.id}"
+    assert len(ai.batches) == 2
+
+    first.engagement_metrics = json.dumps({"likes": 100})
+    second.content = "B, überarbeitet"
+    db.commit()
+    asyncio.run(analyzer.run())
+    assert ai.batches[2:] == [[first.id], [second.id]]
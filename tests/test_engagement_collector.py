@@ -0,0 +1,72 @@
+import asyncio
+import json
+from datetime import timedelta
+
+import pytest
+
+from app.core.clock import as_utc, utcnow
+from app.core.config import settings
+from app.models.post import Post, PostStatus
+from app.services.engagement_collector import EngagementCollector, poll_interval, retry_interval
+from app.services.linkedin_service import post_id_from_url
+from tests.fakes import FakeBackend
+
+URN = "urn:li:activity:7123"
+
+
+@pytest.mark.parametrize("url, expected", [
+    (f"https://www.linkedin.com/feed/update/{URN}/", URN),
+    ("https://www.linkedin.com/feed/update/urn%3Ali%3Aactivity%3A7123/", URN),
+    ("https://www.linkedin.com/posts/max-muster_ki-saas-activity-7123-AbCd/", URN),
+    ("https://www.linkedin.com/feed/", None),
+    (None, None),
+])
+def test_post_id_from_url(url, expected):
+    assert post_id_from_url(url) == expected
+
+
+def test_poll_interval_grows_and_ends():
+    assert poll_interval(timedelta(hours=1), 0) == timedelta(minutes=30)
+    assert poll_interval(timedelta(hours=1), 2) == timedelta(minutes=120)
+    assert poll_interval(timedelta(days=60), 0) is None
+    assert poll_interval(timedelta(hours=1), settings.ENGAGEMENT_MAX_UNCHANGED) is None
+
+
+def test_retry_interval_outlives_the_schedule():
+    longest = timedelta(minutes=max(settings.ENGAGEMENT_POLL_SCHEDULE.items())[1])
+    assert retry_interval(timedelta(days=60), 1) == longest * 2
+    assert retry_interval(timedelta(days=60), settings.ENGAGEMENT_MAX_UNCHANGED) is None
+
+
+def _published(db, age: timedelta, metrics=None) -> Post:
+    post = Post(
+        title="T", content="C", status=PostStatus.PUBLISHED, user_id=1, linkedin_post_id=URN,
+        published_at=utcnow() - age, engagement_metrics=json.dumps(metrics) if metrics else None
+    )
+    db.add(post)
+    db.commit()
+    return post
+
+
+def test_unreadable_old_post_is_retried(db):
+    post = _published(db, timedelta(days=60))
+    collector = EngagementCollector(1, FakeBackend())
+    assert asyncio.run(collector.collect()) == []
+
+    db.refresh(post)
+    assert post.metrics_unchanged_checks == 1
+    assert as_utc(post.metrics_next_check_at) > as_utc(post.metrics_checked_at)
+
+
+def test_changed_metrics_are_saved_and_reported(db):
+    post = _published(db, timedelta(hours=1), {"likes": 1})
+    backend = FakeBackend()
+    backend.stats[f"{settings.LINKEDIN_BASE_URL}/feed/update/{URN}/"] = {"likes": 4, "comments": 1}
+    [(post_id, _, metrics, delta)] = asyncio.run(EngagementCollector(1, backend).collect())
+
+    assert post_id == post.id
+    assert metrics == {"likes": 4, "comments": 1}
+    assert delta == {"likes": 3, "comments": 1, "shares": 0}
+    db.refresh(post)
+    assert json.loads(post.engagement_metrics) == metrics
+    assert post.metrics_unchanged_checks == 0
@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from app.core.metrics import ACTIONS, Registry, track_action
+
+
+def test_counter_and_histogram_render_in_text_format():
+    metrics = Registry()
+    requests = metrics.counter("requests_total", "Anfragen", ("route",))
+    latency = metrics.histogram("latency_seconds", "Latenz", buckets=(0.1, 1.0))
+    requests.labels('a"b\n').inc()
+    requests.labels(route="x").inc(2)
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(5)
+
+    text = metrics.render()
+    assert "# TYPE requests_total counter" in text
+    assert 'requests_total{route="a\\"b\\n"} 1.0' in text
+    assert 'requests_total{route="x"} 2.0' in text
+    assert 'latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{le="1.0"} 2' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in text
+    assert "latency_seconds_count 3" in text
+    assert text.endswith("\n")
+
+
+def test_labels_and_names_are_validated():
+    metrics = Registry()
+    counter = metrics.counter("c_total", "C", ("a", "b"))
+    with pytest.raises(ValueError):
+        counter.labels("nur eins")
+    with pytest.raises(ValueError):
+        metrics.counter("c_total", "doppelt")
+
+
+def test_track_action_records_result_from_return_value():
+    @track_action("test_action")
+    async def action(value):
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    before = {result: ACTIONS.labels("test_action", result).value for result in ("success", "failure", "skipped", "error")}
+    for value in (True, False, None):
+        asyncio.run(action(value))
+    with pytest.raises(RuntimeError):
+        asyncio.run(action(RuntimeError()))
+    after = {result: ACTIONS.labels("test_action", result).value for result in before}
+    assert {result: after[result] - before[result] for result in before} == {
+        "success": 1, "failure": 1, "skipped": 1, "error": 1
+    }
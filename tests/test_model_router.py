@@ -0,0 +1,64 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import model_router
+from app.services.model_router import ModelRouter, estimate_cost
+
+
+class FakeOpenAI:
+    """ChatCompletion-Attrappe: Modelle in ``slow`` laufen in einen Timeout."""
+
+    def __init__(self, slow=()):
+        self.slow = set(slow)
+        self.calls = []
+        self.ChatCompletion = self
+
+    async def acreate(self, model, messages, request_timeout, **params):
+        self.calls.append(model)
+        if model in self.slow:
+            raise TimeoutError(model)
+        usage = SimpleNamespace(prompt_tokens=1000, completion_tokens=500)
+        return SimpleNamespace(usage=usage, choices=[SimpleNamespace(message=SimpleNamespace(content=model))])
+
+
+@pytest.fixture
+def openai(monkeypatch):
+    def install(**kwargs) -> FakeOpenAI:
+        fake = FakeOpenAI(**kwargs)
+        monkeypatch.setattr(model_router, "_openai", lambda: fake)
+        return fake
+    return install
+
+
+def test_routes_by_task_with_user_overrides():
+    router = ModelRouter({"comment": "gpt-4"})
+    assert router.route("post").model == "gpt-4"
+    assert router.route("post").fallback_model == "gpt-3.5-turbo"
+    assert router.route("comment").model == "gpt-4"
+    assert ModelRouter().route("comment").model == "gpt-3.5-turbo"
+    # Schon das schnelle Modell: kein langsameres Ausweichmodell
+    assert ModelRouter().route("comment").fallback_model is None
+
+
+def test_timeout_falls_back_to_faster_model(openai):
+    fake = openai(slow={"gpt-4"})
+    response = asyncio.run(ModelRouter().acomplete("post", [{"role": "user", "content": "x"}]))
+    assert fake.calls == ["gpt-4", "gpt-3.5-turbo"]
+    assert response.choices[0].message.content == "gpt-3.5-turbo"
+    stats = model_router.route_stats()
+    assert stats["post:gpt-4"]["timeouts"] >= 1
+    assert stats["post:gpt-3.5-turbo"]["fallbacks"] >= 1
+
+
+def test_timeout_without_fallback_is_raised(openai):
+    fake = openai(slow={"gpt-3.5-turbo"})
+    with pytest.raises(TimeoutError):
+        asyncio.run(ModelRouter().acomplete("comment", [{"role": "user", "content": "x"}]))
+    assert fake.calls == ["gpt-3.5-turbo"]
+
+
+def test_estimate_cost():
+    assert estimate_cost("gpt-4", 1000, 500) == pytest.approx(0.06)
+    assert estimate_cost("unbekannt", 1000, 500) == 0.0
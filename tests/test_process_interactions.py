@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from app.models.interaction import Interaction, InteractionType
+from app.services.candidate_selection import parse_comment_batch
+from app.services.scheduler_service import AccountWorker
+from tests.fakes import FakeAI, FakeBackend, account
+
+URLS = [f"https://www.linkedin.com/feed/update/urn:li:activity:{n}/" for n in (1, 2)]
+TRUNCATED = '{"comments": [{"id": "%s", "variants": ["Spannend, danke' % URLS[0]
+
+
+class TruncatedBatchAI(FakeAI):
+    """Liefert eine abgeschnittene Batch-Antwort wie bei erreichtem ``max_tokens``."""
+
+    async def generate_comments_batch(self, posts, variants=1, selector=None):
+        return parse_comment_batch(TRUNCATED)
+
+
+def _worker(ai) -> AccountWorker:
+    backend = FakeBackend()
+    backend.feed = [{"url": url} for url in URLS]
+    backend.posts = {
+        url: {"id": f"urn:li:activity:{n}", "url": url, "content": f"Beitrag {n} über KI"}
+        for n, url in enumerate(URLS, start=1)
+    }
+    worker = AccountWorker(account(), backend, ai)
+    worker.feed_interaction_delay = (0, 0)
+    return worker
+
+
+def test_parse_comment_batch():
+    content = '```json\n{"comments": [{"id": "a", "variants": ["x", 1]}, {"id": "b", "comment": "y"}]}\n```'
+    assert parse_comment_batch(content) == {"a": ["x"], "b": ["y"]}
+    with pytest.raises(ValueError):
+        parse_comment_batch(TRUNCATED)
+
+
+def test_comments_and_likes_from_one_batch(db, monkeypatch):
+    monkeypatch.setattr("app.services.scheduler_service.random.random", lambda: 0.9)
+    ai = FakeAI()
+    ai.comments = {URLS[0]: "Guter Punkt!"}
+    worker = _worker(ai)
+
+    asyncio.run(worker.process_interactions())
+    assert worker.linkedin_service.actions == [("comment", URLS[0], "Guter Punkt!"), ("like", URLS[1])]
+
+
+def test_malformed_batch_response_still_likes(db, monkeypatch):
+    monkeypatch.setattr("app.services.scheduler_service.random.random", lambda: 0.9)
+    worker = _worker(TruncatedBatchAI())
+
+    asyncio.run(worker.process_interactions())
+    assert worker.linkedin_service.actions == [("like", url) for url in URLS]
+    assert [row.type for row in db.query(Interaction)] == [InteractionType.LIKE, InteractionType.LIKE]
+    assert worker.breakers["like"].failures == 0
@@ -0,0 +1,42 @@
+import pytest
+
+from app.services.prompts import PromptRegistry, PromptTemplate, count_tokens, normalize_whitespace, registry
+
+
+def test_normalize_whitespace():
+    assert normalize_whitespace("\n    Zeile 1  \n\n\n\n    Zeile 2\n") == "Zeile 1\n\nZeile 2"
+
+
+def test_template_renders_precompiled_parts_and_counts_tokens():
+    template = PromptTemplate(name="t", version=1, system="System", text="""
+        Thema: {topic}
+        JSON: {{"x": 1}}
+    """)
+    assert template.fields == ("topic",)
+    prompt = template.render(topic="KI")
+    assert prompt.user == 'Thema: KI\nJSON: {"x": 1}'
+    assert prompt.ref == "t@v1"
+    assert prompt.tokens == count_tokens("System") + count_tokens(prompt.user)
+    assert prompt.messages[0] == {"role": "system", "content": "System"}
+
+
+def test_format_specs_are_rejected():
+    with pytest.raises(ValueError):
+        PromptTemplate(name="t", version=1, system="", text="{value:>10}")
+
+
+def test_registry_resolves_latest_and_pinned_versions():
+    prompts = PromptRegistry()
+    prompts.register(PromptTemplate(name="post", version=1, system="", text="v1 {topic}"))
+    prompts.register(PromptTemplate(name="post", version=2, system="", text="v2 {topic}"))
+    assert prompts.render("post", topic="KI").user == "v2 KI"
+    assert prompts.render("post", version=1, topic="KI").ref == "post@v1"
+    with pytest.raises(ValueError):
+        prompts.register(PromptTemplate(name="post", version=2, system="", text=""))
+
+
+def test_builtin_templates_render_with_their_fields():
+    for template in registry:
+        prompt = template.render(**{name: "x" for name in template.fields})
+        assert not any(f"{{{name}}}" in prompt.user for name in template.fields)
+        assert prompt.tokens > 0
@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.api_v1.endpoints import posts as posts_endpoint
+from app.core.clock import as_utc, to_utc, to_local_naive, utcnow
+from app.models.post import Post, PostStatus
+from app.schemas.post import PostBulkSchedule, PostScheduleItem
+from app.services import publishing
+
+
+def _post(db, user_id, due, status=PostStatus.SCHEDULED) -> Post:
+    post = Post(title="T", content="C", status=status, scheduled_for=due, user_id=user_id)
+    db.add(post)
+    db.commit()
+    return post
+
+
+def test_clock_conversions():
+    aware = datetime(2024, 5, 1, 12, 0, tzinfo=timezone(timedelta(hours=2)))
+    assert as_utc(aware) == datetime(2024, 5, 1, 10, 0, tzinfo=timezone.utc)
+    # Naive Werte aus der DB sind UTC, naive Werte aus Requests lokale Zeit
+    assert as_utc(datetime(2024, 5, 1, 10, 0)).tzinfo is timezone.utc
+    local = datetime(2024, 5, 1, 10, 0)
+    assert to_utc(local) == local.astimezone(timezone.utc)
+    assert to_local_naive(local.astimezone(timezone.utc)) == local
+
+
+def test_validate_schedule_collects_all_errors():
+    now = utcnow()
+    items = [
+        PostScheduleItem(title="A", content="x", scheduled_for=now + timedelta(hours=1)),
+        PostScheduleItem(title=" ", content="", scheduled_for=now - timedelta(hours=1)),
+        PostScheduleItem(title="C", content="x", scheduled_for=now + timedelta(hours=1)),
+    ]
+    errors = publishing.validate_schedule(items, now=now)
+    assert [(error["index"], error["field"]) for error in errors] == [
+        (1, "title"), (1, "content"), (1, "scheduled_for"), (2, "scheduled_for")
+    ]
+
+
+def test_claim_only_due_posts_of_active_accounts(db):
+    now = utcnow()
+    due = _post(db, 1, now - timedelta(minutes=5))
+    _post(db, 1, now + timedelta(hours=1))
+    _post(db, 2, now - timedelta(minutes=5))
+    _post(db, None, now - timedelta(minutes=5))
+
+    claimed = publishing.claim_due_posts(db, [1], now, limit=10)
+    assert [post["id"] for post in claimed] == [due.id]
+    db.refresh(due)
+    assert due.status == PostStatus.PUBLISHING
+    # Bereits beansprucht: kein zweites Mal
+    assert publishing.claim_due_posts(db, [1], now, limit=10) == []
+    assert publishing.next_due(db, [1]) == now + timedelta(hours=1)
+
+
+def test_release_stale_claims_and_finish(db):
+    now = utcnow()
+    post = _post(db, 1, now - timedelta(minutes=5))
+    publishing.claim_due_posts(db, [1], now, limit=10)
+
+    # Frischer Claim bleibt, ein verwaister wird wieder eingeplant
+    assert publishing.release_stale_claims(db, utcnow() - timedelta(hours=1)) == 0
+    assert publishing.release_stale_claims(db, utcnow() + timedelta(minutes=1)) == 1
+    db.refresh(post)
+    assert post.status == PostStatus.SCHEDULED
+
+    publishing.claim_due_posts(db, [1], utcnow(), limit=10)
+    publishing.finish_publication(db, post.id, True, "urn:li:activity:1")
+    db.refresh(post)
+    assert post.status == PostStatus.PUBLISHED
+    assert post.linkedin_post_id == "urn:li:activity:1"
+    assert as_utc(post.published_at) <= utcnow()
+
+
+def test_create_scheduled_posts_notifies_listeners(db):
+    seen = []
+    publishing.add_listener(seen.append)
+    try:
+        now = utcnow()
+        items = [
+            PostScheduleItem(title="A", content="x", hashtags=["ki"], scheduled_for=now + timedelta(days=2)),
+            PostScheduleItem(title="B", content="y", scheduled_for=now + timedelta(days=1)),
+        ]
+        scheduled = publishing.create_scheduled_posts(db, 1, items)
+    finally:
+        publishing.remove_listener(seen.append)
+    assert len(scheduled) == 2
+    assert seen == [min(due for _, due in scheduled)]
+    assert {post.user_id for post in db.query(Post)} == {1}
+
+
+def _bulk(*offsets, title="A") -> PostBulkSchedule:
+    now = utcnow()
+    return PostBulkSchedule(user_id=1, posts=[
+        PostScheduleItem(title=title, content="x", scheduled_for=now + offset) for offset in offsets
+    ])
+
+
+def test_bulk_endpoint_rejects_whole_batch_with_all_errors(db):
+    with pytest.raises(HTTPException) as raised:
+        posts_endpoint.schedule_posts(_bulk(timedelta(hours=1), timedelta(hours=-1), title=" "), db)
+    assert raised.value.status_code == 422
+    assert [(error["index"], error["field"]) for error in raised.value.detail] == [
+        (0, "title"), (1, "title"), (1, "scheduled_for")
+    ]
+    assert db.query(Post).count() == 0
+
+
+def test_bulk_endpoint_limits_batch_size(db, monkeypatch):
+    monkeypatch.setattr(publishing, "MAX_BULK_POSTS", 2)
+    with pytest.raises(HTTPException) as raised:
+        posts_endpoint.schedule_posts(_bulk(*(timedelta(hours=n) for n in (1, 2, 3))), db)
+    assert raised.value.detail[0]["field"] == "posts"
+
+
+def test_bulk_endpoint_creates_all_posts(db):
+    result = posts_endpoint.schedule_posts(_bulk(timedelta(days=2), timedelta(days=1)), db)
+    assert result.created == 2
+    assert sorted(result.ids) == sorted(post.id for post in db.query(Post))
+    assert as_utc(result.first_due) == min(as_utc(post.scheduled_for) for post in db.query(Post))
+    assert {post.status for post in db.query(Post)} == {PostStatus.SCHEDULED}
@@ -0,0 +1,77 @@
+from datetime import timedelta
+
+import numpy as np
+
+from app.core.clock import utcnow
+from app.core.config import settings
+from app.models.target_contact import ContactStatus, TargetContact
+from app.services.ranking import FEATURES, CandidateRanker, degree_score, default_weights
+from tests.fakes import account
+
+
+def _contact(db, n, status, attempted_days_ago=None, **values):
+    attempted = (
+        (utcnow() - timedelta(days=attempted_days_ago)).isoformat() if attempted_days_ago is not None else None
+    )
+    db.add(TargetContact(
+        profile_url=f"https://www.linkedin.com/in/p{n}/", user_id=1, status=status,
+        last_contact_attempt=attempted, **values
+    ))
+
+
+def test_degree_score():
+    assert degree_score("2nd") == 1.0
+    assert degree_score("• 3rd+") == 0.4
+    assert degree_score("1st degree connection") == 0.0
+    assert degree_score(None) == 0.5
+
+
+def test_rank_prefers_matching_positions_and_keeps_ties_stable():
+    settings_ = account(target_positions=("CTO",), target_keywords=("saas",))
+    candidates = [
+        {"name": "A", "title": "Vertrieb", "degree": "2nd"},
+        {"name": "B", "title": "CTO", "company": "SaaS GmbH", "degree": "2nd"},
+        {"name": "C", "title": "Vertrieb", "degree": "2nd"},
+    ]
+    assert [c["name"] for c in CandidateRanker(1).rank(candidates, settings_)] == ["B", "A", "C"]
+
+
+def test_decided_contacts_only_counts_actual_requests(db):
+    _contact(db, 1, ContactStatus.CONNECTED, attempted_days_ago=3)
+    _contact(db, 2, ContactStatus.REJECTED, attempted_days_ago=3)
+    _contact(db, 3, ContactStatus.PENDING, attempted_days_ago=settings.RANKING_PENDING_DAYS + 1)
+    # Frisch angefragt, importiert ohne Anfrage, als Kontakt importiert
+    _contact(db, 4, ContactStatus.PENDING, attempted_days_ago=1)
+    _contact(db, 5, ContactStatus.PENDING)
+    _contact(db, 6, ContactStatus.CONNECTED)
+    db.commit()
+
+    statuses = sorted(row.status.value for row in CandidateRanker(1).decided_contacts(db))
+    assert statuses == ["connected", "pending", "rejected"]
+
+
+def test_fit_weights_features_with_higher_acceptance(db, monkeypatch):
+    monkeypatch.setattr(settings, "RANKING_MIN_SAMPLES", 10)
+    # CTOs nehmen zur Hälfte an, alle anderen zu 20 %
+    for n in range(20):
+        cto = n % 2 == 0
+        accepted = n % 4 == 0 if cto else n % 10 == 1
+        _contact(
+            db, n, ContactStatus.CONNECTED if accepted else ContactStatus.REJECTED,
+            attempted_days_ago=5, title="CTO" if cto else "Vertrieb", connection_degree="2nd"
+        )
+    db.commit()
+
+    ranker = CandidateRanker(1)
+    assert ranker.fit(db, account(target_positions=("CTO",))) == 20
+    position = FEATURES.index("position")
+    assert ranker.weights[position] > default_weights()[position]
+    assert np.all(ranker.weights > 0)
+
+
+def test_fit_falls_back_to_defaults_without_enough_samples(db):
+    _contact(db, 1, ContactStatus.CONNECTED, attempted_days_ago=3)
+    db.commit()
+    ranker = CandidateRanker(1)
+    assert ranker.fit(db, account()) == 1
+    np.testing.assert_array_equal(ranker.weights, default_weights())
@@ -0,0 +1,6 @@
+from app.cli.scheduler import admin_app
+
+
+def test_admin_app_serves_metrics_and_profiler_under_api_paths():
+    paths = {route.path for route in admin_app().routes}
+    assert {"/api/v1/metrics", "/api/v1/scheduler/profiler", "/api/v1/scheduler/profiler/job/{action}"} <= paths
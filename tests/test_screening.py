@@ -0,0 +1,41 @@
+from app.services.screening import CandidateScreen, compile_terms
+
+
+def test_compile_terms_matches_whole_words_case_insensitive():
+    pattern = compile_terms(["Manager", " senior manager ", "C++", "", "manager"])
+    assert pattern.search("Senior Manager Vertrieb").group(0) == "Senior Manager"
+    assert pattern.search("Teammanager") is None
+    assert pattern.search("Entwickler (C++)").group(0) == "C++"
+    assert compile_terms(["", "  "]) is None
+
+
+def test_profiles_rejects_with_reason():
+    screen = CandidateScreen(
+        excluded_keywords=["Recruiter"], target_positions=["CTO", "Head of"], target_company_sizes=["11-50"]
+    )
+    accepted, rejected = screen.profiles([
+        {"url": "a", "name": "A", "title": "CTO", "company": "ACME"},
+        {"url": "b", "name": "B", "title": "IT-Recruiter", "company": "ACME"},
+        {"url": "c", "name": "C", "title": "Vertrieb", "company": "ACME"},
+        {"url": "d", "name": "D", "title": "Head of Data", "company_size": "1000+"},
+    ])
+    assert [profile["url"] for profile in accepted] == ["a"]
+    assert [(r.candidate["url"], r.reason) for r in rejected] == [
+        ("b", "excluded_keyword:recruiter"), ("c", "position"), ("d", "company_size")
+    ]
+
+
+def test_posts_only_check_excluded_keywords():
+    screen = CandidateScreen(excluded_keywords=["Gewinnspiel"], target_positions=["CTO"])
+    accepted, rejected = screen.posts([
+        {"url": "a", "name": "Vertrieb", "content": "Neues zu KI"},
+        {"url": "b", "name": "X", "content": "Großes GEWINNSPIEL!"},
+    ])
+    assert [post["url"] for post in accepted] == ["a"]
+    assert rejected[0].reason == "excluded_keyword:gewinnspiel"
+
+
+def test_without_filters_everything_passes():
+    screen = CandidateScreen()
+    candidates = [{"url": "a", "title": "Irgendwas"}]
+    assert screen.profiles(candidates) == (candidates, [])
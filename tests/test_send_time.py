@@ -0,0 +1,95 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from app.core.clock import to_local_naive
+from app.core.config import settings
+from app.models.post import Post, PostStatus
+from app.services.scheduler_service import AccountWorker, LeadTrigger, SchedulerService, WeeklyTrigger
+from app.services.send_time import SendTimeOptimizer, engagement_score
+from tests.fakes import FakeAI, FakeBackend, account
+
+
+def test_engagement_score_accepts_json_and_dict():
+    assert engagement_score('{"likes": 2, "comments": 1, "shares": 1}') == 7.0
+    assert engagement_score({"likes": 1}) == 1.0
+    assert engagement_score(None) == 0.0
+
+
+def test_update_buckets_by_weekday_and_hour_and_replaces_old_values():
+    optimizer = SendTimeOptimizer(1)
+    monday_nine = datetime(2024, 4, 29, 9, 30)
+    optimizer.update_many([(1, monday_nine, {"likes": 4}), (2, monday_nine, {"likes": 2})])
+    assert optimizer.sums[0, 9] == 6 and optimizer.counts[0, 9] == 2
+
+    # Neuer Stand desselben Posts ersetzt den alten Beitrag
+    optimizer.update(1, monday_nine, {"likes": 10})
+    assert optimizer.sums[0, 9] == 12 and optimizer.counts[0, 9] == 2
+    assert optimizer.history_size == 2
+
+
+def test_refresh_and_collector_path_use_the_same_local_bucket(db):
+    published_at = datetime(2024, 4, 29, 7, 15, tzinfo=timezone.utc)
+    db.add(Post(
+        title="T", content="C", status=PostStatus.PUBLISHED, user_id=1,
+        published_at=published_at, engagement_metrics='{"likes": 3}'
+    ))
+    db.commit()
+
+    refreshed = SendTimeOptimizer(1)
+    assert refreshed.refresh(db) == 1
+    collected = SendTimeOptimizer(1)
+    # So liefert EngagementCollector.collect ``published_at``
+    collected.update(1, to_local_naive(published_at), {"likes": 3})
+    np.testing.assert_array_equal(refreshed.sums, collected.sums)
+    local = to_local_naive(published_at)
+    assert refreshed.counts[local.weekday(), local.hour] == 1
+
+
+def test_best_slots_need_history_and_stay_in_window(monkeypatch):
+    monkeypatch.setattr(settings, "SEND_TIME_MIN_HISTORY", 3)
+    optimizer = SendTimeOptimizer(1)
+    optimizer.update_many([(1, datetime(2024, 4, 30, 11), {"likes": 50})])
+    assert optimizer.best_slots(2) is None
+
+    optimizer.update_many([
+        (2, datetime(2024, 5, 2, 15), {"likes": 30}),
+        (3, datetime(2024, 5, 5, 3), {"likes": 1}),
+    ])
+    slots = optimizer.best_slots(2)
+    assert [(day, hour) for day, hour, _ in slots] == [(1, 11), (3, 15)]
+    assert all(settings.POST_WINDOW_START_HOUR <= hour <= settings.POST_WINDOW_END_HOUR for _, hour, _ in slots)
+
+
+def test_lead_trigger_runs_before_each_slot():
+    slot = WeeklyTrigger(1, 9, 0)  # Dienstag 9:00
+    lead = LeadTrigger(slot, timedelta(hours=24))
+    monday_eight = datetime(2024, 4, 29, 8, 0)
+    assert lead.next_after(monday_eight) == datetime(2024, 4, 29, 9, 0)
+    assert lead.next_after(datetime(2024, 4, 29, 9, 0)) == datetime(2024, 5, 6, 9, 0)
+
+
+@pytest.mark.parametrize("auto_publish", [False, True])
+def test_post_slots_without_auto_publish_become_scheduled_drafts(db, monkeypatch, auto_publish):
+    monkeypatch.setattr("app.services.scheduler_service.random_slots", lambda n: [(1, 9, 0)])
+    service = SchedulerService()
+    worker = AccountWorker(account(auto_publish_posts=auto_publish, post_frequency=1), FakeBackend(), FakeAI())
+    service.workers[worker.user_id] = worker
+
+    asyncio.run(service.schedule_posts(worker))
+    [job] = [job for job in service._jobs if job.name.startswith("post_")]
+    slot = WeeklyTrigger(1, 9, 0).next_after(datetime.now())
+    expected_run = slot if auto_publish else slot - timedelta(hours=settings.POST_DRAFT_LEAD_HOURS)
+    if expected_run <= datetime.now():
+        expected_run += timedelta(days=7)
+    assert job.next_run == expected_run
+
+    asyncio.run(job.func())
+    post = db.query(Post).one()
+    if auto_publish:
+        assert post.status == PostStatus.PUBLISHED and post.published_at is not None
+    else:
+        assert post.status == PostStatus.DRAFT and post.published_at is None
+        assert to_local_naive(post.scheduled_for) == WeeklyTrigger(1, 9, 0).next_after(datetime.now())
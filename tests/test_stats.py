@@ -0,0 +1,79 @@
+from sqlalchemy import select
+
+from app.core.clock import utcnow
+from app.models.interaction import Interaction, InteractionStatus, InteractionType
+from app.models.post import Post, PostStatus
+from app.models.stat_counter import StatCounter
+from app.services import stats
+
+
+def _counters(db):
+    rows = db.execute(
+        select(StatCounter.user_id, StatCounter.metric, StatCounter.key, StatCounter.value)
+        .where(StatCounter.metric != "revision", StatCounter.value != 0)
+    )
+    return {(user_id, metric, key): value for user_id, metric, key, value in rows}
+
+
+def _assert_matches_rebuild(db):
+    incremental = _counters(db)
+    stats.rebuild_counters(db)
+    assert incremental == _counters(db)
+
+
+def _seed(db):
+    posts = [Post(title=f"P{i}", content="C", user_id=1) for i in range(3)]
+    interactions = [
+        Interaction(type=InteractionType.LIKE, user_id=1, status=InteractionStatus.COMPLETED),
+        Interaction(type=InteractionType.COMMENT, user_id=2),
+    ]
+    db.add_all(posts + interactions)
+    db.commit()
+    return posts, interactions
+
+
+def test_inserts_match_rebuild(db):
+    _seed(db)
+    assert _counters(db)[(1, "posts", PostStatus.DRAFT.value)] == 3
+    assert _counters(db)[(1, "activity_posts", utcnow().date().isoformat())] == 3
+    _assert_matches_rebuild(db)
+
+
+def test_update_of_expired_object_moves_the_counter(db):
+    posts, interactions = _seed(db)
+    post = posts[0]
+    db.expire(post)
+    post.status = PostStatus.FAILED
+    db.expire(interactions[1])
+    interactions[1].user_id = 3
+    db.commit()
+
+    counters = _counters(db)
+    assert counters[(1, "posts", PostStatus.DRAFT.value)] == 2
+    assert counters[(1, "posts", PostStatus.FAILED.value)] == 1
+    assert (2, "interactions", "comment:pending") not in counters
+    _assert_matches_rebuild(db)
+
+
+def test_deletes_decrement_state_and_activity(db):
+    posts, interactions = _seed(db)
+    # Nach dem Commit abgelaufen: die Vorwerte müssen aus der DB kommen
+    db.delete(posts[0])
+    db.delete(interactions[0])
+    db.commit()
+
+    counters = _counters(db)
+    assert counters[(1, "activity_posts", utcnow().date().isoformat())] == 2
+    assert (1, "activity_interactions", utcnow().date().isoformat()) not in counters
+    _assert_matches_rebuild(db)
+
+
+def test_summary_omits_zero_counters(db):
+    posts, _ = _seed(db)
+    for post in posts:
+        post.status = PostStatus.PUBLISHED
+    db.commit()
+
+    summary = stats.summary(db, user_id=1)
+    assert summary["posts"] == {PostStatus.PUBLISHED.value: 3}
+    assert summary["interactions"] == {"like": {"completed": 1}}